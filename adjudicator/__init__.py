@@ -1,10 +1,14 @@
 from adjudicator import order, piece, territory
 from adjudicator.named_coast import NamedCoast
 from adjudicator.nation import Nation
+from adjudicator.batch import adjudicate_many  # noqa
+from adjudicator.map_graph import get_map_graph
 from adjudicator.base import OrderType, Phase, PieceType, Season, TerritoryType
 from adjudicator.processor import process
 from adjudicator.schema import TurnSchema
 from adjudicator.state import State
+from adjudicator.tracer import Tracer  # noqa
+from adjudicator.trusted import dump_turn, load_turn
 
 
 territory_type_dict = {
@@ -29,19 +33,66 @@ piece_type_dict = {
 }
 
 
-def process_game_state(data):
+def process_game_state(data, trusted=False, tracer=None):
+    """
+    Process a turn and return the outcome.
+
+    Args:
+        * `data` - `dict` of turn data in the format of `TurnSchema`.
+        * `[trusted]` - `bool` - when `True` the data is not validated and
+          `marshmallow` is not used to load or dump the data. Only use for
+          data which is known to be valid, e.g. data serialized from the
+          database.
+        * `[tracer]` - `Tracer` - records how the turn was resolved.
+
+    Returns:
+        * `dict` - processed turn data in the format of `TurnSchema`.
+    """
+    state = load_state(data, trusted)
+
+    # Process game state
+    process(state, tracer=tracer)
+
+    # Serialize processed game state and return
+    if trusted:
+        return dump_turn(state)
+    processed_data = TurnSchema().dump(state)
+    return processed_data
+
+
+def load_state(data, trusted=False):
+    """
+    Load a turn into a `State` without processing it.
+
+    Args:
+        * `data` - `dict` of turn data in the format of `TurnSchema`.
+        * `[trusted]` - `bool` - see `process_game_state`.
+
+    Returns:
+        * `State`
+    """
     territory_map = {}
     named_coast_map = {}
 
     # Marshall data into expected format and validate
-    validated_data = TurnSchema().load(data)
+    if trusted:
+        validated_data = load_turn(data)
+    else:
+        validated_data = TurnSchema().load(data)
 
     season = validated_data['season']
     phase = validated_data['phase']
     year = validated_data['year']
 
+    # The map's adjacency is compiled once per variant and shared between turns
+    map_graph = get_map_graph(
+        validated_data['variant'],
+        validated_data['territories'],
+        validated_data['named_coasts'],
+    )
+
     # Instantiate `State` for this turn
-    state = State(season, phase, year)
+    state = State(season, phase, year, map_graph)
 
     # Initialise territory instances and register each to state. Add to
     # territory map
@@ -87,12 +138,7 @@ def process_game_state(data):
     for nation_data in validated_data['nations']:
         Nation(state, **nation_data)
 
-    # Process game state
-    process(state)
-
-    # Serialize processed game state and return
-    processed_data = TurnSchema().dump(state)
-    return processed_data
+    return state
 
 
 def get_next_season_phase_and_year(state, season, phase, year):
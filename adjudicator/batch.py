@@ -0,0 +1,155 @@
+import os
+from collections import deque, namedtuple
+from concurrent.futures import Future, ProcessPoolExecutor, \
+    TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice
+
+
+BatchResult = namedtuple('BatchResult', ['index', 'data', 'error'])
+BatchResult.__doc__ = """
+The result of adjudicating one turn in a batch. `data` is the output of
+`process_game_state` or `None` if adjudication raised an exception, in which
+case the exception is stored in `error`.
+"""
+
+
+def adjudicate_many(
+    turns, workers=None, chunk_size=16, timeout=None, trusted=False,
+):
+    """
+    Adjudicate many turn payloads, fanning the work out over a process pool.
+
+    Results are yielded in the same order as `turns`. A turn which cannot be
+    adjudicated does not abort the batch; its result has an `error` instead.
+    Only a bounded number of chunks are in flight at once so `turns` can be a
+    lazy iterable.
+
+    Args:
+        * `turns` - iterable of turn dicts as accepted by `process_game_state`.
+        * `workers` - number of worker processes. Defaults to the number of
+          CPUs. When `1` the turns are adjudicated in this process.
+        * `chunk_size` - number of turns sent to a worker at a time.
+        * `timeout` - seconds to wait for the results of each chunk once the
+          results of the previous chunks have been yielded. This is not a
+          limit on how long a chunk takes to adjudicate: a chunk starts as
+          soon as a worker is free, so it may already have run while the
+          earlier chunks were waited on and consumed. It bounds how long the
+          batch is blocked on any one chunk. The turns in a chunk which
+          times out get a `TimeoutError`. If a chunk times out
+          the worker processes are terminated when the batch finishes, so a
+          stuck adjudication does not outlive the batch. Ignored when
+          `workers` is `1`. A worker process which dies, e.g. because it
+          runs out of memory, does not block the batch whatever the
+          timeout; the turns which were not adjudicated get a
+          `BrokenProcessPool` error.
+        * `trusted` - passed to `process_game_state`.
+
+    Yields:
+        * `BatchResult`
+    """
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be greater than zero.')
+    chunks = _chunks(enumerate(turns), chunk_size)
+
+    if workers == 1:
+        for chunk in chunks:
+            yield from _adjudicate_chunk(chunk, trusted)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    max_pending = workers * 2
+    executor = ProcessPoolExecutor(max_workers=workers)
+    timed_out = False
+    try:
+        pending = deque()
+        for chunk in chunks:
+            pending.append((chunk, _submit(executor, chunk, trusted)))
+            if len(pending) >= max_pending:
+                results, chunk_timed_out = _get_results(
+                    *pending.popleft(), timeout,
+                )
+                timed_out = timed_out or chunk_timed_out
+                yield from results
+        while pending:
+            results, chunk_timed_out = _get_results(
+                *pending.popleft(), timeout,
+            )
+            timed_out = timed_out or chunk_timed_out
+            yield from results
+    finally:
+        if timed_out:
+            _terminate(executor)
+        else:
+            executor.shutdown()
+
+
+def _submit(executor, chunk, trusted):
+    try:
+        return executor.submit(_adjudicate_chunk, chunk, trusted)
+    except BrokenProcessPool as exc:
+        future = Future()
+        future.set_exception(exc)
+        return future
+
+
+def _get_results(chunk, future, timeout):
+    """
+    Wait for the results of a chunk.
+
+    Returns:
+        * `tuple` - the `BatchResult` of each turn in the chunk and whether
+          the chunk timed out.
+    """
+    try:
+        return future.result(timeout), False
+    except FutureTimeoutError:
+        error, timed_out = TimeoutError('Adjudication timed out.'), True
+    except BrokenProcessPool as exc:
+        error, timed_out = exc, False
+    return [BatchResult(index, None, error) for index, _ in chunk], timed_out
+
+
+def _terminate(executor):
+    """
+    Shut down the executor without waiting for the running chunks.
+    `ProcessPoolExecutor` cannot cancel a running task and has no public way
+    to stop its workers, so the worker processes are terminated through the
+    private `_processes` attribute. If that is not available the executor is
+    shut down without waiting and the workers exit once their chunk is done.
+    """
+    processes = getattr(executor, '_processes', None)
+    if not isinstance(processes, dict):
+        executor.shutdown(wait=False)
+        return
+    for process in list(processes.values()):
+        process.terminate()
+    executor.shutdown()
+
+
+def _chunks(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _adjudicate_chunk(chunk, trusted=False):
+    """
+    Adjudicate a list of `(index, turn)` pairs in a worker process.
+    """
+    from adjudicator import process_game_state
+
+    results = []
+    for index, data in chunk:
+        try:
+            results.append(BatchResult(
+                index,
+                process_game_state(data, trusted=trusted),
+                None,
+            ))
+        except Exception as exc:
+            results.append(BatchResult(index, None, exc))
+    return results
@@ -1,34 +1,13 @@
-from .base import Decision, Outcomes
-from .path import Path
+from .base import Outcomes, StrengthDecision
 
 
-class AttackStrength(Decision):
+class AttackStrength(StrengthDecision):
     """
     For each unit ordered to move, the strength to attack. A decision that
     results in a value equal or greater than zero.
     """
-    min_strength = 0
-    max_strength = 50
-
-    def __call__(self):
-        """
-        Return the result of the min and max strength if resolved (if both
-        values are equal then it is resolved). Otherwise attempt to resolve the
-        decision and then return the result.
-
-        Returns:
-            * `tuple` - min strength and max strength
-        """
-        if self.min_strength == self.max_strength:
-            return self.min_strength, self.max_strength
-        self.min_strength, self.max_strength = self._resolve()
-        return self.min_strength, self.max_strength
-
-    def _resolve(self):
-        return self._minimum(), self._maximum()
-
     def _minimum(self):
-        path = Path(self.order)()
+        path = self.order.path_decision()
 
         if path == Outcomes.NO_PATH or path == Outcomes.UNRESOLVED:
             return 0
@@ -49,7 +28,7 @@ class AttackStrength(Decision):
         return 1 + len(self.order.move_support(Outcomes.SUCCEEDS))
 
     def _maximum(self):
-        path = Path(self.order)()
+        path = self.order.path_decision()
 
         if path == Outcomes.NO_PATH:
             return 0
@@ -27,6 +27,8 @@ class Decision:
         """
         if self.result != Outcomes.UNRESOLVED:
             return self.result
+        if self.order.state.tracer is not None:
+            self.order.state.tracer.decision(self)
         self.result = self._resolve()
         return self.result
 
@@ -34,3 +36,57 @@ class Decision:
         raise NotImplementedError(
             'Subclasses of Decision must implement _resolve method.'
         )
+
+
+class StrengthDecision(Decision):
+    """
+    A decision that results in a value equal or greater than zero. Until it is
+    resolved the value is known to lie between `min_strength` and
+    `max_strength`. The interval only narrows as the outcomes it depends on are
+    resolved and the decision is resolved once both values are equal.
+
+    Each instance is kept for the whole of processing. The interval is only
+    recalculated when an outcome in the state has changed since it was last
+    calculated (see `State.revision`).
+    """
+    min_strength = 0
+    max_strength = 50
+
+    def __init__(self, order):
+        super().__init__(order)
+        self.state = order.state
+        self.revision = None
+
+    def __call__(self):
+        """
+        Return the result of the min and max strength if resolved (if both
+        values are equal then it is resolved). Otherwise attempt to resolve the
+        decision and then return the result.
+
+        Returns:
+            * `tuple` - min strength and max strength
+        """
+        if self.min_strength == self.max_strength:
+            return self.min_strength, self.max_strength
+        revision = self.state.revision
+        if revision != self.revision:
+            if self.state.tracer is not None:
+                self.state.tracer.decision(self)
+            min_strength, max_strength = self._resolve()
+            self.min_strength = max(self.min_strength, min_strength)
+            self.max_strength = min(self.max_strength, max_strength)
+            self.revision = revision
+        return self.min_strength, self.max_strength
+
+    def _resolve(self):
+        return self._minimum(), self._maximum()
+
+    def _minimum(self):
+        raise NotImplementedError(
+            'Subclasses of StrengthDecision must implement _minimum method.'
+        )
+
+    def _maximum(self):
+        raise NotImplementedError(
+            'Subclasses of StrengthDecision must implement _maximum method.'
+        )
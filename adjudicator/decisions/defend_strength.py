@@ -1,18 +1,12 @@
-from .base import Decision, Outcomes
+from .base import Outcomes, StrengthDecision
 
 
-class DefendStrength(Decision):
+class DefendStrength(StrengthDecision):
     """
     For each piece ordered to move in a head to head battle, the strength to
     defend its own territory from the other piece of the head to head battle. A
     decision that results in a value equal or greater than zero.
     """
-    def __call__(self):
-        return self._resolve()
-
-    def _resolve(self):
-        return self._minimum(), self._maximum()
-
     def _minimum(self):
         return 1 + len(self.order.move_support(Outcomes.SUCCEEDS))
 
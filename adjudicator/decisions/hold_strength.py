@@ -1,36 +1,18 @@
-from .base import Decision, Outcomes
-from .attack_strength import AttackStrength
+from .base import Outcomes, StrengthDecision
 
 
-class HoldStrength(Decision):
+class HoldStrength(StrengthDecision):
     """
     For each territory on the board the strength to prevent that other pieces
     move to that territory. A decision that results in a value equal or greater
     than zero.
     """
-    min_strength = 0
-    max_strength = 50
-
     def __init__(self, territory):
         self.territory = territory
+        self.state = territory.state
         self.result = Outcomes.UNRESOLVED
-
-    def __call__(self):
-        """
-        Return the result of the min and max strength if resolved (if both
-        values are equal then it is resolved). Otherwise attempt to resolve the
-        decision and then return the result.
-
-        Returns:
-            * `tuple` - min strength and max strength
-        """
-        if self.min_strength == self.max_strength:
-            return self.min_strength, self.max_strength
-        self.min_strength, self.max_strength = self._resolve()
-        return self.min_strength, self.max_strength
-
-    def _resolve(self):
-        return self._minimum(), self._maximum()
+        self.message = None
+        self.revision = None
 
     def _minimum(self):
         piece = self.territory.piece
@@ -45,7 +27,7 @@ class HoldStrength(Decision):
             # NOTE this is bullsh relating to how convoy swaps work
             # TODO clean
             if piece.order.is_convoy_swap():
-                _, max_attack_strength = AttackStrength(piece.order)()
+                _, max_attack_strength = piece.order.attack_strength_decision()
                 target_min_prevent = max(
                     [p.order.prevent_strength_decision()[0] for p in
                      piece.order.target.other_attacking_pieces(piece)],
@@ -70,7 +52,7 @@ class HoldStrength(Decision):
             # NOTE this is bullsh relating to how convoy swaps work
             # TODO clean
             if piece.order.is_convoy_swap():
-                min_attack_strength, _ = AttackStrength(piece.order)()
+                min_attack_strength, _ = piece.order.attack_strength_decision()
                 target_max_prevent = max(
                     [p.order.prevent_strength_decision()[1] for p in
                      piece.order.target.other_attacking_pieces(piece)],
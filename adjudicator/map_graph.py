@@ -0,0 +1,142 @@
+from functools import lru_cache
+
+
+class MapGraph:
+    """
+    The static adjacency of a map. Territory ids are mapped to indexes and the
+    neighbours and shared coasts of each territory are held as sets of
+    indexes. The territories which can be reached from each named coast are
+    precomputed.
+
+    A map graph never changes once compiled, so a single instance can be
+    shared by every turn of a game and sent to worker processes.
+    """
+
+    def __init__(self, territories, named_coasts):
+        """
+        Args:
+            * `territories` - iterable of `(id, neighbour_ids,
+              shared_coast_ids)` tuples.
+            * `named_coasts` - iterable of `(id, neighbour_ids)` tuples.
+        """
+        territories = list(territories)
+        self.territory_ids = tuple(t[0] for t in territories)
+        self.index = {id: i for i, id in enumerate(self.territory_ids)}
+
+        self._neighbour_ids = tuple(self._known(t[1]) for t in territories)
+        self._neighbours = tuple(
+            frozenset(self.index[i] for i in ids)
+            for ids in self._neighbour_ids
+        )
+        self._shared_coast_ids = tuple(
+            self._known(t[2]) for t in territories
+        )
+        self._shared_coasts = tuple(
+            frozenset(self.index[i] for i in ids)
+            for ids in self._shared_coast_ids
+        )
+        self._named_coast_neighbours = {
+            id: frozenset(self.index[i] for i in self._known(neighbours))
+            for id, neighbours in named_coasts
+        }
+
+    def _known(self, ids):
+        return tuple(i for i in ids if i in self.index)
+
+    def neighbour_ids(self, territory_id):
+        """
+        Get the ids of the territories which neighbour the given territory.
+
+        Args:
+            * `territory_id` - `int`
+
+        Returns:
+            * `tuple` of `int`
+        """
+        return self._neighbour_ids[self.index[territory_id]]
+
+    def shared_coast_ids(self, territory_id):
+        """
+        Get the ids of the territories which share a coast with the given
+        territory.
+
+        Args:
+            * `territory_id` - `int`
+
+        Returns:
+            * `tuple` of `int`
+        """
+        return self._shared_coast_ids[self.index[territory_id]]
+
+    def adjacent(self, territory_id, other_id):
+        index = self.index.get(other_id)
+        return index in self._neighbours[self.index[territory_id]]
+
+    def shares_coast(self, territory_id, other_id):
+        index = self.index.get(other_id)
+        return index in self._shared_coasts[self.index[territory_id]]
+
+    def coast_reaches(self, named_coast_id, territory_id):
+        """
+        Determine whether a fleet on the given named coast can reach the given
+        territory, or vice versa.
+
+        Args:
+            * `named_coast_id` - `int`
+            * `territory_id` - `int`
+
+        Returns:
+            * `bool`
+        """
+        index = self.index.get(territory_id)
+        return index in self._named_coast_neighbours[named_coast_id]
+
+    @classmethod
+    def from_state(cls, state):
+        """
+        Compile a map graph from the territories and named coasts registered
+        to the given state.
+        """
+        territories = [
+            (t.id, t.neighbour_ids, getattr(t, 'shared_coast_ids', ()))
+            for t in state.territories
+        ]
+        named_coasts = [
+            (n.id, [getattr(t, 'id', t) for t in n.neighbours])
+            for n in state.named_coasts
+        ]
+        return cls(territories, named_coasts)
+
+
+def get_map_graph(variant, territories, named_coasts):
+    """
+    Get the compiled map graph for a variant. Graphs are cached so the map is
+    only compiled the first time it is seen by this process.
+
+    Args:
+        * `variant` - `str`
+        * `territories` - `list` of validated territory dicts.
+        * `named_coasts` - `list` of validated named coast dicts.
+
+    Returns:
+        * `MapGraph`
+    """
+    key = (
+        tuple(
+            (t['id'], tuple(t['neighbours']), tuple(t['shared_coasts']))
+            for t in territories
+        ),
+        tuple(
+            (n['id'], tuple(n['neighbours']))
+            for n in named_coasts
+        ),
+    )
+    return _compile(variant, key)
+
+
+@lru_cache(maxsize=16)
+def _compile(variant, key):
+    # The variant is part of the cache key so that graphs for different
+    # variants are never shared, even if their maps happen to be identical.
+    territories, named_coasts = key
+    return MapGraph(territories, named_coasts)
@@ -3,6 +3,8 @@ from .state import register
 
 class NamedCoast:
 
+    __slots__ = ('id', 'name', 'parent', 'neighbours')
+
     @register
     def __init__(self, state, id, name, parent, neighbours):
         self.id = id
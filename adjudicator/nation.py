@@ -4,6 +4,8 @@ from .state import register
 
 class Nation:
 
+    __slots__ = ('id', 'name', 'state')
+
     @register
     def __init__(self, state, id, name):
         self.id = id
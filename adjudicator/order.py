@@ -1,17 +1,31 @@
 from . import decisions, check
 from .convoy_chain import get_convoy_chains
 from .decisions import Outcomes
-from .decisions.attack_strength import AttackStrength
 from .state import register
 
 
 class Order:
 
+    __slots__ = (
+        'state', 'id', 'nation', 'source', '_outcome', 'outcome_verbose',
+        'illegal', 'illegal_code', 'illegal_verbose',
+    )
+
+    is_dummyhold = False
+    is_hold = False
+    is_move = False
+    is_support = False
+    is_convoy = False
+    is_retreat = False
+    is_build = False
+    is_disband = False
+
     @register
     def __init__(self, state, id, nation, source, *args, **kwargs):
         self.id = id
         self.nation = nation
         self.source = source
+        self.state = state
 
         self.outcome = Outcomes.UNRESOLVED
         self.outcome_verbose = None
@@ -19,7 +33,6 @@ class Order:
         self.illegal = False
         self.illegal_code = None
         self.illegal_verbose = None
-        self.state = state
 
     def __str__(self):
         piece_type = self.piece.__class__.__name__.lower()
@@ -32,23 +45,22 @@ class Order:
             result += f'{aux}-> {self.target}'
         return result
 
-    def __getattr__(self, name):
-        """
-        Adds the ability to determine the type of an order using the syntax
-        `order.is_<order_subclass>`.
-        """
-        subclasses = Order.__subclasses__()
-        for s in subclasses:
-            if name == 'is_' + s.__name__.lower():
-                return isinstance(self, s)
-        raise AttributeError(
-            f'{self.__class__.__name__} has no attribute \'{name}\'.'
-        )
+    @property
+    def outcome(self):
+        resolver = self.state.resolver
+        if resolver:
+            resolver.record(self)
+        return self._outcome
+
+    @outcome.setter
+    def outcome(self, value):
+        self._outcome = value
+        self.state.revision += 1
 
     @property
     def piece(self):
         return next(
-            iter([p for p in self.state.pieces if p.territory == self.source]),
+            iter(self.state.get_pieces_by_territory(self.source)),
             None
         )
 
@@ -58,10 +70,7 @@ class Order:
 
     @property
     def hold_support_orders(self):
-        return [
-            o for o in self.state.orders if isinstance(o, Support)
-            and o.aux == self.source and o.target == self.source
-        ]
+        return self.state.get_supports(self.source, self.source)
 
     def resolve(self):
         if not self.outcome == Outcomes.UNRESOLVED:
@@ -111,8 +120,13 @@ class Order:
 class DummyHold(Order):
     """
     Represents a hold order for a piece which did not receive an order. Does
-    not get registered to the state.
+    not get registered to the state as an order. Instead the state keeps one
+    instance per unordered piece (see `State.link`).
     """
+    __slots__ = ()
+
+    is_dummyhold = True
+
     def __init__(self, state, nation, source):
         self.nation = nation
         self.source = source
@@ -121,6 +135,10 @@ class DummyHold(Order):
 
 class Hold(Order):
 
+    __slots__ = ()
+
+    is_hold = True
+
     checks = [
         check.SourcePieceBelongsToNation,
     ]
@@ -128,6 +146,14 @@ class Hold(Order):
 
 class Move(Order):
 
+    __slots__ = (
+        'target', 'target_coast', 'via_convoy', 'attack_strength_decision',
+        'prevent_strength_decision', 'defend_strength_decision',
+        'path_decision',
+    )
+
+    is_move = True
+
     checks = [
         check.SourcePieceBelongsToNation,
         check.SourceAndTargetDistinct,
@@ -154,26 +180,20 @@ class Move(Order):
     def convoy_chains(self):
         if not self.via_convoy:
             return []
-        eligible_convoys = [
-            o for o in self.state.orders if isinstance(o, Convoy)
-            and o.aux == self.source and o.target == self.target
-        ]
+        eligible_convoys = self.state.get_convoys(self.source, self.target)
         # print([c.outcome for c in eligible_convoys])
         return get_convoy_chains(self.source, self.target, eligible_convoys)
 
     @property
     def move_support_orders(self):
-        return [
-            o for o in self.state.orders if isinstance(o, Support)
-            and o.aux == self.source and o.target == self.target
-        ]
+        return self.state.get_supports(self.source, self.target)
 
     def check_succeeds(self):
 
         if self.path_decision() != Outcomes.PATH:
             return False
 
-        min_attack_strength, _ = AttackStrength(self)()
+        min_attack_strength, _ = self.attack_strength_decision()
         _, max_to_beat = self._get_strength_to_beat()
         max_prevent = max(
             [p.order.prevent_strength_decision()[1]
@@ -184,7 +204,7 @@ class Move(Order):
         return min_attack_strength > max([max_to_beat, max_prevent])
 
     def check_fails(self):
-        _, max_attack_strength = AttackStrength(self)()
+        _, max_attack_strength = self.attack_strength_decision()
         min_to_beat, _ = self._get_strength_to_beat()
         min_prevent = min([p.order.prevent_strength_decision()[0] for p in self.target.other_attacking_pieces(self.piece)], default=100)
 
@@ -255,6 +275,10 @@ class Move(Order):
 
 class Support(Order):
 
+    __slots__ = ('aux', 'target')
+
+    is_support = True
+
     checks = [
         check.SourcePieceBelongsToNation,
         check.SourceAndTargetDistinct,
@@ -311,6 +335,10 @@ class Support(Order):
 
 class Convoy(Order):
 
+    __slots__ = ('aux', 'target')
+
+    is_convoy = True
+
     checks = [
         check.SourcePieceBelongsToNation,
         check.ConvoyeeIsArmy,
@@ -332,6 +360,10 @@ class Convoy(Order):
 
 class Retreat(Order):
 
+    __slots__ = ('target', 'target_coast')
+
+    is_retreat = True
+
     checks = [
         check.SourcePieceBelongsToNation,
         check.TargetNotAttackerTerritory,
@@ -357,6 +389,10 @@ class Retreat(Order):
 
 class Build(Order):
 
+    __slots__ = ('piece_type', 'named_coast')
+
+    is_build = True
+
     checks = [
         check.SourceNotOccupied,
         check.SourceHasSupplyCenter,
@@ -378,6 +414,10 @@ class Build(Order):
 
 class Disband(Order):
 
+    __slots__ = ()
+
+    is_disband = True
+
     checks = [
         check.SourcePieceBelongsToNation,
     ]
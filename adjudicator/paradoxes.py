@@ -11,16 +11,27 @@ def find_circular_movements(ms):
             # This would be a head to head.
             if node_b.is_move and node_b.target != node_a.source:
                 # go
-                next_node = node_b.target.piece.order
-                found_original_node = False
                 nodes = [node_a, node_b]
-                while not found_original_node:
-                    nodes.append(next_node)
+                next_node = _next_node(node_b)
+                while next_node:
                     moves = [m for m in moves if m != next_node]
-                    if next_node.is_move:
-                        if next_node.target == node_a.source:
-                            found_original_node = True
-                            circular_movements.append(nodes)
-                        else:
-                            next_node = next_node.target.piece.order
+                    # The chain ends without a move or loops back on itself
+                    # without reaching the original node.
+                    if not next_node.is_move or next_node in nodes:
+                        break
+                    nodes.append(next_node)
+                    if next_node.target == node_a.source:
+                        circular_movements.append(nodes)
+                        break
+                    next_node = _next_node(next_node)
     return circular_movements
+
+
+def _next_node(move):
+    """
+    Get the order of the piece in the target of the given move, if any.
+    """
+    piece = move.target.piece
+    if piece:
+        return piece.order
+    return None
@@ -9,6 +9,12 @@ class PieceTypes:
 
 class Piece:
 
+    __slots__ = (
+        'state', 'id', 'nation', 'territory', '_dislodged_decision',
+        'dislodged_by', 'dislodged_from', 'attacker_territory', 'retreating',
+        'destroyed', 'destroyed_message',
+    )
+
     is_army = False
     is_fleet = False
 
@@ -33,17 +39,21 @@ class Piece:
     def __repr__(self):
         return f'{self.__class__.__name__} {self.territory}'
 
+    @property
+    def dislodged_decision(self):
+        resolver = self.state.resolver
+        if resolver:
+            resolver.record(self)
+        return self._dislodged_decision
+
+    @dislodged_decision.setter
+    def dislodged_decision(self, value):
+        self._dislodged_decision = value
+        self.state.revision += 1
+
     @property
     def order(self):
-        from adjudicator.order import DummyHold
-        return next(
-            iter([
-                o for o in self.state.orders
-                if o.source == self.territory
-                and o.nation == self.nation
-            ]),
-            DummyHold(self.state, self.nation, self.territory)
-        )
+        return self.state.get_order_by_piece(self)
 
     @property
     def moves(self):
@@ -115,16 +125,24 @@ class Piece:
             return self.set_dislodged_decision(Outcomes.DISLODGED, piece)
         return Outcomes.UNRESOLVED
 
-    def can_retreat(self):
+    def can_retreat(self, occupied=None):
         """
         Determine whether the piece can retreat to any neighboring territory.
 
+        Args:
+            * `[occupied]` - `set` of the occupied territories. Saves checking
+              the pieces in each neighbouring territory when checking many
+              pieces.
+
         Returns:
             * `bool`
         """
         for territory in self.territory.neighbours:
             accessible = territory.accessible_by_piece_type(self)
-            unoccupied = not territory.occupied
+            if occupied is None:
+                unoccupied = not territory.occupied
+            else:
+                unoccupied = territory not in occupied
             uncontested = not territory.bounce_occurred
             if accessible and unoccupied and uncontested:
                 return True
@@ -133,6 +151,8 @@ class Piece:
 
 class Army(Piece):
 
+    __slots__ = ()
+
     is_army = True
 
     def can_reach(self, target, *args):
@@ -170,10 +190,12 @@ class Army(Piece):
 
 class Fleet(Piece):
 
+    __slots__ = ('named_coast',)
+
     is_fleet = True
 
-    def __init__(self, state, id, nation, territory, named_coast=None, retreating=False):
-        super().__init__(state, id, nation, territory, retreating=retreating)
+    def __init__(self, state, id, nation, territory, named_coast=None, **kwargs):
+        super().__init__(state, id, nation, territory, **kwargs)
         self.named_coast = named_coast
 
     def can_reach(self, target, named_coast=None):
@@ -192,14 +214,15 @@ class Fleet(Piece):
             raise ValueError(
                 'Must specify coast if target is complex territory.'
             )
+        map_graph = self.state.map_graph
         if named_coast:
-            return self.territory in named_coast.neighbours
+            return map_graph.coast_reaches(named_coast.id, self.territory.id)
 
         if self.territory.is_complex:
-            return target in self.named_coast.neighbours
+            return map_graph.coast_reaches(self.named_coast.id, target.id)
 
         if self.territory.is_coastal and target.is_coastal:
-            return target in self.territory.shared_coasts
+            return self.territory.shares_coast_with(target)
 
         return self.territory.adjacent_to(target) and \
             target.accessible_by_piece_type(self)
@@ -217,10 +240,12 @@ class Fleet(Piece):
             * `bool`
         """
         if self.territory.is_complex:
-            return target in self.named_coast.neighbours
+            return self.state.map_graph.coast_reaches(
+                self.named_coast.id, target.id
+            )
 
         if self.territory.is_coastal and target.is_coastal:
-            return target in self.territory.shared_coasts
+            return self.territory.shares_coast_with(target)
 
         return self.territory.adjacent_to(target) and \
             target.accessible_by_piece_type(self)
@@ -1,16 +1,43 @@
+import time
+from contextlib import contextmanager
+
 from adjudicator.base import Season, Phase
 from adjudicator.decisions import Outcomes
-from adjudicator.paradoxes import find_circular_movements
+from adjudicator.resolver import Resolver
+
 
+@contextmanager
+def _untraced(name):
+    yield
 
-def process(state):
+
+def process(state, tracer=None):
     """
     Processes all orders in a turn.
+
+    Args:
+        * `state` - `State`
+        * `[tracer]` - `Tracer` - records how the turn was resolved. See
+          `adjudicator.tracer`.
     """
+    if tracer is None:
+        return _process(state, _untraced)
+    start = time.perf_counter()
+    state.tracer = tracer
+    try:
+        return _process(state, tracer.phase)
+    finally:
+        state.tracer = None
+        tracer.seconds += time.perf_counter() - start
+
+
+def _process(state, trace):
+    state.link()
     orders = state.orders
     pieces = state.pieces
-    for order in orders:
-        order.check_legal()
+    with trace('check_legal'):
+        for order in orders:
+            order.check_legal()
 
     moves = [o for o in orders if o.is_move]
     retreats = [o for o in orders if o.is_retreat]
@@ -28,74 +55,35 @@ def process(state):
     for m in illegal_moves:
         m.outcome = Outcomes.FAILS
 
-    unresolved_pieces = [p for p in pieces if p.dislodged_decision == Outcomes.UNRESOLVED]
-    unresolved_supports = [s for s in supports if s.outcome == Outcomes.UNRESOLVED]
-
-    unresolved_convoys = [c for c in convoys if c.piece.dislodged_decision == Outcomes.UNRESOLVED]
-    while unresolved_convoys:
-        unresolved_supports = [s for s in supports if s.outcome == Outcomes.UNRESOLVED]
-        unresolved_moves = [m for m in moves if m.outcome == Outcomes.UNRESOLVED]
-        for move in unresolved_moves:
-            move.resolve()
-        for support in unresolved_supports:
-            support.resolve()
-        for piece in unresolved_pieces:
-            piece.update_dislodged_decision()
-        for convoy in unresolved_convoys:
-            convoy.resolve()
-        # resolve fleet movements
-        unresolved_convoys = [c for c in convoys if c.outcome == Outcomes.UNRESOLVED]
-
-    # refresh after convoys resolved
-    unresolved_moves = [m for m in moves if m.outcome == Outcomes.UNRESOLVED]
-
-    depth = 0
-    unresolved_retreats = [r for r in retreats if r.outcome == Outcomes.UNRESOLVED]
-    while unresolved_moves or unresolved_pieces or unresolved_supports or unresolved_retreats:
-        unresolved_retreats = [r for r in retreats if r.outcome == Outcomes.UNRESOLVED]
-        for r in unresolved_retreats:
-            r.resolve()
-
-        if depth == 10:
-            circular_movements = find_circular_movements(moves)
-            for li in circular_movements:
-                for move in li:
-                    move.outcome = Outcomes.SUCCEEDS
-
-        for move in [m for m in moves if m.outcome == Outcomes.UNRESOLVED]:
-            move.resolve()
-
-        unresolved_supports = [s for s in supports if s.outcome == Outcomes.UNRESOLVED]
-        for support in unresolved_supports:
-            support.resolve()
-
-        for piece in unresolved_pieces:
-            piece.update_dislodged_decision()
-
-        unresolved_moves = [m for m in moves if m.outcome == Outcomes.UNRESOLVED]
-        unresolved_pieces = [p for p in pieces if p.dislodged_decision == Outcomes.UNRESOLVED]
-        depth += 1
-
-    # Check update bounce_occurred_during_turn on all territories
-    for territory in state.territories:
-        attacks = [o for o in orders if o.is_move and o.target == territory]
-        bounce_occurred = False
-        for attack in attacks:
-            if attack.legal and attack.outcome == Outcomes.FAILS and \
-                    attack.path_decision() == Outcomes.PATH:
-                bounce_occurred = True
-        territory.bounce_occurred = bounce_occurred
+    # Resolve every move, support, convoy, retreat and dislodged decision.
+    # Circular movements are resolved once no further progress can be made.
+    with trace('resolution'):
+        resolver = Resolver(state)
+        resolver.resolve([*moves, *supports, *pieces, *convoys, *retreats])
+
+    # Check update bounce_occurred_during_turn on all territories. A bounce
+    # occurs in the target of a legal move which fails but has a path.
+    with trace('bounces'):
+        bounced = set()
+        for move in moves:
+            if move.legal and move.outcome == Outcomes.FAILS and \
+                    move.path_decision() == Outcomes.PATH:
+                bounced.add(move.target)
+        for territory in state.territories:
+            territory.bounce_occurred = territory in bounced
 
     # Check all dislodged pieces for pieces which can't retreat
-    dislodged_pieces = [p for p in state.pieces
-                        if p.dislodged_decision == Outcomes.DISLODGED]
-    for piece in dislodged_pieces:
-        if not piece.can_retreat():
-            piece.destroyed = True
-            piece.destroyed_message = (
-                'Destroyed because piece cannot retreat to any neighboring '
-                'territories.'
-            )
+    with trace('retreats'):
+        dislodged_pieces = [p for p in pieces
+                            if p.dislodged_decision == Outcomes.DISLODGED]
+        occupied = {t for t in state.territories if t.occupied}
+        for piece in dislodged_pieces:
+            if not piece.can_retreat(occupied):
+                piece.destroyed = True
+                piece.destroyed_message = (
+                    'Destroyed because piece cannot retreat to any '
+                    'neighboring territories.'
+                )
     for build in builds:
         if build.legal:
             build.outcome = Outcomes.SUCCEEDS
@@ -107,14 +95,13 @@ def process(state):
     # Set captured_by for territories if fall orders
     if state.season == Season.FALL and state.phase == Phase.ORDER:
         # Find all pieces that are not dislodged
-        non_dislodged_pieces = [p for p in state.pieces if not p.dislodged]
+        non_dislodged_pieces = [p for p in pieces if not p.dislodged]
         for piece in non_dislodged_pieces:
             if piece.nation != piece.territory.nation:
                 piece.territory.captured_by = piece.nation
         # Find all successful move orders
         successful_move_orders = [
-            m for m in state.orders
-            if m.is_move and m.outcome == Outcomes.SUCCEEDS
+            m for m in moves if m.outcome == Outcomes.SUCCEEDS
         ]
         for move in successful_move_orders:
             if move.piece.nation != move.target.nation:
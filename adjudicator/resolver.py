@@ -0,0 +1,192 @@
+from collections import deque
+
+from adjudicator.decisions import Outcomes
+from adjudicator.paradoxes import find_circular_movements
+from adjudicator.piece import Piece
+
+
+class Resolver:
+    """
+    Resolves the outcome of every order and the dislodged decision of every
+    piece in a turn.
+
+    Each order or piece is a unit whose value is its outcome or dislodged
+    decision. While a unit is being resolved every value that is read, either
+    directly or through one of the `Decision` classes, is recorded as a
+    dependency of that unit. When a unit's value changes only the units which
+    read it are queued to be resolved again.
+
+    When the queue is exhausted and units remain unresolved the remaining
+    units depend on each other. Cycles are found in the dependency graph and
+    any circular movements within them are resolved as successful.
+    """
+
+    def __init__(self, state):
+        self.state = state
+        self.dependencies = {}
+        self.dependents = {}
+        self._current = None
+        self.tracer = state.tracer
+
+    def record(self, unit):
+        """
+        Record that the unit currently being resolved has read the value of
+        `unit`. Called by `Order.outcome` and `Piece.dislodged_decision`.
+        """
+        current = self._current
+        if current is not None and unit is not current:
+            self.dependencies[current][unit] = None
+
+    def resolve(self, units):
+        """
+        Resolve the given units until no further progress can be made.
+
+        Args:
+            * `units` - `list` of `Order` and `Piece` instances.
+        """
+        self.state.resolver = self
+        try:
+            queue = deque(u for u in units if self._unresolved(u))
+            queued = set(queue)
+            while queue:
+                if self.tracer is not None:
+                    self.tracer.start_round()
+                while queue:
+                    unit = queue.popleft()
+                    queued.discard(unit)
+                    if not self._unresolved(unit):
+                        continue
+                    if self._evaluate(unit):
+                        self._enqueue_dependents(unit, queue, queued)
+                changed = self._resolve_cycles(units)
+                for unit in changed:
+                    self._enqueue_dependents(unit, queue, queued)
+            if self.tracer is not None:
+                self.tracer.unresolved_units(
+                    [u for u in units if self._unresolved(u)]
+                )
+        finally:
+            self.state.resolver = None
+
+    def _evaluate(self, unit):
+        """
+        Resolve the unit, recording the values it reads.
+
+        Returns:
+            * `bool` - whether the unit's value changed.
+        """
+        for dependency in self.dependencies.get(unit, ()):
+            self.dependents[dependency].pop(unit, None)
+        self.dependencies[unit] = {}
+
+        if self.tracer is not None:
+            self.tracer.evaluation(unit)
+        before = self._value(unit)
+        self._current = unit
+        try:
+            if self._is_piece(unit):
+                unit.update_dislodged_decision()
+            else:
+                unit.resolve()
+        finally:
+            self._current = None
+
+        for dependency in self.dependencies[unit]:
+            self.dependents.setdefault(dependency, {})[unit] = None
+        return self._value(unit) != before
+
+    def _enqueue_dependents(self, unit, queue, queued):
+        for dependent in list(self.dependents.get(unit, ())):
+            if dependent not in queued and self._unresolved(dependent):
+                queue.append(dependent)
+                queued.add(dependent)
+
+    def _resolve_cycles(self, units):
+        """
+        Find the unresolved units which form cycles in the dependency graph
+        and resolve any circular movements among them.
+
+        Returns:
+            * `list` of the units whose value changed.
+        """
+        cyclic = set()
+        for component in self._strongly_connected_components(units):
+            if len(component) > 1:
+                cyclic.update(component)
+        moves = [
+            u for u in units
+            if u in cyclic and not self._is_piece(u) and u.is_move
+        ]
+        changed = []
+        for circular_movement in find_circular_movements(moves):
+            if self.tracer is not None:
+                self.tracer.circular_movement(circular_movement)
+            for move in circular_movement:
+                if move.outcome == Outcomes.UNRESOLVED:
+                    move.outcome = Outcomes.SUCCEEDS
+                    changed.append(move)
+        return changed
+
+    def _strongly_connected_components(self, units):
+        """
+        Tarjan's algorithm over the dependency graph of the unresolved units.
+        """
+        unresolved = [u for u in units if self._unresolved(u)]
+        nodes = set(unresolved)
+        index = {}
+        low = {}
+        stack = []
+        on_stack = set()
+        components = []
+
+        for root in unresolved:
+            if root in index:
+                continue
+            # Iterative depth first search to avoid the recursion limit on
+            # large boards.
+            index[root] = low[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(self.dependencies.get(root, ())))]
+            while work:
+                node, edges = work[-1]
+                for edge in edges:
+                    if edge not in nodes:
+                        continue
+                    if edge not in index:
+                        index[edge] = low[edge] = len(index)
+                        stack.append(edge)
+                        on_stack.add(edge)
+                        work.append(
+                            (edge, iter(self.dependencies.get(edge, ())))
+                        )
+                        break
+                    if edge in on_stack:
+                        low[node] = min(low[node], index[edge])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        low[parent] = min(low[parent], low[node])
+                    if low[node] == index[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member is node:
+                                break
+                        components.append(component)
+        return components
+
+    @staticmethod
+    def _is_piece(unit):
+        return isinstance(unit, Piece)
+
+    def _value(self, unit):
+        if self._is_piece(unit):
+            return unit._dislodged_decision
+        return unit._outcome
+
+    def _unresolved(self, unit):
+        return self._value(unit) == Outcomes.UNRESOLVED
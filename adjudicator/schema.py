@@ -171,7 +171,7 @@ class TurnSchema(Schema):
         Ensure that all territory id fields have a corresponding territory.
         """
         errors = {}
-        territory_ids = [t['id'] for t in data['territories']]
+        territory_ids = {t['id'] for t in data['territories']}
         error_message = 'Territory id does not have a corresponding territory.'
         territory_fields = {
             'orders': ['source', 'target', 'aux'],
@@ -197,12 +197,11 @@ class TurnSchema(Schema):
         Ensure that all nation id fields have a corresponding nation.
         """
         errors = {}
-        nation_ids = [n['id'] for n in data['nations']]
+        nation_ids = {n['id'] for n in data['nations']}
         error_message = 'Nation id does not have a corresponding nation.'
         nation_fields = {
             'orders': ['nation'],
             'pieces': ['nation'],
-            'named_coasts': ['parent', 'neighbours'],
             'territories': ['nationality', 'controlled_by'],
         }
         for k, field_names in nation_fields.items():
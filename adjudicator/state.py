@@ -1,57 +1,291 @@
 class State:
 
-    def __init__(self, season, phase, year):
+    def __init__(self, season, phase, year, map_graph=None):
         self.subscribers = set()
         self.season = season
         self.phase = phase
         self.year = year
+        # Set while `Resolver.resolve` is running so that reads of order
+        # outcomes and dislodged decisions can be recorded.
+        self.resolver = None
+        # Set while `process` is running with a `Tracer`.
+        self.tracer = None
+        # Incremented whenever an order outcome or dislodged decision is set
+        # or an entity is registered. Strength decisions are only
+        # recalculated when the revision has changed.
+        self.revision = 0
+
+        # The static adjacency of the map. When not given it is compiled from
+        # the registered territories and named coasts when first needed.
+        self._map_graph = map_graph
+        self._compiled_map_graph = None
+
+        # Per-type registries, kept in registration order.
+        self._nations = []
+        self._territories = []
+        self._pieces = []
+        self._orders = []
+        self._named_coasts = []
+
+        # Lookup indexes populated on registration.
+        self._territories_by_id = {}
+        self._territories_by_name = {}
+        self._named_coasts_by_id = {}
+        self._named_coasts_by_parent = {}
+        self._orders_by_source = {}
+        self._pieces_by_territory = {}
+
+        # Relationships between orders, pieces and territories. Resolved by
+        # `link` and discarded whenever a new entity is registered.
+        self._linked = False
+        self._order_by_piece = {}
+        self._dummy_holds = {}
+        self._attacking_pieces_by_target = {}
+        self._retreating_pieces_by_target = {}
+        self._supports_by_aux_and_target = {}
+        self._convoys_by_aux_and_target = {}
 
     def register(self, *observers):
         for observer in observers:
+            # Subclass initializers are also decorated with `register` so the
+            # same instance can be registered more than once.
+            if observer in self.subscribers:
+                continue
             self.subscribers.add(observer)
+            self._index(observer)
+            self._linked = False
+            self.revision += 1
+
+    def _index(self, observer):
+        """
+        Add the observer to the registry for its type and to any lookup
+        indexes for that type.
+        """
+        from adjudicator.named_coast import NamedCoast
+        from adjudicator.nation import Nation
+        from adjudicator.order import Order
+        from adjudicator.piece import Piece
+        from adjudicator.territory import Territory
+
+        if isinstance(observer, Territory):
+            self._compiled_map_graph = None
+            self._territories.append(observer)
+            self._territories_by_id[observer.id] = observer
+            self._territories_by_name[observer.name] = observer
+        elif isinstance(observer, Piece):
+            self._pieces.append(observer)
+            self._pieces_by_territory \
+                .setdefault(observer.territory, []).append(observer)
+        elif isinstance(observer, Order):
+            self._orders.append(observer)
+            self._orders_by_source \
+                .setdefault(observer.source, []).append(observer)
+        elif isinstance(observer, NamedCoast):
+            self._compiled_map_graph = None
+            self._named_coasts.append(observer)
+            self._named_coasts_by_id[observer.id] = observer
+            self._named_coasts_by_parent \
+                .setdefault(observer.parent, []).append(observer)
+        elif isinstance(observer, Nation):
+            self._nations.append(observer)
 
     @property
     def nations(self):
-        from adjudicator.nation import Nation
-        return [n for n in self.subscribers if isinstance(n, Nation)]
+        return self._nations
 
     @property
     def territories(self):
-        from adjudicator.territory import Territory
-        return [t for t in self.subscribers if isinstance(t, Territory)]
+        return self._territories
 
     @property
     def pieces(self):
-        from adjudicator.piece import Piece
-        return [p for p in self.subscribers if isinstance(p, Piece)]
+        return self._pieces
 
     @property
     def orders(self):
-        from adjudicator.order import Order
-        return [p for p in self.subscribers if isinstance(p, Order)]
+        return self._orders
 
     @property
     def named_coasts(self):
-        from adjudicator.named_coast import NamedCoast
-        return [s for s in self.subscribers if isinstance(s, NamedCoast)]
+        return self._named_coasts
+
+    @property
+    def map_graph(self):
+        if self._map_graph:
+            return self._map_graph
+        if not self._compiled_map_graph:
+            from adjudicator.map_graph import MapGraph
+            self._compiled_map_graph = MapGraph.from_state(self)
+        return self._compiled_map_graph
+
+    def link(self):
+        """
+        Resolve the relationships between orders, pieces and territories in a
+        single pass so that they can be looked up directly during processing.
+        Pieces which have not been given an order are assigned a `DummyHold`
+        which is kept for as long as the piece remains unordered.
+        """
+        from adjudicator.order import Convoy, DummyHold, Move, Retreat, Support
+
+        self._order_by_piece = {}
+        self._attacking_pieces_by_target = {}
+        self._retreating_pieces_by_target = {}
+        self._supports_by_aux_and_target = {}
+        self._convoys_by_aux_and_target = {}
+
+        for order in self._orders:
+            if isinstance(order, Support):
+                key = (order.aux, order.target)
+                self._supports_by_aux_and_target \
+                    .setdefault(key, []).append(order)
+            elif isinstance(order, Convoy):
+                key = (order.aux, order.target)
+                self._convoys_by_aux_and_target \
+                    .setdefault(key, []).append(order)
+            piece = order.piece
+            if not piece:
+                continue
+            if isinstance(order, Move):
+                self._attacking_pieces_by_target \
+                    .setdefault(order.target, []).append(piece)
+            elif isinstance(order, Retreat):
+                self._retreating_pieces_by_target \
+                    .setdefault(order.target, []).append(piece)
+
+        for piece in self._pieces:
+            order = next(
+                iter(
+                    o for o in self.get_orders_by_source(piece.territory)
+                    if o.nation == piece.nation
+                ),
+                None
+            )
+            if not order:
+                order = self._dummy_holds.get(piece)
+                if not order:
+                    order = DummyHold(self, piece.nation, piece.territory)
+                    self._dummy_holds[piece] = order
+            self._order_by_piece[piece] = order
+        self._linked = True
+
+    def _ensure_linked(self):
+        if not self._linked:
+            self.link()
 
     def get_territory(self, name):
-        return next(
-            iter(t for t in self.territories if t.name == name),
-            None
-        )
+        return self._territories_by_name.get(name)
 
     def get_territory_by_id(self, id):
-        return next(
-            iter(t for t in self.territories if t.id == id),
-            None
-        )
+        return self._territories_by_id.get(id)
 
     def get_named_coast_by_id(self, id):
-        return next(
-            iter(n for n in self.named_coasts if n.id == id),
-            None
-        )
+        return self._named_coasts_by_id.get(id)
+
+    def get_named_coasts_by_parent(self, territory):
+        """
+        Get the named coasts which belong to the given territory.
+
+        Args:
+            * `territory` - `Territory`
+
+        Returns:
+            * `list` of `NamedCoast` instances.
+        """
+        return self._named_coasts_by_parent.get(territory, [])
+
+    def get_orders_by_source(self, territory):
+        """
+        Get the orders which were given to pieces in the given territory.
+
+        Args:
+            * `territory` - `Territory`
+
+        Returns:
+            * `list` of `Order` instances.
+        """
+        return self._orders_by_source.get(territory, [])
+
+    def get_pieces_by_territory(self, territory):
+        """
+        Get the pieces which are in the given territory.
+
+        Args:
+            * `territory` - `Territory`
+
+        Returns:
+            * `list` of `Piece` instances.
+        """
+        return self._pieces_by_territory.get(territory, [])
+
+    def get_order_by_piece(self, piece):
+        """
+        Get the order given to the piece. If the piece was not given an order
+        a `DummyHold` is returned.
+
+        Args:
+            * `piece` - `Piece`
+
+        Returns:
+            * `Order`
+        """
+        self._ensure_linked()
+        return self._order_by_piece[piece]
+
+    def get_attacking_pieces(self, territory):
+        """
+        Get the pieces which are ordered to move to the given territory.
+
+        Args:
+            * `territory` - `Territory`
+
+        Returns:
+            * `list` of `Piece` instances.
+        """
+        self._ensure_linked()
+        return self._attacking_pieces_by_target.get(territory, [])
+
+    def get_retreating_pieces(self, territory):
+        """
+        Get the pieces which are ordered to retreat to the given territory.
+
+        Args:
+            * `territory` - `Territory`
+
+        Returns:
+            * `list` of `Piece` instances.
+        """
+        self._ensure_linked()
+        return self._retreating_pieces_by_target.get(territory, [])
+
+    def get_supports(self, aux, target):
+        """
+        Get the support orders which support the piece in `aux` to move to
+        `target`. When `aux` and `target` are the same territory these are
+        the orders supporting the piece to hold.
+
+        Args:
+            * `aux` - `Territory`
+            * `target` - `Territory`
+
+        Returns:
+            * `list` of `Support` instances.
+        """
+        self._ensure_linked()
+        return self._supports_by_aux_and_target.get((aux, target), [])
+
+    def get_convoys(self, aux, target):
+        """
+        Get the convoy orders which convoy the piece in `aux` to `target`.
+
+        Args:
+            * `aux` - `Territory`
+            * `target` - `Territory`
+
+        Returns:
+            * `list` of `Convoy` instances.
+        """
+        self._ensure_linked()
+        return self._convoys_by_aux_and_target.get((aux, target), [])
 
 
 def register(init):
@@ -3,6 +3,11 @@ from .state import register
 
 
 class Territory:
+    __slots__ = (
+        'state', 'id', 'name', 'neighbour_ids', 'contested', 'bounce_occurred',
+        'hold_strength_decision',
+    )
+
     is_complex = False
     is_coastal = False
     is_inland = False
@@ -16,6 +21,7 @@ class Territory:
         self.neighbour_ids = neighbours
         self.contested = contested
         self.bounce_occurred = False
+        self.hold_strength_decision = decisions.HoldStrength(self)
 
     def __str__(self):
         return self.name
@@ -25,27 +31,24 @@ class Territory:
 
     @property
     def neighbours(self):
-        return [t for t in self.state.territories if t.id in self.neighbour_ids]
+        neighbour_ids = self.state.map_graph.neighbour_ids(self.id)
+        return [self.state.get_territory_by_id(i) for i in neighbour_ids]
 
     @property
     def pieces(self):
-        return [p for p in self.state.pieces if p.territory == self]
+        return self.state.get_pieces_by_territory(self)
 
     @property
     def attacking_pieces(self):
-        from adjudicator.order import Move
-        return [o.piece for o in self.state.orders if isinstance(o, Move)
-                and o.target == self and o.piece]
+        return self.state.get_attacking_pieces(self)
 
     @property
     def retreating_pieces(self):
-        from adjudicator.order import Retreat
-        return [o.piece for o in self.state.orders if isinstance(o, Retreat)
-                and o.target == self and o.piece]
+        return self.state.get_retreating_pieces(self)
 
     @property
     def named_coasts(self):
-        return [s for s in self.state.named_coasts if s.parent == self]
+        return self.state.get_named_coasts_by_parent(self)
 
     @property
     def piece(self):
@@ -69,14 +72,14 @@ class Territory:
 
     @property
     def hold_strength(self):
-        return decisions.HoldStrength(self)()
+        return self.hold_strength_decision()
 
     @property
     def occupied(self):
         return bool(self.piece)
 
     def adjacent_to(self, territory):
-        return territory in self.neighbours
+        return self.state.map_graph.adjacent(self.id, territory.id)
 
     def friendly_piece_exists(self, nation):
         """
@@ -158,6 +161,8 @@ class Territory:
 
 class LandTerritory(Territory):
 
+    __slots__ = ('nationality', 'supply_center', 'controlled_by', 'captured_by')
+
     def __init__(self, state, id, name, nationality, neighbours, supply_center=False, controlled_by=None, **kwargs):
         super().__init__(state, id, name, neighbours, **kwargs)
         self.nationality = nationality
@@ -168,6 +173,8 @@ class LandTerritory(Territory):
 
 class CoastalTerritory(LandTerritory):
 
+    __slots__ = ('shared_coast_ids',)
+
     is_coastal = True
 
     def __init__(self, state, id, name, nationality, neighbours, shared_coasts, **kwargs):
@@ -180,8 +187,11 @@ class CoastalTerritory(LandTerritory):
 
     @property
     def shared_coasts(self):
-        return [t for t in self.state.subscribers
-                if isinstance(t, Territory) and t.id in self.shared_coast_ids]
+        shared_coast_ids = self.state.map_graph.shared_coast_ids(self.id)
+        return [self.state.get_territory_by_id(i) for i in shared_coast_ids]
+
+    def shares_coast_with(self, territory):
+        return self.state.map_graph.shares_coast(self.id, territory.id)
 
     @property
     def is_complex(self):
@@ -190,6 +200,8 @@ class CoastalTerritory(LandTerritory):
 
 class InlandTerritory(LandTerritory):
 
+    __slots__ = ()
+
     is_inland = True
 
     @staticmethod
@@ -199,6 +211,8 @@ class InlandTerritory(LandTerritory):
 
 class SeaTerritory(Territory):
 
+    __slots__ = ()
+
     is_sea = True
 
     @staticmethod
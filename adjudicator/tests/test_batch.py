@@ -0,0 +1,114 @@
+import os
+import time
+import unittest
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import Mock, patch
+
+from marshmallow import ValidationError
+
+from adjudicator import adjudicate_many, process_game_state
+from adjudicator.batch import _terminate
+
+
+def slow_process_game_state(data, trusted=False):
+    if data['id'] == 1:
+        time.sleep(10)
+    return process_game_state(data, trusted=trusted)
+
+
+def dying_process_game_state(data, trusted=False):
+    if data['id'] == 1:
+        os._exit(1)
+    return process_game_state(data, trusted=trusted)
+
+
+def turn_data(turn_id):
+    return {
+        'id': turn_id,
+        'phase': 'order',
+        'season': 'spring',
+        'year': 1901,
+        'territories': [
+            {'id': 1, 'type': 'inland', 'name': 'Paris', 'neighbours': [2]},
+            {'id': 2, 'type': 'inland', 'name': 'Burgundy', 'neighbours': [1]},
+        ],
+        'named_coasts': [],
+        'nations': [{'id': 1, 'name': 'France'}],
+        'pieces': [
+            {'id': 1, 'type': 'army', 'nation': 1, 'territory': 1},
+        ],
+        'orders': [
+            {'id': 1, 'type': 'move', 'nation': 1, 'source': 1, 'target': 2},
+        ],
+    }
+
+
+class TestAdjudicateMany(unittest.TestCase):
+
+    def test_results_match_process_game_state(self):
+        turns = [turn_data(i) for i in range(5)]
+        expected = [process_game_state(turn_data(i)) for i in range(5)]
+        results = list(adjudicate_many(turns, workers=1, chunk_size=2))
+        self.assertEqual([r.index for r in results], list(range(5)))
+        self.assertEqual([r.data for r in results], expected)
+        self.assertTrue(all(r.error is None for r in results))
+
+    def test_failure_does_not_abort_batch(self):
+        invalid = turn_data(1)
+        invalid['orders'][0]['target'] = 99
+        turns = [turn_data(0), invalid, turn_data(2)]
+        results = list(adjudicate_many(turns, workers=1))
+        self.assertIsNone(results[1].data)
+        self.assertIsInstance(results[1].error, ValidationError)
+        self.assertEqual(results[2].data, process_game_state(turn_data(2)))
+
+    def test_results_streamed_in_order_across_processes(self):
+        invalid = turn_data(3)
+        invalid['orders'][0]['target'] = 99
+        turns = (
+            invalid if i == 3 else turn_data(i) for i in range(10)
+        )
+        results = list(adjudicate_many(turns, workers=2, chunk_size=3))
+        self.assertEqual([r.index for r in results], list(range(10)))
+        self.assertEqual(
+            [r.data is None for r in results],
+            [i == 3 for i in range(10)]
+        )
+        self.assertIsInstance(results[3].error, ValidationError)
+
+    def test_timed_out_turn_does_not_abort_batch(self):
+        turns = [turn_data(i) for i in range(3)]
+        # Worker processes are forked so they see the patched function.
+        with patch(
+            'adjudicator.process_game_state',
+            slow_process_game_state,
+        ):
+            start = time.monotonic()
+            results = list(
+                adjudicate_many(turns, workers=2, chunk_size=1, timeout=0.5)
+            )
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertIsNone(results[1].data)
+        self.assertIsInstance(results[1].error, TimeoutError)
+        self.assertEqual(results[2].data, process_game_state(turn_data(2)))
+
+    def test_invalid_chunk_size(self):
+        with self.assertRaises(ValueError):
+            list(adjudicate_many([], chunk_size=0))
+
+    def test_dead_worker_does_not_block_batch(self):
+        turns = [turn_data(i) for i in range(3)]
+        with patch(
+            'adjudicator.process_game_state',
+            dying_process_game_state,
+        ):
+            results = list(adjudicate_many(turns, workers=2, chunk_size=1))
+        self.assertEqual(len(results), 3)
+        self.assertIsInstance(results[1].error, BrokenProcessPool)
+
+    def test_terminate_without_worker_processes(self):
+        # The private `_processes` attribute may not exist in other Python
+        # versions. The executor is then shut down without waiting.
+        executor = Mock(spec=['shutdown'])
+        _terminate(executor)
+        executor.shutdown.assert_called_once_with(wait=False)
@@ -49,3 +49,17 @@ class TestBounceOccured(AdjudicatorTestCaseMixin, unittest.TestCase):
         territory = self.territories.PARIS
         process(self.state)
         self.assertFalse(territory.bounce_occurred)
+
+    def test_bounce_only_in_contested_territory(self):
+        Army(self.state, 0, Nations.FRANCE, self.territories.PICARDY),
+        Army(self.state, 0, Nations.GERMANY, self.territories.BURGUNDY),
+        Army(self.state, 0, Nations.GERMANY, self.territories.MUNICH),
+        orders = [
+            Move(self.state, 0, Nations.FRANCE, self.territories.PICARDY, self.territories.PARIS),
+            Move(self.state, 0, Nations.GERMANY, self.territories.BURGUNDY, self.territories.PARIS),
+            Move(self.state, 0, Nations.GERMANY, self.territories.MUNICH, self.territories.RUHR),
+        ]
+        process(self.state)
+        self.assertTrue(orders[0].target.bounce_occurred)
+        self.assertFalse(orders[2].target.bounce_occurred)
+        self.assertFalse(self.territories.PICARDY.bounce_occurred)
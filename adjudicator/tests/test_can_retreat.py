@@ -38,3 +38,12 @@ class TestCanRetreat(AdjudicatorTestCaseMixin, unittest.TestCase):
         Army(self.state, 0, Nations.RUSSIA, self.territories.NORWAY)
         Fleet(self.state, 0, Nations.RUSSIA, self.territories.NORWEGIAN_SEA)
         self.assertTrue(retreating_fleet.can_retreat())
+
+    def test_occupied_territories_given(self):
+        retreating_fleet = Fleet(self.state, 0, Nations.FRANCE, self.territories.BARRENTS_SEA)
+        Army(self.state, 0, Nations.RUSSIA, self.territories.NORWAY)
+        Fleet(self.state, 0, Nations.RUSSIA, self.territories.NORWEGIAN_SEA)
+        occupied = {self.territories.NORWAY, self.territories.NORWEGIAN_SEA}
+        self.assertTrue(retreating_fleet.can_retreat(occupied))
+        occupied.add(self.territories.ST_PETERSBURG)
+        self.assertFalse(retreating_fleet.can_retreat(occupied))
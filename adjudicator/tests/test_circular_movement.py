@@ -110,3 +110,41 @@ class TestCircularMovement(AdjudicatorTestCaseMixin, unittest.TestCase):
         orders = []
         result = find_circular_movements(orders)
         self.assertEqual(len(result), 0)
+
+    def test_chain_ending_in_hold(self):
+        Fleet(self.state, 0, Nations.TURKEY, self.territories.ANKARA),
+        Army(self.state, 0, Nations.TURKEY, self.territories.CONSTANTINOPLE),
+        Army(self.state, 0, Nations.TURKEY, self.territories.SMYRNA),
+
+        orders = [
+            Move(self.state, 0, Nations.TURKEY, self.territories.ANKARA, self.territories.CONSTANTINOPLE),
+            Move(self.state, 0, Nations.TURKEY, self.territories.CONSTANTINOPLE, self.territories.SMYRNA),
+        ]
+        result = find_circular_movements(orders)
+        self.assertEqual(len(result), 0)
+
+    def test_chain_ending_in_empty_territory(self):
+        Fleet(self.state, 0, Nations.TURKEY, self.territories.ANKARA),
+        Army(self.state, 0, Nations.TURKEY, self.territories.CONSTANTINOPLE),
+
+        orders = [
+            Move(self.state, 0, Nations.TURKEY, self.territories.ANKARA, self.territories.CONSTANTINOPLE),
+            Move(self.state, 0, Nations.TURKEY, self.territories.CONSTANTINOPLE, self.territories.SMYRNA),
+        ]
+        result = find_circular_movements(orders)
+        self.assertEqual(len(result), 0)
+
+    def test_chain_joining_another_circle(self):
+        Army(self.state, 0, Nations.TURKEY, self.territories.ARMENIA),
+        Fleet(self.state, 0, Nations.TURKEY, self.territories.ANKARA),
+        Army(self.state, 0, Nations.TURKEY, self.territories.CONSTANTINOPLE),
+        Army(self.state, 0, Nations.TURKEY, self.territories.SMYRNA),
+
+        orders = [
+            Move(self.state, 0, Nations.TURKEY, self.territories.ARMENIA, self.territories.ANKARA),
+            Move(self.state, 0, Nations.TURKEY, self.territories.ANKARA, self.territories.CONSTANTINOPLE),
+            Move(self.state, 0, Nations.TURKEY, self.territories.CONSTANTINOPLE, self.territories.SMYRNA),
+            Move(self.state, 0, Nations.TURKEY, self.territories.SMYRNA, self.territories.ANKARA),
+        ]
+        result = find_circular_movements(orders[:1])
+        self.assertEqual(len(result), 0)
@@ -0,0 +1,67 @@
+import unittest
+from unittest import mock
+
+from adjudicator.decisions import Outcomes
+from adjudicator.order import Hold, Move, Support
+from adjudicator.piece import Army
+from adjudicator.tests.data import NamedCoasts, Nations, Territories
+
+from .base import AdjudicatorTestCaseMixin
+
+
+class TestStrengthDecision(AdjudicatorTestCaseMixin, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.territories = Territories(self.state)
+        self.named_coasts = NamedCoasts(self.state, self.territories)
+        Army(self.state, 0, Nations.GERMANY, self.territories.PRUSSIA)
+        Army(self.state, 0, Nations.GERMANY, self.territories.SILESIA)
+        Army(self.state, 0, Nations.RUSSIA, self.territories.WARSAW)
+        self.move = Move(self.state, 0, Nations.GERMANY, self.territories.PRUSSIA, self.territories.WARSAW)
+        self.support = Support(self.state, 0, Nations.GERMANY, self.territories.SILESIA, self.territories.PRUSSIA, self.territories.WARSAW)
+        self.hold = Hold(self.state, 0, Nations.RUSSIA, self.territories.WARSAW)
+
+    def test_not_recalculated_when_no_outcome_changes(self):
+        decision = self.move.attack_strength_decision
+        self.assertEqual(decision(), (1, 2))
+        with mock.patch.object(decision, '_resolve') as resolve:
+            self.assertEqual(decision(), (1, 2))
+            resolve.assert_not_called()
+
+    def test_recalculated_when_outcome_changes(self):
+        decision = self.move.attack_strength_decision
+        self.assertEqual(decision(), (1, 2))
+        self.support.outcome = Outcomes.SUCCEEDS
+        self.assertEqual(decision(), (2, 2))
+
+    def test_cached_once_resolved(self):
+        decision = self.move.attack_strength_decision
+        self.support.outcome = Outcomes.SUCCEEDS
+        self.assertEqual(decision(), (2, 2))
+        self.support.outcome = Outcomes.FAILS
+        with mock.patch.object(decision, '_resolve') as resolve:
+            self.assertEqual(decision(), (2, 2))
+            resolve.assert_not_called()
+
+    def test_interval_only_narrows(self):
+        decision = self.move.attack_strength_decision
+        decision.min_strength, decision.max_strength = 2, 3
+        self.state.revision += 1
+        self.assertEqual(decision(), (2, 2))
+
+    def test_territory_hold_strength_decision_persists(self):
+        warsaw = self.territories.WARSAW
+        decision = warsaw.hold_strength_decision
+        self.assertEqual(warsaw.hold_strength, (1, 1))
+        self.assertIs(warsaw.hold_strength_decision, decision)
+
+    def test_defend_strength_cached_once_resolved(self):
+        decision = self.move.defend_strength_decision
+        self.assertEqual(decision(), (1, 2))
+        self.support.outcome = Outcomes.FAILS
+        self.assertEqual(decision(), (1, 1))
+        with mock.patch.object(decision, '_resolve') as resolve:
+            self.state.revision += 1
+            self.assertEqual(decision(), (1, 1))
+            resolve.assert_not_called()
@@ -0,0 +1,72 @@
+import pickle
+import unittest
+
+from adjudicator.map_graph import MapGraph, get_map_graph
+from adjudicator.named_coast import NamedCoast
+from adjudicator.territory import CoastalTerritory
+
+from .base import AdjudicatorTestCaseMixin
+
+
+territories = [
+    {'id': 1, 'neighbours': [2, 3], 'shared_coasts': [2]},
+    {'id': 2, 'neighbours': [1, 3], 'shared_coasts': [1]},
+    {'id': 3, 'neighbours': [1, 2], 'shared_coasts': []},
+]
+named_coasts = [
+    {'id': 1, 'parent': 2, 'neighbours': [3]},
+]
+
+
+class TestMapGraph(unittest.TestCase):
+
+    def setUp(self):
+        self.map_graph = get_map_graph('test', territories, named_coasts)
+
+    def test_adjacency(self):
+        self.assertTrue(self.map_graph.adjacent(1, 2))
+        self.assertFalse(self.map_graph.adjacent(1, 1))
+        self.assertEqual(self.map_graph.neighbour_ids(3), (1, 2))
+
+    def test_shared_coasts(self):
+        self.assertTrue(self.map_graph.shares_coast(1, 2))
+        self.assertFalse(self.map_graph.shares_coast(1, 3))
+        self.assertEqual(self.map_graph.shared_coast_ids(3), ())
+
+    def test_coast_reaches(self):
+        self.assertTrue(self.map_graph.coast_reaches(1, 3))
+        self.assertFalse(self.map_graph.coast_reaches(1, 1))
+
+    def test_cached_per_variant(self):
+        self.assertIs(
+            get_map_graph('test', territories, named_coasts), self.map_graph
+        )
+        self.assertIsNot(
+            get_map_graph('other', territories, named_coasts), self.map_graph
+        )
+
+    def test_different_map_not_shared(self):
+        other_territories = [dict(t, shared_coasts=[]) for t in territories]
+        map_graph = get_map_graph('test', other_territories, named_coasts)
+        self.assertIsNot(map_graph, self.map_graph)
+        self.assertFalse(map_graph.shares_coast(1, 2))
+
+    def test_picklable(self):
+        map_graph = pickle.loads(pickle.dumps(self.map_graph))
+        self.assertTrue(map_graph.adjacent(1, 2))
+        self.assertTrue(map_graph.coast_reaches(1, 3))
+
+
+class TestMapGraphFromState(AdjudicatorTestCaseMixin, unittest.TestCase):
+
+    def test_compiled_from_registered_territories(self):
+        london = CoastalTerritory(self.state, 1, 'London', 'England', [2], [2])
+        wales = CoastalTerritory(self.state, 2, 'Wales', 'England', [1], [1])
+        self.assertTrue(london.adjacent_to(wales))
+        self.assertIsInstance(self.state.map_graph, MapGraph)
+
+        yorkshire = CoastalTerritory(self.state, 3, 'Yorkshire', 'England', [1], [1])
+        NamedCoast(self.state, 1, 'north coast', wales, [yorkshire])
+        self.assertTrue(self.state.map_graph.coast_reaches(1, 3))
+        self.assertFalse(london.adjacent_to(yorkshire))
+        self.assertEqual(yorkshire.neighbours, [london])
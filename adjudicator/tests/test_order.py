@@ -1,5 +1,5 @@
 import unittest
-from adjudicator.order import Hold
+from adjudicator.order import DummyHold, Hold, Move
 from adjudicator.piece import Army
 from adjudicator.territory import CoastalTerritory
 
@@ -32,3 +32,34 @@ class TestIsOrder(AdjudicatorTestCaseMixin, unittest.TestCase):
         self.assertFalse(london_hold.is_move)
         with self.assertRaises(AttributeError):
             london_hold.is_fake_class_name
+
+    def test_move(self):
+        london = CoastalTerritory(self.state, 1, 'London', 'England', [], [])
+        wales = CoastalTerritory(self.state, 2, 'Wales', 'England', [], [])
+        Army(self.state, 0, 'England', london)
+        london_move = Move(self.state, 0, 'England', london, wales)
+
+        self.assertTrue(london_move.is_move)
+        self.assertFalse(london_move.is_hold)
+        self.assertFalse(london_move.is_dummyhold)
+
+    def test_dummy_hold(self):
+        london = CoastalTerritory(self.state, 1, 'London', 'England', [], [])
+        Army(self.state, 0, 'England', london)
+        dummy_hold = DummyHold(self.state, 'England', london)
+
+        self.assertTrue(dummy_hold.is_dummyhold)
+        self.assertFalse(dummy_hold.is_hold)
+        self.assertFalse(dummy_hold.is_move)
+
+
+class TestSlots(AdjudicatorTestCaseMixin, unittest.TestCase):
+
+    def test_entities_have_no_instance_dict(self):
+        london = CoastalTerritory(self.state, 1, 'London', 'England', [], [])
+        wales = CoastalTerritory(self.state, 2, 'Wales', 'England', [], [])
+        army = Army(self.state, 0, 'England', london)
+        move = Move(self.state, 0, 'England', london, wales)
+        for entity in [london, army, move]:
+            with self.assertRaises(AttributeError):
+                entity.misspelled_attribute = True
@@ -0,0 +1,62 @@
+import unittest
+
+from adjudicator.decisions import Outcomes
+from adjudicator.order import Hold, Move, Support
+from adjudicator.piece import Army, Fleet
+from adjudicator.resolver import Resolver
+from adjudicator.tests.data import NamedCoasts, Nations, Territories
+
+from .base import AdjudicatorTestCaseMixin
+
+
+class TestResolver(AdjudicatorTestCaseMixin, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.territories = Territories(self.state)
+        self.named_coasts = NamedCoasts(self.state, self.territories)
+
+    def test_records_dependencies(self):
+        pieces = [
+            Army(self.state, 0, Nations.GERMANY, self.territories.SILESIA),
+            Army(self.state, 0, Nations.GERMANY, self.territories.PRUSSIA),
+            Army(self.state, 0, Nations.RUSSIA, self.territories.WARSAW),
+        ]
+        move = Move(self.state, 0, Nations.GERMANY, self.territories.PRUSSIA, self.territories.WARSAW)
+        support = Support(self.state, 0, Nations.GERMANY, self.territories.SILESIA, self.territories.PRUSSIA, self.territories.WARSAW)
+        hold = Hold(self.state, 0, Nations.RUSSIA, self.territories.WARSAW)
+        self.state.link()
+        for order in [move, support, hold]:
+            order.check_legal()
+
+        resolver = Resolver(self.state)
+        resolver.resolve([move, support, *pieces])
+
+        self.assertEqual(move.outcome, Outcomes.SUCCEEDS)
+        self.assertEqual(support.outcome, Outcomes.SUCCEEDS)
+        self.assertEqual(pieces[2].dislodged_decision, Outcomes.DISLODGED)
+        self.assertIn(support, resolver.dependents)
+        self.assertIn(move, resolver.dependents[support])
+        self.assertIsNone(self.state.resolver)
+
+    def test_resolves_circular_movement(self):
+        Fleet(self.state, 0, Nations.TURKEY, self.territories.ANKARA)
+        Army(self.state, 0, Nations.TURKEY, self.territories.CONSTANTINOPLE)
+        Army(self.state, 0, Nations.TURKEY, self.territories.SMYRNA)
+        orders = [
+            Move(self.state, 0, Nations.TURKEY, self.territories.ANKARA, self.territories.CONSTANTINOPLE),
+            Move(self.state, 0, Nations.TURKEY, self.territories.CONSTANTINOPLE, self.territories.SMYRNA),
+            Move(self.state, 0, Nations.TURKEY, self.territories.SMYRNA, self.territories.ANKARA),
+        ]
+        self.state.link()
+        for order in orders:
+            order.check_legal()
+
+        resolver = Resolver(self.state)
+        resolver.resolve([*orders, *self.state.pieces])
+
+        self.assertTrue(all(o.outcome == Outcomes.SUCCEEDS for o in orders))
+        self.assertTrue(all(
+            p.dislodged_decision == Outcomes.SUSTAINS
+            for p in self.state.pieces
+        ))
@@ -0,0 +1,122 @@
+import unittest
+
+from adjudicator.named_coast import NamedCoast
+from adjudicator.nation import Nation
+from adjudicator.order import DummyHold, Hold, Move, Retreat, Support
+from adjudicator.piece import Army, Fleet
+from adjudicator.territory import CoastalTerritory, InlandTerritory
+
+from .base import AdjudicatorTestCaseMixin
+
+
+class StateTestCase(AdjudicatorTestCaseMixin, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.london = CoastalTerritory(self.state, 1, 'London', 'England', [2], [2])
+        self.wales = CoastalTerritory(self.state, 2, 'Wales', 'England', [1], [1])
+        self.paris = InlandTerritory(self.state, 3, 'Paris', 'France', [])
+
+
+class TestRegister(StateTestCase):
+
+    def test_entities_registered_by_type(self):
+        army = Army(self.state, 1, 'England', self.london)
+        fleet = Fleet(self.state, 2, 'England', self.wales)
+        move = Move(self.state, 1, 'England', self.london, self.wales)
+        nation = Nation(self.state, 1, 'England')
+        self.assertEqual(
+            self.state.territories, [self.london, self.wales, self.paris]
+        )
+        self.assertEqual(self.state.pieces, [army, fleet])
+        self.assertEqual(self.state.orders, [move])
+        self.assertEqual(self.state.nations, [nation])
+        self.assertEqual(self.state.named_coasts, [])
+
+    def test_subclass_registered_once(self):
+        # `Move.__init__` and `Order.__init__` both register the instance
+        move = Move(self.state, 1, 'England', self.london, self.wales)
+        self.assertEqual(self.state.orders, [move])
+
+
+class TestLookups(StateTestCase):
+
+    def test_get_territory(self):
+        self.assertEqual(self.state.get_territory('Wales'), self.wales)
+        self.assertIsNone(self.state.get_territory('Berlin'))
+
+    def test_get_territory_by_id(self):
+        self.assertEqual(self.state.get_territory_by_id(3), self.paris)
+        self.assertIsNone(self.state.get_territory_by_id(4))
+
+    def test_get_named_coast_by_id(self):
+        named_coast = NamedCoast(self.state, 1, 'south coast', self.london, [2])
+        self.assertEqual(self.state.get_named_coast_by_id(1), named_coast)
+        self.assertEqual(
+            self.state.get_named_coasts_by_parent(self.london), [named_coast]
+        )
+        self.assertIsNone(self.state.get_named_coast_by_id(2))
+        self.assertEqual(self.state.get_named_coasts_by_parent(self.wales), [])
+
+    def test_get_orders_by_source(self):
+        hold = Hold(self.state, 1, 'England', self.london)
+        self.assertEqual(self.state.get_orders_by_source(self.london), [hold])
+        self.assertEqual(self.state.get_orders_by_source(self.wales), [])
+
+    def test_get_pieces_by_territory(self):
+        army = Army(self.state, 1, 'England', self.london)
+        retreating_army = Army(
+            self.state, 2, 'France', self.london, retreating=True
+        )
+        self.assertEqual(
+            self.state.get_pieces_by_territory(self.london),
+            [army, retreating_army]
+        )
+        self.assertEqual(self.state.get_pieces_by_territory(self.paris), [])
+
+
+class TestLink(StateTestCase):
+
+    def test_order_by_piece(self):
+        army = Army(self.state, 1, 'England', self.london)
+        move = Move(self.state, 1, 'England', self.london, self.wales)
+        self.assertEqual(army.order, move)
+
+    def test_dummy_hold_identity_stable(self):
+        army = Army(self.state, 1, 'England', self.london)
+        self.assertIsInstance(army.order, DummyHold)
+        self.assertIs(army.order, army.order)
+        self.state.link()
+        self.assertIs(army.order, army.order)
+
+    def test_dummy_hold_not_in_orders(self):
+        army = Army(self.state, 1, 'England', self.london)
+        army.order
+        self.assertEqual(self.state.orders, [])
+
+    def test_attacking_and_retreating_pieces(self):
+        army = Army(self.state, 1, 'England', self.london)
+        fleet = Fleet(self.state, 2, 'England', self.wales, retreating=True)
+        Move(self.state, 1, 'England', self.london, self.wales)
+        Retreat(self.state, 2, 'England', self.wales, self.london)
+        self.assertEqual(self.wales.attacking_pieces, [army])
+        self.assertEqual(self.london.attacking_pieces, [])
+        self.assertEqual(self.london.retreating_pieces, [fleet])
+
+    def test_supports(self):
+        Army(self.state, 1, 'England', self.london)
+        Army(self.state, 2, 'England', self.wales)
+        move = Move(self.state, 1, 'England', self.london, self.wales)
+        hold = Hold(self.state, 2, 'England', self.wales)
+        support = Support(
+            self.state, 3, 'England', self.paris, self.london, self.wales
+        )
+        self.assertEqual(move.move_support_orders, [support])
+        self.assertEqual(hold.hold_support_orders, [])
+
+    def test_relinked_after_register(self):
+        army = Army(self.state, 1, 'England', self.london)
+        self.assertIsInstance(army.order, DummyHold)
+        move = Move(self.state, 1, 'England', self.london, self.wales)
+        self.assertEqual(army.order, move)
+        self.assertEqual(self.wales.attacking_pieces, [army])
@@ -0,0 +1,75 @@
+import json
+import unittest
+
+from adjudicator.decisions import Outcomes
+from adjudicator.order import Move
+from adjudicator.piece import Army, Fleet
+from adjudicator.processor import process
+from adjudicator.tests.data import Nations, Territories
+from adjudicator.tracer import Tracer
+
+from .base import AdjudicatorTestCaseMixin
+
+
+class TestTracer(AdjudicatorTestCaseMixin, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.territories = Territories(self.state)
+        Fleet(self.state, 1, Nations.TURKEY, self.territories.ANKARA)
+        Army(self.state, 2, Nations.TURKEY, self.territories.CONSTANTINOPLE)
+        Army(self.state, 3, Nations.TURKEY, self.territories.SMYRNA)
+        self.orders = [
+            Move(self.state, 1, Nations.TURKEY, self.territories.ANKARA, self.territories.CONSTANTINOPLE),
+            Move(self.state, 2, Nations.TURKEY, self.territories.CONSTANTINOPLE, self.territories.SMYRNA),
+            Move(self.state, 3, Nations.TURKEY, self.territories.SMYRNA, self.territories.ANKARA),
+        ]
+
+    def test_circular_movement_traced(self):
+        tracer = Tracer()
+        process(self.state, tracer=tracer)
+
+        for order in self.orders:
+            self.assertEqual(order.outcome, Outcomes.SUCCEEDS)
+        self.assertIsNone(self.state.tracer)
+        self.assertEqual(
+            set(tracer.phases),
+            {'check_legal', 'resolution', 'bounces', 'retreats'},
+        )
+        self.assertGreater(tracer.seconds, 0)
+        self.assertEqual(len(tracer.circular_movements), 1)
+        self.assertEqual(
+            sorted(tracer.circular_movements[0]),
+            ['move 1 ankara', 'move 2 constantinople', 'move 3 smyrna'],
+        )
+        self.assertEqual(
+            sum(r['circular_movements'] for r in tracer.rounds),
+            1,
+        )
+        self.assertEqual(
+            sum(r['evaluations'] for r in tracer.rounds),
+            sum(tracer.evaluations.values()),
+        )
+        self.assertIn('move 1 ankara', tracer.evaluations)
+        self.assertIn('army 2 constantinople', tracer.evaluations)
+        self.assertIn('AttackStrength', tracer.decisions)
+        self.assertEqual(tracer.unresolved, [])
+
+    def test_to_json(self):
+        tracer = Tracer()
+        process(self.state, tracer=tracer)
+        data = json.loads(tracer.to_json())
+        self.assertEqual(data, json.loads(json.dumps(tracer.to_dict())))
+        self.assertEqual(
+            set(data),
+            {
+                'seconds', 'phases', 'rounds', 'evaluations', 'decisions',
+                'circular_movements', 'unresolved',
+            },
+        )
+
+    def test_untraced_outcomes_identical(self):
+        process(self.state)
+        self.assertIsNone(self.state.tracer)
+        for order in self.orders:
+            self.assertEqual(order.outcome, Outcomes.SUCCEEDS)
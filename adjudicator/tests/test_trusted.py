@@ -0,0 +1,45 @@
+import copy
+import json
+import os
+import unittest
+
+from marshmallow import ValidationError
+
+from adjudicator import process_game_state
+from adjudicator.schema import TurnSchema
+from adjudicator.trusted import load_turn
+
+TEST_JSON_DIR = os.path.join(os.path.dirname(__file__), 'test_json')
+
+
+def get_recorded_turns():
+    with open(os.path.join(TEST_JSON_DIR, 'game_1_turns.json')) as f:
+        return json.load(f)
+
+
+class TestTrusted(unittest.TestCase):
+
+    def setUp(self):
+        self.turns = get_recorded_turns()
+
+    def test_load_identical_to_schema(self):
+        for turn in self.turns:
+            self.assertEqual(load_turn(turn), TurnSchema().load(turn))
+
+    def test_output_identical_to_schema(self):
+        for turn in self.turns:
+            untrusted = process_game_state(copy.deepcopy(turn))
+            trusted = process_game_state(copy.deepcopy(turn), trusted=True)
+            self.assertEqual(json.dumps(trusted), json.dumps(untrusted))
+
+    def test_data_not_modified(self):
+        turn = self.turns[0]
+        data = copy.deepcopy(turn)
+        process_game_state(data, trusted=True)
+        self.assertEqual(data, turn)
+
+    def test_untrusted_data_validated(self):
+        turn = self.turns[0]
+        turn['orders'][0]['source'] = 999
+        with self.assertRaises(ValidationError):
+            process_game_state(turn)
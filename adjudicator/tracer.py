@@ -0,0 +1,91 @@
+"""
+Opt-in instrumentation of `process`. Pass a `Tracer` to `process` to record
+how a turn was resolved. When no tracer is given nothing is recorded and the
+only cost is a check for `None` at each point which would be traced.
+"""
+import json
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+
+def _label(unit):
+    """
+    A readable label for an order or piece. Ids are not unique in every
+    state, so the territory is included.
+    """
+    territory = getattr(unit, 'source', None) or unit.territory
+    return (
+        f'{type(unit).__name__.lower()} {unit.id} '
+        f'{territory.name or territory.id}'
+    )
+
+
+class Tracer:
+    """
+    Records how a turn was resolved.
+
+    Attributes:
+        * `seconds` - `float` - time spent in `process`.
+        * `phases` - `dict` - time spent in each phase of `process`, i.e.
+          checking legality, resolution, bounce detection and retreat checks.
+        * `rounds` - `list` of `dict` - for each round of the `Resolver`, the
+          number of units evaluated and the circular movements resolved once
+          the round's queue was exhausted.
+        * `evaluations` - `Counter` - the number of times each order and
+          piece was evaluated by the `Resolver`.
+        * `decisions` - `Counter` - the number of times each type of decision
+          was recalculated.
+        * `circular_movements` - `list` of the moves of each circular
+          movement which was resolved as successful.
+        * `unresolved` - `list` of the units the `Resolver` left unresolved.
+    """
+
+    def __init__(self):
+        self.seconds = 0
+        self.phases = {}
+        self.rounds = []
+        self.evaluations = Counter()
+        self.decisions = Counter()
+        self.circular_movements = []
+        self.unresolved = []
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.phases[name] = self.phases.get(name, 0) + elapsed
+
+    def start_round(self):
+        self.rounds.append({'evaluations': 0, 'circular_movements': 0})
+
+    def evaluation(self, unit):
+        self.evaluations[_label(unit)] += 1
+        self.rounds[-1]['evaluations'] += 1
+
+    def circular_movement(self, moves):
+        self.circular_movements.append([_label(m) for m in moves])
+        self.rounds[-1]['circular_movements'] += 1
+
+    def decision(self, decision):
+        self.decisions[type(decision).__name__] += 1
+
+    def unresolved_units(self, units):
+        self.unresolved = [_label(u) for u in units]
+
+    def to_dict(self):
+        return {
+            'seconds': self.seconds,
+            'phases': dict(self.phases),
+            'rounds': list(self.rounds),
+            'evaluations': dict(self.evaluations.most_common()),
+            'decisions': dict(self.decisions.most_common()),
+            'circular_movements': list(self.circular_movements),
+            'unresolved': list(self.unresolved),
+        }
+
+    def to_json(self, **kwargs):
+        return json.dumps(self.to_dict(), **kwargs)
@@ -0,0 +1,183 @@
+"""
+Loading and dumping of turn data without `marshmallow`. Used when the caller
+is trusted to provide data which is already valid, e.g. data serialized from
+our own database. The loaded and dumped data is identical to that of
+`TurnSchema`.
+"""
+from adjudicator.base import Variant
+
+
+def _id(value):
+    if value:
+        return value.id
+    return None
+
+
+def _int(value):
+    if value is None:
+        return None
+    return int(value)
+
+
+def _str(value):
+    if value is None:
+        return None
+    return str(value)
+
+
+def _bool(value):
+    if value is None:
+        return None
+    return bool(value)
+
+
+# Fields dumped by each schema, in the order they are declared on the schema,
+# with the function used to serialize the value.
+territory_fields = (
+    ('id', _int),
+    ('bounce_occurred', _bool),
+    ('captured_by', _int),
+)
+order_fields = (
+    ('id', _int),
+    ('type', _str),
+    ('illegal', _bool),
+    ('illegal_code', _str),
+    ('illegal_verbose', _str),
+    ('outcome', _str),
+)
+piece_fields = (
+    ('id', _int),
+    ('destroyed', _bool),
+    ('destroyed_message', _str),
+    ('dislodged', _bool),
+    ('dislodged_by', _id),
+    ('dislodged_from', _id),
+)
+nation_fields = (
+    ('id', _int),
+    ('next_turn_supply_delta', _int),
+    ('next_turn_supply_center_count', _int),
+    ('next_turn_piece_count', _int),
+)
+turn_fields = (
+    ('id', _int),
+    ('variant', _str),
+)
+next_turn_fields = (
+    ('next_season', _str),
+    ('next_phase', _str),
+    ('next_year', _int),
+)
+
+# Nation fields which are loaded by `NationSchema` when present.
+nation_load_fields = {
+    'id',
+    'name',
+    'next_turn_supply_delta',
+    'next_turn_supply_center_count',
+    'next_turn_piece_count',
+}
+
+_missing = object()
+
+
+def _dump(obj, fields):
+    # Like `marshmallow`, attributes which cannot be read are left out.
+    data = {}
+    for name, serialize in fields:
+        value = getattr(obj, name, _missing)
+        if value is not _missing:
+            data[name] = serialize(value)
+    return data
+
+
+def dump_turn(state):
+    """
+    Serialize a processed state.
+
+    Args:
+        * `state` - `State`
+
+    Returns:
+        * `dict` - identical to `TurnSchema().dump(state)`.
+    """
+    data = _dump(state, turn_fields)
+    data['territories'] = [_dump(t, territory_fields) for t in state.territories]
+    data['orders'] = [_dump(o, order_fields) for o in state.orders]
+    data['pieces'] = [_dump(p, piece_fields) for p in state.pieces]
+    data['nations'] = [_dump(n, nation_fields) for n in state.nations]
+    data.update(_dump(state, next_turn_fields))
+    return data
+
+
+def load_turn(data):
+    """
+    Load turn data without validating it. The given data is not modified.
+
+    Args:
+        * `data` - `dict`
+
+    Returns:
+        * `dict` - identical to `TurnSchema().load(data)` for valid data.
+    """
+    return {
+        'id': data['id'],
+        'phase': data['phase'],
+        'season': data['season'],
+        'year': data['year'],
+        'variant': data.get('variant', Variant.STANDARD),
+        'territories': [
+            {
+                'id': t['id'],
+                'type': t['type'],
+                'neighbours': t['neighbours'],
+                'shared_coasts': t.get('shared_coasts', []),
+                'nationality': t.get('nationality'),
+                'controlled_by': t.get('controlled_by'),
+                'contested': t.get('contested', False),
+                'name': t.get('name'),
+                'supply_center': t.get('supply_center', False),
+            }
+            for t in data['territories']
+        ],
+        'named_coasts': [
+            {
+                'id': n['id'],
+                'parent': n['parent'],
+                'neighbours': n['neighbours'],
+                'name': n.get('name'),
+            }
+            for n in data['named_coasts']
+        ],
+        'pieces': [
+            {
+                'id': p['id'],
+                'type': p['type'],
+                'nation': p['nation'],
+                'territory': p['territory'],
+                'named_coast': p.get('named_coast'),
+                'retreating': p.get('retreating', False),
+                'attacker_territory': p.get('attacker_territory'),
+            }
+            for p in data['pieces']
+        ],
+        'orders': [
+            {
+                'id': o['id'],
+                'type': o['type'],
+                'nation': o['nation'],
+                'source': o['source'],
+                'target': o.get('target'),
+                'aux': o.get('aux'),
+                'target_coast': o.get('target_coast'),
+                'via_convoy': o.get('via_convoy', False),
+                'piece_type': o.get('piece_type'),
+            }
+            for o in data['orders']
+        ],
+        'nations': [
+            {k: v for k, v in n.items() if k in nation_load_fields}
+            for n in data['nations']
+        ],
+    }
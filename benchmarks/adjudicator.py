@@ -0,0 +1,271 @@
+"""
+Measure the speed of `adjudicator.process` over the DATC cases, the turns of
+recorded games and synthetic large boards.
+
+For each scenario the wall time of `process` is measured over `--repeat`
+runs. A fresh state is built before each run and building it is not timed.
+The number of orders and pieces evaluated by the `Resolver`, the number of
+decisions recalculated and the peak memory allocated while processing are
+measured in separate runs, so the instrumentation does not affect the
+timings. So is the memory held by the processed state, i.e. by the entities
+of the turn.
+
+Results can be written to JSON with `--output` and compared with the results
+of another commit with `--compare`.
+
+Usage:
+    python -m benchmarks.adjudicator [--suite datc|recorded|synthetic]
+        [--repeat N] [--filter TEXT] [--output FILE] [--compare FILE]
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+from adjudicator.processor import process
+from adjudicator.tracer import Tracer
+
+from benchmarks.scenarios import get_scenarios
+
+SUITES = ('datc', 'recorded', 'synthetic')
+
+
+def percentile(values, percent):
+    """
+    The nearest-rank percentile of `values`.
+    """
+    values = sorted(values)
+    index = max(0, -(-len(values) * percent // 100) - 1)
+    return values[int(index)]
+
+
+def trace(state):
+    """
+    Process the state with a `Tracer` and return the tracer.
+    """
+    tracer = Tracer()
+    process(state, tracer=tracer)
+    return tracer
+
+
+def measure_peak_memory(state):
+    """
+    Process the state and return the peak memory allocated in bytes.
+    """
+    tracemalloc.start()
+    try:
+        process(state)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def measure_state_memory(scenario):
+    """
+    Build and process the state and return the memory it holds in bytes,
+    i.e. the memory of the entities of a turn once it has been processed.
+    """
+    tracemalloc.start()
+    try:
+        state = scenario.build_state()
+        process(state)
+        return tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def run_scenario(scenario, repeat):
+    times = []
+    for _ in range(repeat):
+        state = scenario.build_state()
+        start = time.perf_counter()
+        process(state)
+        times.append(time.perf_counter() - start)
+    state = scenario.build_state()
+    num_pieces = len(state.pieces)
+    num_orders = len(state.orders)
+    tracer = trace(state)
+    return {
+        'name': scenario.name,
+        'pieces': num_pieces,
+        'orders': num_orders,
+        'repeat': repeat,
+        'total': sum(times),
+        'min': min(times),
+        'p50': percentile(times, 50),
+        'p95': percentile(times, 95),
+        'evaluations': sum(tracer.evaluations.values()),
+        'decisions': sum(tracer.decisions.values()),
+        'rounds': len(tracer.rounds),
+        'peak_memory': measure_peak_memory(scenario.build_state()),
+        'state_memory': measure_state_memory(scenario),
+    }
+
+
+def run(suites=SUITES, repeat=20, name_filter=None, synthetic_sizes=None,
+        write=None):
+    """
+    Run the benchmarks.
+
+    Args:
+        * `suites` - iterable of suite names. See `SUITES`.
+        * `repeat` - `int` - the number of timed runs of each scenario.
+        * `name_filter` - `str` - only run scenarios whose name contains
+          this text.
+        * `synthetic_sizes` - iterable of the numbers of pieces of the
+          synthetic boards.
+        * `write` - function called with a line of output for each scenario.
+
+    Returns:
+        * `dict` - the environment and the results of each scenario.
+    """
+    kwargs = {}
+    if synthetic_sizes:
+        kwargs['synthetic_sizes'] = synthetic_sizes
+    scenarios = [
+        s for s in get_scenarios(suites, **kwargs)
+        if not name_filter or name_filter in s.name
+    ]
+    results = []
+    for scenario in scenarios:
+        result = run_scenario(scenario, repeat)
+        results.append(result)
+        if write:
+            write(format_result(result))
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': repeat,
+        'scenarios': results,
+        'summary': summarize(results),
+    }
+
+
+def summarize(results):
+    """
+    Totals of the p50 time and evaluations of the scenarios in each suite.
+    """
+    summary = {}
+    for result in results:
+        suite = result['name'].split('.', 1)[0]
+        totals = summary.setdefault(
+            suite,
+            {'scenarios': 0, 'p50': 0, 'evaluations': 0, 'state_memory': 0},
+        )
+        totals['scenarios'] += 1
+        totals['p50'] += result['p50']
+        totals['evaluations'] += result['evaluations']
+        totals['state_memory'] += result['state_memory']
+    return summary
+
+
+def format_result(result):
+    return (
+        f'{result["name"]:<80} '
+        f'p50 {result["p50"] * 1000:8.3f} ms  '
+        f'p95 {result["p95"] * 1000:8.3f} ms  '
+        f'{result["evaluations"]:6d} evaluations  '
+        f'{result["peak_memory"] / 1024:8.1f} KiB peak  '
+        f'{result["state_memory"] / 1024:8.1f} KiB state'
+    )
+
+
+def compare(results, baseline):
+    """
+    Compare the p50 time of each scenario with a baseline.
+
+    Returns:
+        * `list` of lines describing each scenario present in both results.
+    """
+    baseline_p50 = {s['name']: s['p50'] for s in baseline['scenarios']}
+    lines = []
+    for result in results['scenarios']:
+        before = baseline_p50.get(result['name'])
+        if not before:
+            continue
+        change = (result['p50'] - before) / before * 100
+        lines.append(
+            f'{result["name"]:<80} '
+            f'{before * 1000:8.3f} -> {result["p50"] * 1000:8.3f} ms '
+            f'({change:+.1f}%)'
+        )
+    return lines
+
+
+def add_arguments(parser):
+    parser.add_argument(
+        '--suite',
+        action='append',
+        choices=SUITES,
+        help='The suites to run. Defaults to every suite.',
+    )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=20,
+        help='The number of timed runs of each scenario. Defaults to 20.',
+    )
+    parser.add_argument(
+        '--filter',
+        help='Only run scenarios whose name contains this text.',
+    )
+    parser.add_argument(
+        '--synthetic-sizes',
+        type=int,
+        nargs='+',
+        help='The numbers of pieces of the synthetic boards.',
+    )
+    parser.add_argument(
+        '--output',
+        help='Write the results to this JSON file.',
+    )
+    parser.add_argument(
+        '--compare',
+        help='Compare the results with a JSON file written by --output.',
+    )
+
+
+def handle(options, write):
+    """
+    Run the benchmarks for the parsed command line options.
+    """
+    results = run(
+        suites=options['suite'] or SUITES,
+        repeat=options['repeat'],
+        name_filter=options['filter'],
+        synthetic_sizes=options['synthetic_sizes'],
+        write=write,
+    )
+    for suite, totals in results['summary'].items():
+        write(
+            f'{suite}: {totals["scenarios"]} scenarios, '
+            f'{totals["p50"] * 1000:.3f} ms, '
+            f'{totals["evaluations"]} evaluations, '
+            f'{totals["state_memory"] / totals["scenarios"] / 1024:.1f} KiB '
+            f'state per turn'
+        )
+    if options['output']:
+        with open(options['output'], 'w') as f:
+            json.dump(results, f, indent=2)
+    if options['compare']:
+        with open(options['compare']) as f:
+            baseline = json.load(f)
+        for line in compare(results, baseline):
+            write(line)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    add_arguments(parser)
+    args = parser.parse_args(argv)
+    handle(vars(args), print)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,173 @@
+"""
+Compare the ways of rendering a `GameStateSerializer` payload with camelCase
+keys. The payload has the fields of the service serializers and the
+territories, pieces and orders of the recorded turns of a real game.
+
+Usage:
+    python -m benchmarks.case_transform [--repeat N] [--turns N]
+"""
+import argparse
+import os
+import timeit
+
+import django
+
+from benchmarks.process_game_state import get_recorded_turns
+
+
+def legacy_deep_case_transform(data, to_case_func):
+    """
+    The recursive transform used before keys were memoized, for comparison.
+    """
+    transformed_data = {}
+
+    if data is None:
+        return
+
+    if isinstance(data, list):
+        new_data = []
+        for obj in data:
+            if isinstance(obj, dict):
+                new_data.append(legacy_deep_case_transform(obj, to_case_func))
+            else:
+                new_data.append(obj)
+
+        return new_data
+
+    for key, value in data.items():
+        transformed_key = to_case_func(key)
+        if not isinstance(value, dict) and not isinstance(value, list):
+            transformed_data[transformed_key] = value
+
+        if isinstance(value, list):
+            new_value = []
+            for obj in value:
+                if isinstance(obj, dict):
+                    new_value.append(
+                        legacy_deep_case_transform(obj, to_case_func)
+                    )
+                else:
+                    new_value.append(obj)
+
+            transformed_data[transformed_key] = new_value
+
+        if isinstance(value, dict):
+            transformed_data[transformed_key] = legacy_deep_case_transform(
+                value, to_case_func,
+            )
+
+    return transformed_data
+
+
+def legacy_to_camel_case(snake_case_str):
+    components = snake_case_str.split('_')
+    titled_components = ''.join(x.title() for x in components[1:])
+    return f'{components[0]}{titled_components}'
+
+
+def item(serializer_class, **values):
+    # Every field of the serializer is present, as in the real payload.
+    return {name: values.get(name) for name in serializer_class().fields}
+
+
+def build_payload(num_turns):
+    from service import serializers
+
+    recorded_turns = get_recorded_turns()
+    turns = []
+    for i in range(num_turns):
+        turn = recorded_turns[i % len(recorded_turns)]
+        turns.append(item(
+            serializers.TurnSerializer,
+            id=i,
+            year=turn['year'],
+            season=turn['season'],
+            phase=turn['phase'],
+            territory_states=[
+                item(
+                    serializers.TerritoryStateSerializer,
+                    id=t['id'],
+                    territory=t['id'],
+                    controlled_by=t['controlled_by'],
+                )
+                for t in turn['territories']
+            ],
+            piece_states=[
+                item(
+                    serializers.PieceStateSerializer,
+                    id=p['id'],
+                    piece=p['id'],
+                    territory=p['territory'],
+                    must_retreat=p['retreating'],
+                )
+                for p in turn['pieces']
+            ],
+            nation_states=[
+                item(
+                    serializers.PublicNationStateSerializer,
+                    id=n['id'],
+                    nation=n['id'],
+                    surrenders=[],
+                )
+                for n in turn['nations']
+            ],
+            orders=[
+                item(serializers.OrderSerializer, **o)
+                for o in turn['orders']
+            ],
+            draws=[],
+        ))
+    pieces = [
+        item(serializers.PieceSerializer, **p)
+        for p in recorded_turns[0]['pieces']
+    ]
+    return item(
+        serializers.GameStateSerializer,
+        id=1,
+        name='Benchmark game',
+        turns=turns,
+        pieces=pieces,
+        participants=[
+            item(serializers.UserSerializer, id=i, username=f'user{i}')
+            for i in range(7)
+        ],
+    )
+
+
+def run(func, repeat):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--turns', type=int, default=60)
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'project.settings.test')
+    django.setup()
+    from service.renderers import CamelCaseRenderer
+    from service.utils.cases import deep_camel_case_transform, to_camel_case
+
+    payload = build_payload(args.turns)
+
+    def transform_cold():
+        to_camel_case.cache_clear()
+        deep_camel_case_transform(payload)
+
+    results = {
+        'legacy transform': lambda: legacy_deep_case_transform(
+            payload, legacy_to_camel_case,
+        ),
+        'transform (cold)': transform_cold,
+        'transform': lambda: deep_camel_case_transform(payload),
+        'render': lambda: CamelCaseRenderer().render(payload),
+    }
+    for name, func in results.items():
+        seconds = run(func, args.repeat)
+        print(f'{name:<20} {seconds * 1000:8.3f} ms')
+    print(f'{args.turns} turns')
+
+
+if __name__ == '__main__':
+    main()
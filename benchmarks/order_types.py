@@ -0,0 +1,123 @@
+"""
+Compare the cost of the `order.is_<type>` checks when they are class
+attributes with the `Order.__getattr__` lookup used before, which scanned the
+subclasses of `Order` on every check. Both the checks alone and `process` are
+timed over the DATC scenarios of sections D and E.
+
+Usage:
+    python -m benchmarks.order_types [--repeat N]
+"""
+import argparse
+import time
+import timeit
+from contextlib import contextmanager
+
+from adjudicator import order
+from adjudicator.processor import process
+
+from benchmarks.scenarios import datc_scenarios
+
+MODULES = ('datc.test_d.', 'datc.test_e.')
+ORDER_TYPES = [
+    order.DummyHold, order.Hold, order.Move, order.Support, order.Convoy,
+    order.Retreat, order.Build, order.Disband,
+]
+FLAGS = [f'is_{t.__name__.lower()}' for t in ORDER_TYPES]
+
+
+def legacy_getattr(self, name):
+    subclasses = order.Order.__subclasses__()
+    for s in subclasses:
+        if name == 'is_' + s.__name__.lower():
+            return isinstance(self, s)
+    raise AttributeError(
+        f'{self.__class__.__name__} has no attribute \'{name}\'.'
+    )
+
+
+@contextmanager
+def legacy_order_types():
+    """
+    Replace the class attributes with the `__getattr__` lookup.
+    """
+    saved = {}
+    for cls in [order.Order, *ORDER_TYPES]:
+        for flag in FLAGS:
+            if flag in vars(cls):
+                saved[cls, flag] = vars(cls)[flag]
+                delattr(cls, flag)
+    order.Order.__getattr__ = legacy_getattr
+    try:
+        yield
+    finally:
+        del order.Order.__getattr__
+        for (cls, flag), value in saved.items():
+            setattr(cls, flag, value)
+
+
+@contextmanager
+def class_attribute_order_types():
+    yield
+
+
+def check_types(states):
+    for state in states:
+        for o in state.orders:
+            for flag in FLAGS:
+                getattr(o, flag)
+
+
+def time_process(scenarios, repeat):
+    """
+    The least time to process every scenario. Building the states is not
+    timed.
+    """
+    times = []
+    for _ in range(repeat):
+        states = [s.build_state() for s in scenarios]
+        start = time.perf_counter()
+        for state in states:
+            process(state)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def run(scenarios, repeat):
+    states = [s.build_state() for s in scenarios]
+    results = {}
+    for mode, context in [
+        ('__getattr__', legacy_order_types),
+        ('class attributes', class_attribute_order_types),
+    ]:
+        with context():
+            results[mode] = {
+                'checks': min(timeit.repeat(
+                    lambda: check_types(states), number=1, repeat=repeat,
+                )),
+                'process': time_process(scenarios, repeat),
+            }
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args(argv)
+
+    scenarios = [
+        s for s in datc_scenarios() if s.name.startswith(MODULES)
+    ]
+    results = run(scenarios, args.repeat)
+    for mode, times in results.items():
+        print(
+            f'{mode:<20} checks {times["checks"] * 1000:8.3f} ms  '
+            f'process {times["process"] * 1000:8.3f} ms'
+        )
+    print(f'{len(scenarios)} scenarios')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""
+Compare `process_game_state` with and without `trusted=True` using the
+recorded turns of a real game.
+
+Usage:
+    python -m benchmarks.process_game_state [--repeat N]
+"""
+import argparse
+import copy
+import json
+import os
+import timeit
+
+from adjudicator import process_game_state
+
+RECORDED_TURNS = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'adjudicator', 'tests', 'test_json', 'game_1_turns.json',
+)
+
+
+def get_recorded_turns():
+    with open(RECORDED_TURNS) as f:
+        return json.load(f)
+
+
+def run(turns, repeat, trusted):
+    # Copies are made up front so that only processing is timed.
+    batches = [copy.deepcopy(turns) for _ in range(repeat)]
+
+    def process_batch():
+        for turn in batches.pop():
+            process_game_state(turn, trusted=trusted)
+
+    seconds = timeit.timeit(process_batch, number=repeat)
+    return seconds / (repeat * len(turns))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args(argv)
+
+    turns = get_recorded_turns()
+    results = {
+        'validated': run(turns, args.repeat, trusted=False),
+        'trusted': run(turns, args.repeat, trusted=True),
+    }
+    for mode, seconds in results.items():
+        print(f'{mode:<10} {seconds * 1000:8.3f} ms per turn')
+    speedup = results['validated'] / results['trusted']
+    print(f'trusted is {speedup:.2f}x faster over {len(turns)} turns')
+
+
+if __name__ == '__main__':
+    main()
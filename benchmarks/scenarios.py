@@ -0,0 +1,259 @@
+"""
+Scenarios replayed by `benchmarks.adjudicator`. Each scenario has a name and
+a function which builds a fresh, unprocessed `State` each time it is called,
+because processing a state changes it.
+"""
+import importlib
+import inspect
+import json
+import math
+import os
+import random
+import unittest
+from collections import namedtuple
+from unittest.mock import patch
+
+from adjudicator import load_state
+from adjudicator.processor import process
+
+Scenario = namedtuple('Scenario', ['name', 'build_state'])
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATC_MODULES = [
+    f'adjudicator.tests.datc.test_{letter}' for letter in 'abcdefghi'
+]
+RECORDED_GAMES = {
+    'game_1': os.path.join(
+        BASE_DIR, 'adjudicator', 'tests', 'test_json', 'game_1_turns.json',
+    ),
+}
+
+
+class _Captured(Exception):
+    pass
+
+
+def _capture_datc_state(test_class, method_name):
+    """
+    Run a DATC test up to its call to `process` and return the state which
+    it passes to `process`. Returns `None` for skipped tests.
+    """
+    module = importlib.import_module(test_class.__module__)
+    captured = []
+
+    def capture(state):
+        captured.append(state)
+        raise _Captured
+
+    test = test_class(method_name)
+    with patch.object(module, 'process', capture):
+        try:
+            test.setUp()
+            getattr(test, method_name)()
+        except (_Captured, unittest.SkipTest):
+            pass
+    return captured[0] if captured else None
+
+
+def datc_scenarios():
+    """
+    A scenario for every DATC test which calls `process`. Tests which expect
+    `process` to raise an exception are left out.
+    """
+    scenarios = []
+    loader = unittest.TestLoader()
+    for module_name in DATC_MODULES:
+        module = importlib.import_module(module_name)
+        test_classes = [
+            obj for _, obj in inspect.getmembers(module, inspect.isclass)
+            if issubclass(obj, unittest.TestCase)
+            and obj.__module__ == module_name
+        ]
+        for test_class in test_classes:
+            for method_name in loader.getTestCaseNames(test_class):
+                state = _capture_datc_state(test_class, method_name)
+                if state is None:
+                    continue
+                try:
+                    process(state)
+                except Exception:
+                    continue
+                name = '.'.join([
+                    'datc',
+                    module_name.rsplit('.', 1)[-1],
+                    test_class.__name__,
+                    method_name,
+                ])
+                scenarios.append(Scenario(
+                    name,
+                    lambda c=test_class, m=method_name:
+                        _capture_datc_state(c, m),
+                ))
+    return scenarios
+
+
+def recorded_scenarios():
+    """
+    A scenario for every turn of the recorded games.
+    """
+    scenarios = []
+    for game, path in RECORDED_GAMES.items():
+        with open(path) as f:
+            turns = json.load(f)
+        for i, turn in enumerate(turns):
+            name = '.'.join([
+                'recorded',
+                game,
+                f'{i + 1:02d}_{turn["season"]}_{turn["year"]}_{turn["phase"]}',
+            ])
+            # `load_state` does not modify the data so it can be reused.
+            scenarios.append(Scenario(
+                name,
+                lambda t=turn: load_state(t, trusted=True),
+            ))
+    return scenarios
+
+
+def synthetic_turn(num_pieces, num_nations=7, seed=0):
+    """
+    Generate the data of a spring order turn with `num_pieces` pieces on a
+    grid map scaled so that half of the territories are occupied. Every
+    fifth column of the grid is sea. Each piece holds, moves to a random
+    neighbour or supports a neighbouring piece.
+
+    Returns:
+        * `dict` - turn data in the format of `TurnSchema`.
+    """
+    rng = random.Random(seed)
+    size = math.ceil(math.sqrt(num_pieces * 2))
+
+    def territory_id(row, column):
+        return row * size + column + 1
+
+    def is_sea(territory):
+        return (territory - 1) % size % 5 == 4
+
+    territories = []
+    for row in range(size):
+        for column in range(size):
+            id = territory_id(row, column)
+            neighbours = [
+                territory_id(r, c)
+                for r, c in [
+                    (row - 1, column),
+                    (row + 1, column),
+                    (row, column - 1),
+                    (row, column + 1),
+                ]
+                if 0 <= r < size and 0 <= c < size
+            ]
+            nationality = rng.randint(1, num_nations)
+            territories.append({
+                'id': id,
+                'type': 'sea' if is_sea(id) else 'inland',
+                'name': f'Territory {id}',
+                'neighbours': neighbours,
+                'shared_coasts': [],
+                'nationality': None if is_sea(id) else nationality,
+                'controlled_by': None if is_sea(id) else nationality,
+                'supply_center': not is_sea(id) and rng.random() < 0.3,
+            })
+    neighbours = {t['id']: t['neighbours'] for t in territories}
+
+    pieces = []
+    piece_by_territory = {}
+    occupied = rng.sample(range(1, size * size + 1), num_pieces)
+    for id, territory in enumerate(occupied, 1):
+        piece = {
+            'id': id,
+            'type': 'fleet' if is_sea(territory) else 'army',
+            'nation': rng.randint(1, num_nations),
+            'territory': territory,
+        }
+        pieces.append(piece)
+        piece_by_territory[territory] = piece
+
+    def reachable(territory, target):
+        return target in neighbours[territory] \
+            and is_sea(territory) == is_sea(target)
+
+    orders = {}
+    for piece in pieces:
+        source = piece['territory']
+        targets = [t for t in neighbours[source] if reachable(source, t)]
+        order = {'type': 'hold', 'target': None, 'aux': None}
+        if targets and rng.random() < 0.6:
+            order = {'type': 'move', 'target': rng.choice(targets)}
+        orders[source] = order
+    for piece in pieces:
+        source = piece['territory']
+        supportable = [
+            t for t in neighbours[source]
+            if t in piece_by_territory and orders[t]['type'] != 'support'
+        ]
+        if not supportable or rng.random() < 0.6:
+            continue
+        aux = rng.choice(supportable)
+        target = orders[aux].get('target')
+        if target is None or not reachable(source, target):
+            target = aux
+        orders[source] = {'type': 'support', 'aux': aux, 'target': target}
+
+    return {
+        'id': 1,
+        'variant': f'synthetic-{num_pieces}',
+        'season': 'spring',
+        'phase': 'order',
+        'year': 1901,
+        'territories': territories,
+        'named_coasts': [],
+        'nations': [
+            {'id': id, 'name': f'Nation {id}'}
+            for id in range(1, num_nations + 1)
+        ],
+        'pieces': pieces,
+        'orders': [
+            {
+                'id': piece['id'],
+                'nation': piece['nation'],
+                'source': piece['territory'],
+                'target': None,
+                'aux': None,
+                **orders[piece['territory']],
+            }
+            for piece in pieces
+        ],
+    }
+
+
+def synthetic_scenarios(sizes=(50, 100, 200)):
+    """
+    A scenario for a synthetic turn of each number of pieces.
+    """
+    scenarios = []
+    for num_pieces in sizes:
+        turn = synthetic_turn(num_pieces)
+        scenarios.append(Scenario(
+            f'synthetic.{num_pieces}_pieces',
+            lambda t=turn: load_state(t, trusted=True),
+        ))
+    return scenarios
+
+
+def get_scenarios(suites, synthetic_sizes=(50, 100, 200)):
+    """
+    Args:
+        * `suites` - iterable of `'datc'`, `'recorded'` and `'synthetic'`.
+        * `synthetic_sizes` - the numbers of pieces of the synthetic turns.
+
+    Returns:
+        * `list` of `Scenario`
+    """
+    scenarios = []
+    if 'datc' in suites:
+        scenarios.extend(datc_scenarios())
+    if 'recorded' in suites:
+        scenarios.extend(recorded_scenarios())
+    if 'synthetic' in suites:
+        scenarios.extend(synthetic_scenarios(synthetic_sizes))
+    return scenarios
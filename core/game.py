@@ -2,11 +2,18 @@
 Functions relating to processing and updating the game. Interacts with
 the `adjudicator` module.
 """
-from adjudicator import process_game_state
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from adjudicator import Tracer, adjudicate_many, process_game_state
 
 from core import models
-from core.models.base import DrawStatus, OrderType, OutcomeType, Phase
-from core.serializers import TurnSerializer
+from core.models.base import DrawStatus, OrderType, OutcomeType, Phase, \
+    SurrenderStatus
+from core.signals import turn_processed
+from core.turn_data import get_turn_data
 
 
 def process_turn(turn):
@@ -15,8 +22,24 @@ def process_turn(turn):
     the turn the adjudicator. Update the turn based on the adjudicator
     response.
     """
-    turn_data = TurnSerializer(turn).data
-    outcome = process_game_state(turn_data)
+    turn_data = get_turn_data(turn)
+    threshold = settings.SLOW_TURN_TRACE_SECONDS
+    tracer = Tracer() if threshold is not None else None
+    outcome = process_game_state(turn_data, trusted=True, tracer=tracer)
+    if tracer and tracer.seconds >= threshold:
+        turn.trace = tracer.to_dict()
+        turn.save(update_fields=['trace'])
+    return apply_outcome(turn, outcome)
+
+
+def apply_outcome(turn, outcome):
+    """
+    Update the turn based on the `adjudicator` response, create the next turn
+    and check whether the game has been won.
+
+    Returns:
+        * `Turn` - the new turn.
+    """
     updated_turn = update_turn(turn, outcome)
 
     new_turn = create_turn_from_previous_turn(updated_turn)
@@ -24,26 +47,214 @@ def process_turn(turn):
     winning_nation = new_turn.check_for_winning_nation()
     if winning_nation:
         turn.game.set_winner(winning_nation)
+    turn_processed.send(sender=models.Turn, turn=turn)
     return new_turn
 
 
+def process_due_turns(workers=None, timeout=None, batch_size=100):
+    """
+    Process every turn whose `TurnEnd` has passed. Turns are adjudicated in
+    parallel over a process pool and the outcome of each turn is saved in its
+    own transaction, so a turn which fails does not affect the other games.
+    Must not be called inside a transaction.
+
+    Failures are recorded on the turn. A failed turn is not claimed again
+    until the run is over.
+
+    Args:
+        * `workers` - `int` - The number of adjudicator processes. Defaults to
+          the number of CPUs. When `1` turns are adjudicated in this process.
+        * `timeout` - `float` - The number of seconds to wait for the result
+          of each turn once the previous turns have been saved. A turn starts
+          to be adjudicated as soon as a worker is free, so this bounds how
+          long the run is blocked on one turn rather than how long the turn
+          takes to adjudicate. Turns which time out fail. Defaults to no
+          limit. See `adjudicator.batch.adjudicate_many`.
+        * `batch_size` - `int` - The number of turns claimed at a time.
+
+    Returns:
+        * `tuple` - the number of turns processed and the number of turns
+          which failed.
+    """
+    now = timezone.now()
+    num_processed = 0
+    failed = []
+    try:
+        while True:
+            with transaction.atomic():
+                turn_ends = models.TurnEnd.objects.claim_due(batch_size, now)
+                turns = [
+                    turn_end.turn for turn_end in turn_ends
+                    if turn_end.turn.claim_processing()
+                ]
+            turns_data = [get_turn_data(turn) for turn in turns]
+            if workers != 1:
+                # Worker processes are forked and must not share the
+                # database connections of this process.
+                connections.close_all()
+            results = adjudicate_many(
+                turns_data,
+                workers=workers,
+                chunk_size=1,
+                timeout=timeout,
+                trusted=True,
+            )
+            for turn, result in zip(turns, results):
+                try:
+                    if result.error:
+                        raise result.error
+                    save_outcome(turn, result.data)
+                except Exception as exc:
+                    # The turn stays claimed until the run is over so
+                    # that it is not claimed again by the next batch.
+                    record_processing_failure(turn.id, exc, processing=True)
+                    failed.append(turn.id)
+                else:
+                    num_processed += 1
+            if len(turn_ends) < batch_size:
+                return num_processed, len(failed)
+    finally:
+        models.Turn.objects.filter(id__in=failed).update(processing=False)
+
+
+def save_outcome(turn, outcome):
+    """
+    Apply the `adjudicator` response to the turn in a single transaction. The
+    turn is locked and is skipped if it has already been processed.
+    """
+    with transaction.atomic():
+        turn = models.Turn.objects.select_for_update().get(id=turn.id)
+        if not turn.processed:
+            apply_outcome(turn, outcome)
+        models.TurnEnd.objects.filter(turn=turn).delete()
+
+
+def record_processing_failure(turn_id, exc, processing=False):
+    """
+    Record a failed attempt to process the turn.
+
+    Args:
+        * `turn_id` - `int` - Turn ID
+        * `exc` - `Exception` - The reason the attempt failed.
+        * `processing` - `bool` - Whether the turn is still being processed,
+          i.e. whether the attempt will be retried.
+    """
+    fields = {}
+    if processing:
+        # The turn is not treated as stalled while it waits to be retried.
+        fields['processing_started_at'] = timezone.now()
+    models.Turn.objects.filter(id=turn_id).update(
+        processing_attempts=F('processing_attempts') + 1,
+        processing_error=repr(exc),
+        processing=processing,
+        **fields,
+    )
+
+
+# Fields of each `adjudicator` response item mapped to the model fields they
+# update.
+order_outcome_fields = {
+    'illegal': 'illegal',
+    'illegal_code': 'illegal_code',
+    'illegal_verbose': 'illegal_verbose',
+    'outcome': 'outcome',
+}
+piece_state_outcome_fields = {
+    'destroyed': 'destroyed',
+    'destroyed_message': 'destroyed_message',
+    'dislodged': 'dislodged',
+    'dislodged_by': 'dislodged_by_id',
+    'dislodged_from': 'dislodged_from_id',
+}
+territory_state_outcome_fields = {
+    'bounce_occurred': 'bounce_occurred',
+    'captured_by': 'captured_by_id',
+}
+turn_outcome_fields = ['next_season', 'next_phase', 'next_year']
+
+
 def update_turn(turn, data):
     """
-    Deserialize the `adjudicator` response and update the turn based on the
-    response data.
+    Update the turn and its orders, piece states, and territory states based
+    on the `adjudicator` response. Each model is updated in bulk and all
+    updates happen in a single transaction.
     """
-    # Deserialize data - updates piece states, territory states, and orders
-    serializer = TurnSerializer(instance=turn, data=data)
-    serializer.is_valid(raise_exception=True)
-    instance = serializer.save()
+    with transaction.atomic():
+        update_fields = ['processed', 'processed_at']
+        turn.processed = True
+        turn.processed_at = timezone.now()
+        for field in turn_outcome_fields:
+            if field in data:
+                setattr(turn, field, data[field])
+                update_fields.append(field)
+        turn.save(update_fields=update_fields)
 
-    # Additional updates to the turn that aren't handled during deserialization
-    destroy_pieces(turn)
-    if turn.phase in [Phase.RETREAT_AND_DISBAND, Phase.BUILD]:
-        disband_pieces(turn)
-    if turn.phase == Phase.BUILD:
-        create_new_pieces(turn)
-    return instance
+        # Piece states and orders are identified by their own id. Territory
+        # states are identified by the id of their territory.
+        bulk_update_from_data(
+            turn.orders.all(),
+            'id',
+            data.get('orders', []),
+            order_outcome_fields,
+        )
+        bulk_update_from_data(
+            turn.piecestates.all(),
+            'id',
+            data.get('pieces', []),
+            piece_state_outcome_fields,
+        )
+        bulk_update_from_data(
+            turn.territorystates.all(),
+            'territory_id',
+            data.get('territories', []),
+            territory_state_outcome_fields,
+        )
+
+        # Additional updates to the turn that depend on the outcome
+        destroy_pieces(turn)
+        if turn.phase in [Phase.RETREAT_AND_DISBAND, Phase.BUILD]:
+            disband_pieces(turn)
+        if turn.phase == Phase.BUILD:
+            create_new_pieces(turn)
+    return turn
+
+
+def bulk_update_from_data(queryset, key, items, fields):
+    """
+    Update the instances in `queryset` from a list of response items using a
+    single `bulk_update`. Only the fields present in the items are updated.
+
+    Args:
+        * `queryset` - `QuerySet` of the instances which can be updated.
+        * `key` - `str` - attribute of each instance which corresponds to the
+          `id` of a response item.
+        * `items` - `list` of `dict`
+        * `fields` - `dict` - response item keys mapped to model fields.
+
+    Returns:
+        * `list` of updated instances.
+    """
+    if not items:
+        return []
+    model = queryset.model
+    instances = {getattr(i, key): i for i in queryset}
+    updated_instances = []
+    updated_fields = set()
+    for item in items:
+        try:
+            instance = instances[item['id']]
+        except KeyError:
+            raise model.DoesNotExist(
+                f'{model.__name__} with {key} {item["id"]} does not exist.'
+            )
+        for name, field in fields.items():
+            if name in item:
+                setattr(instance, field, item[name])
+                updated_fields.add(field)
+        updated_instances.append(instance)
+    if updated_fields:
+        model.objects.bulk_update(updated_instances, sorted(updated_fields))
+    return updated_instances
 
 
 def expire_draws(turn):
@@ -130,12 +341,44 @@ def create_turn_from_previous_turn(turn):
         current_turn=True,
     )
 
-    # Copy over objects from previous turn
-    for piece_state in turn.piecestates.all():
-        piece_state.copy_to_new_turn(new_turn)
-    for territory_state in turn.territorystates.all():
-        territory_state.copy_to_new_turn(new_turn)
-    for nation_state in turn.nationstates.all():
-        nation_state.copy_to_new_turn(new_turn)
+    # Copy over objects from previous turn. Everything needed to build the new
+    # rows is loaded up front and the rows are created in bulk.
+    move_orders = {}
+    successful_move_orders = turn.orders.filter(
+        outcome=OutcomeType.SUCCEEDS,
+        type__in=[OrderType.MOVE, OrderType.RETREAT],
+    ).order_by('id')
+    for order in successful_move_orders:
+        move_orders.setdefault((order.source_id, order.nation_id), order)
+
+    piece_states = []
+    for piece_state in turn.piecestates.select_related('piece'):
+        key = (piece_state.territory_id, piece_state.piece.nation_id)
+        new_piece_state = piece_state.build_for_new_turn(
+            new_turn,
+            move_orders.get(key),
+        )
+        if new_piece_state:
+            piece_states.append(new_piece_state)
+    models.PieceState.objects.bulk_create(piece_states)
+
+    models.TerritoryState.objects.bulk_create([
+        territory_state.build_for_new_turn(new_turn)
+        for territory_state in turn.territorystates.all()
+    ])
+
+    surrendering = set(
+        models.Surrender.objects.filter(
+            nation_state__turn=turn,
+            status=SurrenderStatus.PENDING,
+        ).values_list('nation_state_id', flat=True)
+    )
+    models.NationState.objects.bulk_create([
+        nation_state.build_for_new_turn(
+            new_turn,
+            nation_state.id in surrendering,
+        )
+        for nation_state in turn.nationstates.all()
+    ])
 
     return new_turn
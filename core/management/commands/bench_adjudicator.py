@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from benchmarks import adjudicator
+
+
+class Command(BaseCommand):
+
+    @property
+    def help(self):
+        return (
+            'Measure the speed of the adjudicator over the DATC cases, the '
+            'turns of recorded games and synthetic large boards.'
+        )
+
+    def add_arguments(self, parser):
+        adjudicator.add_arguments(parser)
+
+    def handle(self, *args, **options):
+        if options['repeat'] < 1:
+            raise CommandError('--repeat must be greater than zero.')
+        adjudicator.handle(options, self.stdout.write)
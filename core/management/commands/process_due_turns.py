@@ -0,0 +1,74 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.game import process_due_turns
+
+
+class Command(BaseCommand):
+
+    @property
+    def help(self):
+        return (
+            'Process every turn whose deadline has passed. Turns are '
+            'adjudicated in parallel and each game is saved separately.'
+        )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=None,
+            help=(
+                'The number of adjudicator processes. Defaults to the number '
+                'of CPUs. Use 1 to adjudicate in this process.'
+            )
+        )
+        parser.add_argument(
+            '--timeout',
+            type=float,
+            default=None,
+            help=(
+                'The number of seconds to wait for the result of each turn '
+                'once the previous turns have been saved. Turns are '
+                'adjudicated in parallel, so a turn may run for longer than '
+                'this in total. Turns which time out fail. Defaults to no '
+                'limit.'
+            )
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=100,
+            help=(
+                'The number of turns claimed at a time. Defaults to 100.'
+            )
+        )
+
+    def handle(self, *args, **options):
+        workers = options['workers']
+        timeout = options['timeout']
+        batch_size = options['batch_size']
+        if workers is not None and workers < 1:
+            raise CommandError('--workers must be greater than zero.')
+        if timeout is not None and timeout <= 0:
+            raise CommandError('--timeout must be greater than zero.')
+        if batch_size < 1:
+            raise CommandError('--batch-size must be greater than zero.')
+
+        start = time.perf_counter()
+        num_processed, num_failed = process_due_turns(
+            workers=workers,
+            timeout=timeout,
+            batch_size=batch_size,
+        )
+        elapsed = time.perf_counter() - start
+        self.stdout.write(
+            'Processed {} turns ({} failed) in {:.2f}s ({:.2f} turns/s).'
+            .format(
+                num_processed,
+                num_failed,
+                elapsed,
+                num_processed / elapsed if elapsed else 0,
+            )
+        )
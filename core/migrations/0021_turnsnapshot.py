@@ -0,0 +1,24 @@
+# Generated by Django 3.1.3 on 2026-10-18 02:37
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0020_auto_20201206_1913'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TurnSnapshot',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.PositiveIntegerField()),
+                ('content', models.BinaryField()),
+                ('created_at', models.DateTimeField(auto_now=True)),
+                ('turn', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='snapshot', to='core.Turn')),
+            ],
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 3.1.3 on 2026-10-18 03:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0021_turnsnapshot'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='turn',
+            name='processing',
+            field=models.BooleanField(default=False),
+        ),
+    ]
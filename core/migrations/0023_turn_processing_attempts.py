@@ -0,0 +1,23 @@
+# Generated by Django 3.1.3 on 2026-10-18 03:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0022_turn_processing'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='turn',
+            name='processing_attempts',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='turn',
+            name='processing_error',
+            field=models.TextField(null=True),
+        ),
+    ]
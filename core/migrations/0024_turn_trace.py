@@ -0,0 +1,18 @@
+# Generated by Django 3.1.3 on 2026-10-18 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0023_turn_processing_attempts'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='turn',
+            name='trace',
+            field=models.JSONField(null=True),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 3.1.3 on 2026-10-18 14:05
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def set_processing_started_at(apps, schema_editor):
+    # Turns which are already being processed can be reclaimed once
+    # `TURN_PROCESSING_TIMEOUT` has passed from now.
+    Turn = apps.get_model('core', 'Turn')
+    Turn.objects.filter(processing=True) \
+        .update(processing_started_at=timezone.now())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0024_turn_trace'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='turn',
+            name='processing_started_at',
+            field=models.DateTimeField(null=True),
+        ),
+        migrations.RunPython(
+            set_processing_started_at,
+            migrations.RunPython.noop,
+        ),
+    ]
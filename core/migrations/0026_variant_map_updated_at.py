@@ -0,0 +1,18 @@
+# Generated by Django 3.1.3 on 2026-10-18 16:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0025_turn_processing_started_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='variant',
+            name='map_updated_at',
+            field=models.DateTimeField(editable=False, null=True),
+        ),
+    ]
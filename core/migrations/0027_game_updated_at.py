@@ -0,0 +1,23 @@
+# Generated by Django 3.1.3 on 2026-10-18 17:40
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0026_variant_map_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='game',
+            name='updated_at',
+            field=models.DateTimeField(
+                auto_now=True,
+                default=django.utils.timezone.now,
+            ),
+            preserve_default=False,
+        ),
+    ]
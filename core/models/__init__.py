@@ -8,7 +8,7 @@ from .participation import Participation
 from .piece import Piece, PieceState
 from .surrender import Surrender
 from .territory import Territory, TerritoryState
-from .turn import Turn, TurnEnd
+from .turn import Turn, TurnEnd, TurnSnapshot
 from .variant import Variant
 
 
@@ -30,5 +30,6 @@ __all__ = [
     'TerritoryState',
     'Turn',
     'TurnEnd',
+    'TurnSnapshot',
     'Variant',
 ]
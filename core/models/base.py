@@ -167,6 +167,17 @@ class SurrenderStatus:
     )
 
 
+class TurnStatus:
+    ACTIVE = 'active'
+    PROCESSING = 'processing'
+    PROCESSED = 'processed'
+    CHOICES = (
+        (ACTIVE, 'Active'),
+        (PROCESSING, 'Processing'),
+        (PROCESSED, 'Processed'),
+    )
+
+
 class HygienicModel(models.Model):
     """
     Models which inherit from this base will run `Model.full_clean()` before
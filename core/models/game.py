@@ -120,6 +120,9 @@ class Game(models.Model, AutoSlug):
     created_at = models.DateTimeField(
         auto_now_add=True,
     )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+    )
     initialized_at = models.DateTimeField(
         null=True,
     )
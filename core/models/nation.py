@@ -3,6 +3,9 @@ import json
 from django.apps import apps
 from django.contrib.auth.models import User
 from django.db import models
+from django.db.models import Exists, F, Func, IntegerField, OuterRef, \
+    Subquery
+from django.db.models.functions import Coalesce
 
 from core.models.base import PerTurnModel, Phase, SurrenderStatus
 
@@ -40,8 +43,64 @@ class Nation(models.Model):
         return {}
 
 
+def count_subquery(queryset):
+    """
+    Count the rows of a queryset which refers to the outer query with
+    `OuterRef`. Evaluates to `0` when there are no rows.
+    """
+    counted = queryset.order_by() \
+        .annotate(count=Func(F('id'), function='COUNT')) \
+        .values('count')
+    return Coalesce(Subquery(counted, output_field=IntegerField()), 0)
+
+
 class NationStateQuerySet(models.QuerySet):
 
+    def with_metrics(self):
+        """
+        Annotate each nation state with the counts used to calculate its
+        supply delta, builds, disbands and orders remaining. The counts are
+        computed in the same query as the nation states and are used by the
+        properties of `NationState` in place of separate queries.
+        """
+        Order = apps.get_model('core', 'Order')
+        PieceState = apps.get_model('core', 'PieceState')
+        TerritoryState = apps.get_model('core', 'TerritoryState')
+        pieces = PieceState.objects.filter(
+            turn=OuterRef('turn'),
+            piece__nation=OuterRef('nation'),
+        )
+        supply_centers = TerritoryState.objects.filter(
+            turn=OuterRef('turn'),
+            controlled_by=OuterRef('nation'),
+            territory__supply_center=True,
+        )
+        unoccupied_home_supply_centers = supply_centers.filter(
+            territory__nationality=OuterRef('nation'),
+        ).exclude(
+            Exists(
+                PieceState.objects.filter(
+                    turn=OuterRef('turn'),
+                    territory=OuterRef('territory'),
+                )
+            )
+        )
+        orders = Order.objects.filter(
+            turn=OuterRef('turn'),
+            nation=OuterRef('nation'),
+        )
+        return self.annotate(
+            _supply_center_count=count_subquery(supply_centers),
+            _piece_count=count_subquery(pieces),
+            _retreating_piece_count=count_subquery(
+                pieces.filter(must_retreat=True)
+            ),
+            _unoccupied_home_supply_center_count=count_subquery(
+                unoccupied_home_supply_centers
+            ),
+            _order_count=count_subquery(orders),
+        )
+
     def exclude_civil_disorder(self):
         """
         A NationState instance is considered in civil_disorder if it does not
@@ -81,6 +140,15 @@ class NationState(PerTurnModel):
     # TODO As well as supply delta we should get num_orders to give.
 
     objects = NationStateManager()
+
+    # Annotations added by `NationStateQuerySet.with_metrics`.
+    metric_names = (
+        '_supply_center_count',
+        '_piece_count',
+        '_retreating_piece_count',
+        '_unoccupied_home_supply_center_count',
+        '_order_count',
+    )
     # TODO add orders finalized at
 
     # TODO add unique together for turn and nation
@@ -88,18 +156,47 @@ class NationState(PerTurnModel):
     def __str__(self):
         return ' - '.join([str(self.turn), str(self.nation)])
 
+    def _count(self, metric_name, queryset_name):
+        """
+        Get a count annotated by `with_metrics`. If the instance was not
+        annotated the queryset property named `queryset_name` is counted.
+        """
+        value = getattr(self, metric_name, None)
+        if value is None:
+            return getattr(self, queryset_name).count()
+        return value
+
     def copy_to_new_turn(self, turn):
         """
         Create a copy of the instance for the next turn. Created when the turn
         ends and a new turn is created.
         """
+        self.build_for_new_turn(turn, self.user_surrendering)
+        self.save()
+        return self
+
+    def build_for_new_turn(self, turn, user_surrendering):
+        """
+        Turn the instance into an unsaved copy for the next turn.
+
+        Args:
+            * `turn` - `Turn` - The new turn instance that the nation state is
+              being copied to.
+            * `user_surrendering` - `bool` - Whether the user has a pending
+              surrender.
+
+        Returns:
+            * `NationState`
+        """
         # Set user to None if pending surrender at end of turn
-        if self.user_surrendering:
+        if user_surrendering:
             self.user = None
         self.turn = turn
         self.orders_finalized = False
         self.pk = None
-        self.save()
+        # Metrics belong to the previous turn.
+        for name in self.metric_names:
+            self.__dict__.pop(name, None)
         return self
 
     @property
@@ -136,7 +233,7 @@ class NationState(PerTurnModel):
             * `bool`
         """
         num_required = self.turn.game.variant.num_supply_centers_to_win
-        return self.supply_centers.count() >= num_required
+        return self.num_supply_centers >= num_required
 
     @property
     def orders(self):
@@ -176,6 +273,16 @@ class NationState(PerTurnModel):
             territory__supply_center=True
         )
 
+    @property
+    def num_supply_centers(self):
+        """
+        Gets the number of supply centers that the nation controls this turn.
+
+        Returns:
+            * `int`
+        """
+        return self._count('_supply_center_count', 'supply_centers')
+
     @property
     def unoccupied_controlled_home_supply_centers(self):
         """
@@ -203,7 +310,8 @@ class NationState(PerTurnModel):
         Returns:
             * `int`
         """
-        return self.supply_centers.count() - self.pieces.count()
+        return self.num_supply_centers \
+            - self._count('_piece_count', 'pieces')
 
     @property
     def num_builds(self):
@@ -215,7 +323,10 @@ class NationState(PerTurnModel):
         """
         num = min(
             self.supply_delta,
-            self.unoccupied_controlled_home_supply_centers.count()
+            self._count(
+                '_unoccupied_home_supply_center_count',
+                'unoccupied_controlled_home_supply_centers',
+            )
         )
         return max(0, num)
 
@@ -249,13 +360,28 @@ class NationState(PerTurnModel):
             raise Exception('Should not be called during build phase')
         return self.turn.piecestates.filter(piece__nation=self.nation)
 
+    @property
+    def num_pieces_to_order(self):
+        """
+        Get the number of pieces which a nation can order this turn.
+
+        Returns:
+            * `int`
+        """
+        if self.turn.phase == Phase.RETREAT_AND_DISBAND:
+            return self._count('_retreating_piece_count', 'pieces_to_order')
+        if self.turn.phase == Phase.BUILD:
+            raise Exception('Should not be called during build phase')
+        return self._count('_piece_count', 'pieces_to_order')
+
     @property
     def num_orders_remaining(self):
+        num_orders = self._count('_order_count', 'orders')
         if self.turn.phase == Phase.BUILD:
-            num_orders = max(self.num_builds, self.num_disbands)
-            return max(0, num_orders - self.orders.count())
-        return self.pieces_to_order.count() - self.orders.count()
+            num_builds_or_disbands = max(self.num_builds, self.num_disbands)
+            return max(0, num_builds_or_disbands - num_orders)
+        return self.num_pieces_to_order - num_orders
 
 
 def get_combined_strength(nation_states):
-    return sum([ns.supply_centers.count() for ns in nation_states])
+    return sum([ns.num_supply_centers for ns in nation_states])
@@ -196,24 +196,41 @@ class PieceState(PerTurnModel):
             * `turn` - `Turn` - The new turn instance that the piece is being
               copied to.
         """
+        piece_state = self.build_for_new_turn(turn, self.successful_move_order)
+        if piece_state:
+            piece_state.save()
+        return piece_state
+
+    def build_for_new_turn(self, turn, move_order):
+        """
+        Build an unsaved copy of the instance for the next turn.
+
+        Args:
+            * `turn` - `Turn` - The new turn instance that the piece is being
+              copied to.
+            * `move_order` - `Order` - The successful move or retreat order
+              for the piece state or `None`.
+
+        Returns:
+            * `PieceState` or `None` if the piece was disbanded or destroyed.
+        """
         # If piece disbanded or destroyed do not create a new piece state
-        if self.piece.turn_disbanded or self.destroyed:
+        if self.piece.turn_disbanded_id or self.destroyed:
             return None
         piece_data = {
-            'piece': self.piece,
-            'territory': self.territory,
-            'named_coast': self.named_coast,
+            'piece_id': self.piece_id,
+            'territory_id': self.territory_id,
+            'named_coast_id': self.named_coast_id,
             'must_retreat': False,
         }
-        move_order = self.successful_move_order
         if move_order:
-            piece_data['territory'] = move_order.target
-            piece_data['named_coast'] = move_order.target_coast
+            piece_data['territory_id'] = move_order.target_id
+            piece_data['named_coast_id'] = move_order.target_coast_id
 
         # if piece dislodged set next piece to must_retreat. Record where the
         # piece was attacked from. The piece will not be able to retreat to
         # that territory next turn.
         if self.dislodged:
             piece_data['must_retreat'] = True
-            piece_data['attacker_territory'] = self.dislodged_from
-        return turn.piecestates.create(**piece_data)
+            piece_data['attacker_territory_id'] = self.dislodged_from_id
+        return PieceState(turn=turn, **piece_data)
@@ -138,6 +138,21 @@ class TerritoryState(PerTurnModel):
     )
 
     def copy_to_new_turn(self, turn):
+        self.build_for_new_turn(turn)
+        self.save()
+        return self
+
+    def build_for_new_turn(self, turn):
+        """
+        Turn the instance into an unsaved copy for the next turn.
+
+        Args:
+            * `turn` - `Turn` - The new turn instance that the territory state
+              is being copied to.
+
+        Returns:
+            * `TerritoryState`
+        """
         self.pk = None
         # if end of fall orders process change of possession.
         if self.captured_by:
@@ -147,5 +162,4 @@ class TerritoryState(PerTurnModel):
         self.contested = self.bounce_occurred
         self.bounce_occurred = False
         self.turn = turn
-        self.save()
         return self
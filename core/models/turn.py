@@ -1,7 +1,9 @@
-from django.db import IntegrityError, models
+from django.conf import settings
+from django.db import IntegrityError, models, transaction
+from django.db.models import Q
 from django.utils import timezone
 
-from core.models.base import OrderType, Phase, Season
+from core.models.base import OrderType, Phase, Season, TurnStatus
 from core.utils.date import timespan
 
 
@@ -23,6 +25,30 @@ possible_orders = {
 }
 
 
+def stalled_before(now):
+    """
+    Turns which were claimed for processing before the returned date and are
+    still processing are assumed to have stalled. See
+    `TURN_PROCESSING_TIMEOUT`.
+    """
+    return now - timezone.timedelta(seconds=settings.TURN_PROCESSING_TIMEOUT)
+
+
+def claimable(now):
+    """
+    A filter for turns which are not being processed or whose processing has
+    stalled, excluding turns which have failed too many times. See
+    `Turn.claim_processing` and `TURN_PROCESSING_MAX_ATTEMPTS`.
+
+    Args:
+        * `now` - `datetime`
+    """
+    available = Q(processing=False) | \
+        Q(processing_started_at__lt=stalled_before(now))
+    return available & \
+        Q(processing_attempts__lt=settings.TURN_PROCESSING_MAX_ATTEMPTS)
+
+
 class TurnManager(models.Manager):
 
     def new(self, **kwargs):
@@ -80,6 +106,26 @@ class Turn(models.Model):
     processed_at = models.DateTimeField(
         null=True,
     )
+    # Set when a task to process the turn has been enqueued, along with the
+    # time at which the turn was claimed. See `claim_processing`.
+    processing = models.BooleanField(
+        default=False,
+    )
+    processing_started_at = models.DateTimeField(
+        null=True,
+    )
+    # The number of failed attempts to process the turn and the last error.
+    processing_attempts = models.PositiveIntegerField(
+        default=0,
+    )
+    processing_error = models.TextField(
+        null=True,
+    )
+    # How the adjudicator resolved the turn, recorded for turns which were
+    # slow to adjudicate. See `SLOW_TURN_TRACE_SECONDS`.
+    trace = models.JSONField(
+        null=True,
+    )
     created_at = models.DateTimeField(
         auto_now_add=True,
     )
@@ -119,6 +165,82 @@ class Turn(models.Model):
         except IndexError:
             return None
 
+    @property
+    def status(self):
+        """
+        Whether the turn is active, is being processed or has been processed.
+
+        Returns:
+            * `str` - one of `TurnStatus`.
+        """
+        if self.processed:
+            return TurnStatus.PROCESSED
+        if self.processing:
+            return TurnStatus.PROCESSING
+        return TurnStatus.ACTIVE
+
+    @property
+    def processing_task_id(self):
+        """
+        The id of the task which processes the turn. Used as an idempotency
+        key so that the turn is only enqueued once.
+        """
+        return f'process-turn-{self.id}'
+
+    @property
+    def processing_stalled(self):
+        """
+        Whether the turn has been processing for longer than
+        `TURN_PROCESSING_TIMEOUT`, e.g. because the task which was processing
+        it was lost. A stalled turn can be claimed again.
+        """
+        if not self.processing or not self.processing_started_at:
+            return False
+        return self.processing_started_at < stalled_before(timezone.now())
+
+    def claim_processing(self):
+        """
+        Mark the turn as processing using a conditional update so that only
+        the first caller claims the turn, however many callers try to process
+        the turn at once. A turn whose processing has stalled can be claimed
+        again unless it has failed `TURN_PROCESSING_MAX_ATTEMPTS` times.
+
+        Returns:
+            * `bool` - whether the turn was claimed.
+        """
+        now = timezone.now()
+        claimed = Turn.objects.filter(
+            claimable(now),
+            id=self.id,
+            processed=False,
+        ).update(processing=True, processing_started_at=now)
+        if claimed:
+            self.processing = True
+            self.processing_started_at = now
+        return bool(claimed)
+
+    def enqueue_processing(self):
+        """
+        Process the turn asynchronously. Only the caller which claims the turn
+        enqueues a task. See `claim_processing`. The task is sent once the
+        current transaction commits.
+
+        Returns:
+            * `bool` - whether a task was enqueued.
+        """
+        from ..tasks import process_turn
+
+        if not self.claim_processing():
+            return False
+        transaction.on_commit(lambda: process_turn.apply_async(
+            kwargs={
+                'turn_id': self.id,
+                'processed_at': timezone.now(),
+            },
+            task_id=self.processing_task_id,
+        ))
+        return True
+
     @property
     def possible_order_types(self):
         return possible_orders[self.phase]
@@ -132,13 +254,13 @@ class Turn(models.Model):
         Returns:
             * `bool`
         """
-        for ns in self.nationstates.all():
+        for ns in self.nationstates.with_metrics():
             if not ns.orders_finalized:
                 if self.phase == Phase.BUILD:
                     if (ns.num_builds or ns.num_disbands):
                         return False
                 else:
-                    if ns.pieces_to_order:
+                    if ns.num_pieces_to_order:
                         return False
         return True
 
@@ -184,41 +306,61 @@ class TurnEndManager(models.Manager):
 
     def new(self, turn, datetime):
         """
-        Create a task to process a turn.
+        Schedule a turn to be processed at the given date.
 
-        This method will set up an async task to run process_turn() at the
-        date given, and return the created TurnEnd object to represent
-        this task.
+        The turn is enqueued for processing by `process_due_turn_ends` once
+        the date has passed. The task id is the id of the task which will
+        process the turn.
 
         Args:
             * `turn` - `Turn` - Turn to be processed.
             * `datetime` - `datetime` - When the turn is to be processed.
         """
-        from ..tasks import process_turn
-
         if turn.turn_end:
             raise IntegrityError(
                 'A TurnEnd for turn ID %d already exists.' % turn.id
             )
-
-        task = process_turn.apply_async(
-            kwargs={
-                'turn_id': turn.id,
-                'processed_at': datetime,
-            },
-            eta=datetime,
+        return self.create(
+            turn=turn,
+            datetime=datetime,
+            task_id=turn.processing_task_id,
         )
 
-        return self.create(turn=turn, datetime=datetime, task_id=task.id)
+    def claim_due(self, batch_size, now=None):
+        """
+        Lock a batch of turn ends whose date has passed and whose turns have
+        not been enqueued for processing or whose processing has stalled,
+        oldest first. Only the turn end rows are locked. Rows which are
+        locked by another transaction are skipped so that more than one
+        sweeper can run at once. Must be called inside a transaction.
+
+        Args:
+            * `batch_size` - `int`
+            * `now` - `datetime` - defaults to the current time.
+
+        Returns:
+            * `list` of `TurnEnd` instances.
+        """
+        now = now or timezone.now()
+        # The turns are filtered with a subquery rather than a join so that
+        # only the turn end rows are locked without `FOR UPDATE OF`, which
+        # MariaDB and MySQL do not support.
+        turns = Turn.objects.filter(claimable(now), processed=False)
+        return list(
+            self.select_for_update(skip_locked=True).filter(
+                turn_id__in=turns.values('id'),
+                datetime__lte=now,
+            ).order_by('datetime')[:batch_size]
+        )
 
 
 class TurnEnd(models.Model):
     """
     Represents the future end of a turn.
 
-    When created properly (using `TurnEnd.objects.new`), this model will
-    automatically be associated with an `AsyncResult` object for the
-    `upcoming process_turn()` task.
+    Turn ends whose date has passed are found by the periodic
+    `process_due_turn_ends` task, which enqueues the `process_turn` task for
+    the turn.
     """
     turn = models.OneToOneField(
         'Turn',
@@ -234,3 +376,30 @@ class TurnEnd(models.Model):
     )
 
     objects = TurnEndManager()
+
+
+class TurnSnapshot(models.Model):
+    """
+    The rendered JSON of a processed turn. Processed turns never change so
+    the rendered content can be sent to clients without serializing the turn
+    again.
+
+    Snapshots are only valid for the `version` of the serializer which
+    created them. Snapshots with any other version are ignored and replaced
+    when the turn is next rendered.
+    """
+    turn = models.OneToOneField(
+        'Turn',
+        null=False,
+        on_delete=models.CASCADE,
+        related_name='snapshot',
+    )
+    version = models.PositiveIntegerField(
+        null=False,
+    )
+    content = models.BinaryField(
+        null=False,
+    )
+    created_at = models.DateTimeField(
+        auto_now=True,
+    )
@@ -45,6 +45,12 @@ class Variant(models.Model):
         choices=Phase.CHOICES,
         max_length=100,
     )
+    # Set whenever a territory or named coast of the variant changes. Used to
+    # invalidate the map data cached by `core.turn_data` in every process.
+    map_updated_at = models.DateTimeField(
+        null=True,
+        editable=False,
+    )
 
     def __str__(self):
         return self.name
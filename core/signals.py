@@ -1,19 +1,24 @@
 from django.conf import settings
 from django.core.mail import send_mail
 from django.db.models import signals
-from django.dispatch import receiver
+from django.dispatch import Signal, receiver
 from django.template.loader import render_to_string
 from django.utils import timezone
 from django.utils.text import slugify
 
 from django_rest_passwordreset.signals import reset_password_token_created
 
-from core import models
+from core import models, turn_data
 from core.models.base import DrawStatus, GameStatus
 from core.models.mixins import AutoSlug
 from core.utils.models import super_receiver
 
 
+# Sent by `core.game.process_turn` once a turn has been processed and the next
+# turn has been created. Receivers are passed the processed `turn`.
+turn_processed = Signal()
+
+
 def set_uid(instance):
     """
     In tests we don't want to have to manually set the uid when creating
@@ -60,6 +65,27 @@ def set_territory_uid_if_not_set(sender, instance, **kwargs):
         set_uid(instance)
 
 
+@receiver(signals.post_save, sender=models.Territory)
+@receiver(signals.post_delete, sender=models.Territory)
+@receiver(signals.post_save, sender=models.NamedCoast)
+@receiver(signals.post_delete, sender=models.NamedCoast)
+@receiver(signals.m2m_changed, sender=models.Territory.neighbours.through)
+@receiver(signals.m2m_changed, sender=models.Territory.shared_coasts.through)
+@receiver(signals.m2m_changed, sender=models.NamedCoast.neighbours.through)
+def mark_map_changed(sender, instance, **kwargs):
+    """
+    Invalidate the cached map data used to serialize turns when the map
+    changes.
+    """
+    if isinstance(instance, models.NamedCoast):
+        variant_ids = models.Territory.objects \
+            .filter(id=instance.parent_id) \
+            .values('variant_id')
+    else:
+        variant_ids = [instance.variant_id]
+    turn_data.mark_map_changed(variant_ids)
+
+
 @receiver(signals.post_save, sender=models.DrawResponse)
 def set_draw_status_once_all_responses_submitted(sender, instance, **kwargs):
     if instance.draw.status == DrawStatus.PROPOSED:
@@ -1,26 +1,115 @@
+import logging
+
 from celery import shared_task
 from django.db import transaction
+from django.utils import timezone
 
 from . import models
-from .game import process_turn as _process_turn
+from .game import process_due_turns as _process_due_turns, \
+    process_turn as _process_turn, record_processing_failure
 
 
-@shared_task
-def process_turn(turn_id, processed_at):
+logger = logging.getLogger(__name__)
+
+# The number of turn ends claimed by `process_due_turn_ends` at a time.
+SWEEP_BATCH_SIZE = 100
+
+# Failed attempts are retried after 30 seconds, then 60, 120, 240 and 480.
+PROCESS_TURN_RETRY_DELAY = 30
+
+
+def get_retry_delay(retries):
+    return PROCESS_TURN_RETRY_DELAY * 2 ** retries
+
+
+@shared_task(bind=True, max_retries=5)
+def process_turn(self, turn_id, processed_at):
     """
     Process the specified turn.
 
+    The turn is locked while it is processed and is skipped if it has
+    already been processed, so the turn is processed exactly once when more
+    than one task is run for it. Failed attempts are recorded on the turn
+    and retried with exponential backoff. Once the retries are exhausted the
+    failure is logged and the turn is released, keeping its `TurnEnd`, so
+    that `process_due_turn_ends` enqueues it again until it has failed
+    `TURN_PROCESSING_MAX_ATTEMPTS` times.
+
     Args:
         * `turn_id` - `int` - Turn ID
         * `processed_at` - `datetime` - The time at which the turn is
         processed.
     """
-    turn = models.Turn.objects.get(id=turn_id)
-
     try:
         with transaction.atomic():
-            _process_turn(turn)
-    except Exception:
-        pass
-    finally:
-        models.TurnEnd.objects.filter(turn=turn).delete()
+            turn = models.Turn.objects.select_for_update().get(id=turn_id)
+            if not turn.processed:
+                _process_turn(turn)
+    except Exception as exc:
+        retrying = self.request.retries < self.max_retries
+        # Allow the turn to be enqueued again once retries are exhausted.
+        record_processing_failure(turn_id, exc, processing=retrying)
+        if retrying:
+            raise self.retry(
+                exc=exc,
+                countdown=get_retry_delay(self.request.retries),
+            )
+        logger.error(
+            'Failed to process turn %s after %s attempts. The turn will be '
+            'enqueued again by process_due_turn_ends unless it has failed '
+            'TURN_PROCESSING_MAX_ATTEMPTS times.',
+            turn_id,
+            self.request.retries + 1,
+            exc_info=exc,
+        )
+        raise
+    models.TurnEnd.objects.filter(turn=turn_id).delete()
+
+
+@shared_task
+def process_due_turn_ends(batch_size=SWEEP_BATCH_SIZE):
+    """
+    Enqueue `process_turn` for each turn whose `TurnEnd` has passed. Run
+    periodically by `celery beat`, see `CELERY_BEAT_SCHEDULE`.
+
+    Turn ends are claimed in batches, oldest first. A claimed turn is marked
+    as processing so it is not claimed again while its task is pending.
+
+    Args:
+        * `batch_size` - `int` - The number of turn ends claimed at a time.
+
+    Returns:
+        * `int` - The number of turns enqueued.
+    """
+    now = timezone.now()
+    num_enqueued = 0
+    while True:
+        with transaction.atomic():
+            turn_ends = models.TurnEnd.objects.claim_due(batch_size, now)
+            for turn_end in turn_ends:
+                if turn_end.turn.enqueue_processing():
+                    num_enqueued += 1
+        if len(turn_ends) < batch_size:
+            return num_enqueued
+
+
+@shared_task
+def process_due_turns(workers=1, timeout=None, batch_size=SWEEP_BATCH_SIZE):
+    """
+    Process every turn whose `TurnEnd` has passed in this task, adjudicating
+    the turns in parallel. An alternative to `process_due_turn_ends` which
+    does not need a task per turn. See `core.game.process_due_turns`.
+
+    Worker processes of the default `prefork` pool cannot start processes
+    of their own, so `workers` should only be greater than `1` when the
+    task is consumed by a worker with a different pool, e.g. `--pool=solo`.
+
+    Returns:
+        * `dict` - The number of turns processed and the number which failed.
+    """
+    num_processed, num_failed = _process_due_turns(
+        workers=workers,
+        timeout=timeout,
+        batch_size=batch_size,
+    )
+    return {'processed': num_processed, 'failed': num_failed}
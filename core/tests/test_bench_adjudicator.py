@@ -0,0 +1,66 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase
+
+
+class TestBenchAdjudicator(SimpleTestCase):
+
+    command = 'bench_adjudicator'
+
+    def setUp(self):
+        self.out = StringIO()
+        self.directory = tempfile.TemporaryDirectory()
+        self.output = os.path.join(self.directory.name, 'results.json')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def call_command(self, *args):
+        call_command(self.command, '--repeat=2', *args, stdout=self.out)
+
+    def test_results_written_to_json(self):
+        self.call_command(
+            '--suite=synthetic',
+            '--suite=recorded',
+            '--synthetic-sizes', '10',
+            f'--output={self.output}',
+        )
+        with open(self.output) as f:
+            results = json.load(f)
+        names = [s['name'] for s in results['scenarios']]
+        self.assertIn('synthetic.10_pieces', names)
+        self.assertTrue(any(n.startswith('recorded.game_1.') for n in names))
+        synthetic = results['scenarios'][names.index('synthetic.10_pieces')]
+        self.assertEqual(synthetic['pieces'], 10)
+        self.assertEqual(synthetic['repeat'], 2)
+        self.assertGreater(synthetic['evaluations'], 0)
+        self.assertGreater(synthetic['peak_memory'], 0)
+        self.assertLessEqual(synthetic['p50'], synthetic['p95'])
+        self.assertEqual(
+            set(results['summary']),
+            {'recorded', 'synthetic'},
+        )
+
+    def test_datc_scenarios_and_compare(self):
+        self.call_command(
+            '--suite=datc',
+            '--filter=test_a.',
+            f'--output={self.output}',
+        )
+        self.call_command(
+            '--suite=datc',
+            '--filter=test_a.',
+            f'--compare={self.output}',
+        )
+        output = self.out.getvalue()
+        self.assertIn('datc.test_a.TestBasicChecks.', output)
+        self.assertIn('%)', output)
+
+    def test_invalid_repeat(self):
+        with self.assertRaises(CommandError):
+            call_command(self.command, '--repeat=0', stdout=self.out)
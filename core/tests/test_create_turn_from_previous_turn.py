@@ -1,7 +1,9 @@
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from core import models
-from core.models.base import Phase, Season
+from core.models.base import OrderType, OutcomeType, Phase, Season
 from core.game import create_turn_from_previous_turn
 
 from core.tests import DiplomacyTestCaseMixin
@@ -27,3 +29,65 @@ class TestCreateTurnFromPreviousTurn(TestCase, DiplomacyTestCaseMixin):
         self.assertEqual(new_turn.phase, Phase.ORDER)
         self.assertEqual(new_turn.season, Season.FALL)
         self.assertEqual(new_turn.year, 1900)
+
+    def create_turn_with_moves(self, num_pieces):
+        game = self.create_test_game(variant=self.variant)
+        turn = self.create_test_turn(
+            game=game,
+            processed=True,
+            next_phase=Phase.ORDER,
+            next_season=Season.FALL,
+            next_year=1900,
+        )
+        nation = self.create_test_nation(
+            variant=self.variant,
+            name=f'Nation {num_pieces}',
+        )
+        user = self.create_test_user(username=f'user {num_pieces}')
+        nation_state = self.create_test_nation_state(
+            nation=nation,
+            turn=turn,
+            user=user,
+        )
+        models.Surrender.objects.create(user=user, nation_state=nation_state)
+        for i in range(num_pieces):
+            source, target = [
+                self.create_test_territory(
+                    variant=self.variant,
+                    name=f'{num_pieces} {i} {j}',
+                )
+                for j in range(2)
+            ]
+            self.create_test_territory_state(turn=turn, territory=source)
+            self.create_test_territory_state(turn=turn, territory=target)
+            piece = self.create_test_piece(game=game, nation=nation)
+            self.create_test_piece_state(
+                turn=turn,
+                piece=piece,
+                territory=source,
+            )
+            self.create_test_order(
+                turn=turn,
+                nation=nation,
+                type=OrderType.MOVE,
+                source=source,
+                target=target,
+                outcome=OutcomeType.SUCCEEDS,
+            )
+        return turn
+
+    def test_num_queries_does_not_depend_on_num_pieces(self):
+        num_queries = []
+        for num_pieces in [1, 10]:
+            turn = self.create_turn_with_moves(num_pieces)
+            with CaptureQueriesContext(connection) as context:
+                new_turn = create_turn_from_previous_turn(turn)
+            num_queries.append(len(context))
+
+            self.assertEqual(new_turn.piecestates.count(), num_pieces)
+            self.assertEqual(new_turn.territorystates.count(), num_pieces * 2)
+            for piece_state in new_turn.piecestates.all():
+                self.assertTrue(piece_state.territory.name.endswith(' 1'))
+            # Pending surrender removes the user from the nation
+            self.assertIsNone(new_turn.nationstates.get().user)
+        self.assertEqual(num_queries[0], num_queries[1])
@@ -1,7 +1,7 @@
 from django.test import TestCase
 
 from core import models
-from core.models.base import Season
+from core.models.base import Phase, Season
 from core.tests import DiplomacyTestCaseMixin
 
 
@@ -130,3 +130,97 @@ class TestNationState(TestCase, DiplomacyTestCaseMixin):
         self.assertTrue(nation_state in result)
         self.assertFalse(excluded_nation_state_1 in result)
         self.assertFalse(excluded_nation_state_2 in result)
+
+    def create_metrics_board(self):
+        """
+        Create a nation which controls three supply centers, two of which are
+        in its home territory, and has two pieces, one of which must retreat.
+        """
+        nation_state = self.create_test_nation_state(
+            turn=self.turn,
+            nation=self.nation,
+            user=self.user,
+        )
+        other_nation = self.create_test_nation(
+            variant=self.variant,
+            name='France',
+        )
+        self.create_test_nation_state(
+            turn=self.turn,
+            nation=other_nation,
+            user=self.create_test_user(),
+        )
+        territories = [
+            self.create_test_territory(
+                variant=self.variant,
+                name=name,
+                nationality=nationality,
+            )
+            for name, nationality in [
+                ('London', self.nation),
+                ('Liverpool', self.nation),
+                ('Brest', other_nation),
+            ]
+        ]
+        for territory in territories:
+            self.create_test_territory_state(
+                turn=self.turn,
+                territory=territory,
+                controlled_by=self.nation,
+            )
+        for territory, must_retreat in [(territories[0], False),
+                                        (territories[2], True)]:
+            self.create_test_piece_state(
+                turn=self.turn,
+                territory=territory,
+                piece=self.create_test_piece(
+                    game=self.game,
+                    nation=self.nation,
+                ),
+                must_retreat=must_retreat,
+            )
+        self.create_test_order(
+            turn=self.turn,
+            nation=self.nation,
+            source=territories[0],
+        )
+        return nation_state
+
+    def assert_metrics_match_properties(self, properties):
+        for nation_state in self.turn.nationstates.with_metrics():
+            plain = models.NationState.objects.get(id=nation_state.id)
+            for name in properties:
+                self.assertEqual(
+                    getattr(nation_state, name),
+                    getattr(plain, name),
+                    name,
+                )
+
+    def test_with_metrics_matches_properties(self):
+        self.create_metrics_board()
+        properties = [
+            'num_supply_centers',
+            'supply_delta',
+            'num_builds',
+            'num_disbands',
+            'num_orders_remaining',
+        ]
+        for phase in [Phase.ORDER, Phase.RETREAT_AND_DISBAND, Phase.BUILD]:
+            self.turn.phase = phase
+            self.turn.save()
+            phase_properties = properties
+            if phase != Phase.BUILD:
+                phase_properties = [*properties, 'num_pieces_to_order']
+            self.assert_metrics_match_properties(phase_properties)
+
+    def test_with_metrics_num_queries(self):
+        nation_state = self.create_metrics_board()
+        with self.assertNumQueries(1):
+            nation_states = list(self.turn.nationstates.with_metrics())
+            nation_state = next(
+                ns for ns in nation_states if ns.id == nation_state.id
+            )
+            self.assertEqual(nation_state.num_supply_centers, 3)
+            self.assertEqual(nation_state.supply_delta, 1)
+            self.assertEqual(nation_state.num_builds, 1)
+            self.assertEqual(nation_state.num_orders_remaining, 1)
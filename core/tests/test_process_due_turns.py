@@ -0,0 +1,98 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from django.utils import timezone
+
+from core import models
+from core.game import apply_outcome
+from core.tests import DiplomacyTestCaseMixin
+
+
+class TestProcessDueTurns(TestCase, DiplomacyTestCaseMixin):
+
+    command = 'process_due_turns'
+
+    def setUp(self):
+        self.out = StringIO()
+        self.now = timezone.now()
+        self.variant = self.create_test_variant(name='standard')
+        self.user = self.create_test_user()
+
+    def create_turn_end(self, datetime):
+        game = self.create_test_game(variant=self.variant)
+        turn = self.create_test_turn(game=game)
+        return models.TurnEnd.objects.new(turn=turn, datetime=datetime)
+
+    def call_command(self, *args):
+        call_command(self.command, '--workers=1', *args, stdout=self.out)
+
+    def test_processes_due_turns(self):
+        due = [
+            self.create_turn_end(self.now - timezone.timedelta(minutes=i))
+            for i in range(3)
+        ]
+        not_due = self.create_turn_end(
+            self.now + timezone.timedelta(minutes=1)
+        )
+        self.call_command('--batch-size=2')
+        for turn_end in due:
+            turn = models.Turn.objects.get(id=turn_end.turn_id)
+            self.assertTrue(turn.processed)
+            self.assertEqual(turn.game.turns.count(), 2)
+        self.assertFalse(
+            models.TurnEnd.objects.filter(id__in=[t.id for t in due]).exists()
+        )
+        not_due.turn.refresh_from_db()
+        self.assertFalse(not_due.turn.processed)
+        self.assertIn('Processed 3 turns (0 failed)', self.out.getvalue())
+
+    def test_failure_does_not_affect_other_games(self):
+        failing = self.create_turn_end(self.now)
+        succeeding = self.create_turn_end(self.now)
+
+        def fail_one(turn, outcome):
+            if turn.id == failing.turn_id:
+                raise ValueError('invalid')
+            return apply_outcome(turn, outcome)
+
+        with patch('core.game.apply_outcome', side_effect=fail_one):
+            self.call_command()
+        self.assertIn('Processed 1 turns (1 failed)', self.out.getvalue())
+
+        failing.turn.refresh_from_db()
+        self.assertFalse(failing.turn.processed)
+        self.assertFalse(failing.turn.processing)
+        self.assertEqual(failing.turn.processing_attempts, 1)
+        self.assertEqual(failing.turn.processing_error, "ValueError('invalid')")
+        self.assertTrue(models.TurnEnd.objects.filter(id=failing.id).exists())
+        succeeding.turn.refresh_from_db()
+        self.assertTrue(succeeding.turn.processed)
+
+    def test_failed_turns_not_claimed_again(self):
+        failing = self.create_turn_end(self.now)
+
+        with patch('core.game.apply_outcome', side_effect=ValueError):
+            self.call_command('--batch-size=1')
+        self.assertIn('Processed 0 turns (1 failed)', self.out.getvalue())
+
+        failing.turn.refresh_from_db()
+        self.assertFalse(failing.turn.processing)
+        self.assertEqual(failing.turn.processing_attempts, 1)
+        self.assertTrue(models.TurnEnd.objects.filter(id=failing.id).exists())
+
+    def test_skips_claimed_turns(self):
+        turn_end = self.create_turn_end(self.now)
+        models.Turn.objects.filter(id=turn_end.turn_id) \
+            .update(processing=True)
+        self.call_command()
+        turn_end.turn.refresh_from_db()
+        self.assertFalse(turn_end.turn.processed)
+        self.assertIn('Processed 0 turns (0 failed)', self.out.getvalue())
+
+    def test_invalid_arguments(self):
+        for argument in ['--workers=0', '--timeout=0', '--batch-size=0']:
+            with self.assertRaises(CommandError):
+                call_command(self.command, argument, stdout=self.out)
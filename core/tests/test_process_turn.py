@@ -1,10 +1,14 @@
+from unittest.mock import patch
+
 from django.contrib.auth.models import User
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
+from adjudicator import process_game_state
 from core import models
-from core.game import process_turn
+from core.game import process_turn, update_turn
 from core.models.base import GameStatus, OutcomeType, OrderType, Phase, \
     Season, TerritoryType
+from core.serializers import TurnSerializer
 from core.tests import DiplomacyTestCaseMixin
 
 
@@ -183,7 +187,8 @@ class TestProcessTurn(TestCase, DiplomacyTestCaseMixin):
         paris.neighbours.add(picardy)
         picardy.neighbours.add(burgundy)
         paris.neighbours.add(burgundy)
-        process_turn(turn)
+        with self.captureOnCommitCallbacks(execute=True):
+            process_turn(turn)
         burgundy_state.refresh_from_db()
         paris_order.refresh_from_db()
         picardy_order.refresh_from_db()
@@ -192,3 +197,102 @@ class TestProcessTurn(TestCase, DiplomacyTestCaseMixin):
         self.assertTrue(burgundy_state.bounce_occurred)
         self.assertEqual(paris_order.outcome, OutcomeType.FAILS)
         self.assertEqual(picardy_order.outcome, OutcomeType.FAILS)
+        self.assertTrue(models.TurnSnapshot.objects.filter(turn=turn).exists())
+
+    def create_board(self, num_pieces):
+        """
+        Create a turn in which each of `num_pieces` armies moves to an empty
+        neighbouring territory.
+        """
+        user = User.objects.create(username=f'Test User {num_pieces}')
+        variant = models.Variant.objects.create(name='standard')
+        game = models.Game.objects.create(
+            variant=variant,
+            name='Test Game',
+            description='Test Description',
+            status=GameStatus.ACTIVE,
+            num_players=7,
+            created_by=user,
+        )
+        turn = models.Turn.objects.create(
+            game=game,
+            season=Season.SPRING,
+            phase=Phase.ORDER,
+            year=1900,
+        )
+        france = models.Nation.objects.create(variant=variant, name='France')
+        self.create_test_nation_state(nation=france, turn=turn, user=user)
+        for i in range(num_pieces):
+            source, target = [
+                models.Territory.objects.create(
+                    variant=variant,
+                    name=f'Territory {i} {j}',
+                    type=TerritoryType.INLAND,
+                )
+                for j in range(2)
+            ]
+            source.neighbours.add(target)
+            for territory in [source, target]:
+                models.TerritoryState.objects.create(
+                    territory=territory,
+                    turn=turn,
+                    controlled_by=france,
+                )
+            piece = models.Piece.objects.create(game=game, nation=france)
+            models.PieceState.objects.create(
+                piece=piece,
+                turn=turn,
+                territory=source,
+            )
+            models.Order.objects.create(
+                turn=turn,
+                nation=france,
+                type=OrderType.MOVE,
+                source=source,
+                target=target,
+            )
+        return turn
+
+    def test_update_turn_num_queries(self):
+        # The number of queries does not depend on the size of the board
+        for num_pieces in [2, 34]:
+            turn = self.create_board(num_pieces)
+            outcome = process_game_state(
+                TurnSerializer(turn).data,
+                trusted=True,
+            )
+            with self.assertNumQueries(11):
+                update_turn(turn, outcome)
+            turn.refresh_from_db()
+            self.assertTrue(turn.processed)
+            self.assertEqual(turn.next_season, Season.FALL)
+            self.assertEqual(
+                turn.orders.filter(outcome=OutcomeType.SUCCEEDS).count(),
+                num_pieces,
+            )
+
+    @override_settings(SLOW_TURN_TRACE_SECONDS=0)
+    def test_slow_turn_trace_saved(self):
+        turn = self.create_board(2)
+        process_turn(turn)
+        turn.refresh_from_db()
+        self.assertEqual(len(turn.trace['evaluations']), 4)
+        self.assertIn('resolution', turn.trace['phases'])
+
+    def test_snapshot_failure_does_not_undo_processing(self):
+        turn = self.create_board(2)
+        with patch(
+            'service.signals.save_turn_snapshot',
+            side_effect=ValueError,
+        ), self.assertLogs('service.signals', level='ERROR'), \
+                self.captureOnCommitCallbacks(execute=True):
+            process_turn(turn)
+        turn.refresh_from_db()
+        self.assertTrue(turn.processed)
+        self.assertFalse(models.TurnSnapshot.objects.filter(turn=turn).exists())
+
+    def test_trace_not_saved_by_default(self):
+        turn = self.create_board(2)
+        process_turn(turn)
+        turn.refresh_from_db()
+        self.assertIsNone(turn.trace)
@@ -0,0 +1,67 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.utils import timezone
+
+from core import models
+from core.tasks import get_retry_delay, process_turn
+from core.tests import DiplomacyTestCaseMixin
+
+
+process_turn_path = 'core.tasks._process_turn'
+
+
+class TestProcessTurnTask(TestCase, DiplomacyTestCaseMixin):
+
+    def setUp(self):
+        self.patch_process_turn_apply_async()
+        self.game = self.create_test_game()
+        self.turn = self.create_test_turn(game=self.game, turn_end=True)
+
+    def run_task(self):
+        return process_turn.apply(kwargs={
+            'turn_id': self.turn.id,
+            'processed_at': timezone.now(),
+        })
+
+    def test_processes_turn(self):
+        with patch(process_turn_path) as _process_turn:
+            result = self.run_task()
+        self.assertTrue(result.successful())
+        _process_turn.assert_called_once_with(self.turn)
+        self.assertFalse(models.TurnEnd.objects.exists())
+
+    def test_skips_processed_turn(self):
+        self.turn.processed = True
+        self.turn.save()
+        with patch(process_turn_path) as _process_turn:
+            result = self.run_task()
+        self.assertTrue(result.successful())
+        _process_turn.assert_not_called()
+        self.assertFalse(models.TurnEnd.objects.exists())
+
+    def test_failures_are_recorded_and_retried(self):
+        models.Turn.objects.filter(id=self.turn.id).update(processing=True)
+        with patch(process_turn_path, side_effect=ValueError('invalid')) \
+                as _process_turn, \
+                self.assertLogs('core.tasks', level='ERROR') as logs:
+            result = self.run_task()
+        self.assertTrue(result.failed())
+        attempts = process_turn.max_retries + 1
+        self.assertEqual(_process_turn.call_count, attempts)
+        self.turn.refresh_from_db()
+        self.assertEqual(self.turn.processing_attempts, attempts)
+        self.assertEqual(self.turn.processing_error, "ValueError('invalid')")
+        self.assertFalse(self.turn.processing)
+        # The turn is kept due so that it is enqueued again.
+        self.assertTrue(models.TurnEnd.objects.filter(turn=self.turn).exists())
+        self.assertIn(f'Failed to process turn {self.turn.id}', logs.output[0])
+
+    def test_retry_delay_backs_off(self):
+        self.assertEqual(
+            [
+                get_retry_delay(retries)
+                for retries in range(process_turn.max_retries)
+            ],
+            [30, 60, 120, 240, 480],
+        )
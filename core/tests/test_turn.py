@@ -1,7 +1,10 @@
+from django.conf import settings
 from django.test import TestCase
+from django.utils import timezone
 
 from core import factories, models
-from core.models.base import DeadlineFrequency, PieceType, Phase, Season
+from core.models.base import DeadlineFrequency, PieceType, Phase, Season, \
+    TurnStatus
 from core.tests import DiplomacyTestCaseMixin
 
 
@@ -164,6 +167,54 @@ class TestTurn(TestCase, DiplomacyTestCaseMixin):
         turn = self.create_test_turn(game=self.game, phase=Phase.BUILD)
         self.assertEqual(turn.deadline, DeadlineFrequency.THREE_DAYS)
 
+    def test_enqueue_processing(self):
+        self.patch_process_turn_apply_async()
+        turn = self.create_test_turn(game=self.game)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertTrue(turn.enqueue_processing())
+            self.assertFalse(turn.enqueue_processing())
+        self.assertEqual(turn.status, TurnStatus.PROCESSING)
+        self.apply_async.assert_called_once()
+        self.assertEqual(
+            self.apply_async.call_args[1]['task_id'],
+            f'process-turn-{turn.id}',
+        )
+
+    def test_enqueue_processing_stalled(self):
+        self.patch_process_turn_apply_async()
+        turn = self.create_test_turn(game=self.game)
+        claimed_at = timezone.now() - timezone.timedelta(
+            seconds=settings.TURN_PROCESSING_TIMEOUT + 1
+        )
+        models.Turn.objects.filter(id=turn.id).update(
+            processing=True,
+            processing_started_at=claimed_at,
+        )
+        turn.refresh_from_db()
+        self.assertTrue(turn.processing_stalled)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertTrue(turn.enqueue_processing())
+        self.assertFalse(turn.processing_stalled)
+        self.apply_async.assert_called_once()
+
+    def test_enqueue_processing_max_attempts(self):
+        self.patch_process_turn_apply_async()
+        turn = self.create_test_turn(game=self.game)
+        models.Turn.objects.filter(id=turn.id).update(
+            processing_attempts=settings.TURN_PROCESSING_MAX_ATTEMPTS,
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertFalse(turn.enqueue_processing())
+        self.apply_async.assert_not_called()
+
+    def test_enqueue_processing_processed(self):
+        self.patch_process_turn_apply_async()
+        turn = self.create_test_turn(game=self.game, processed=True)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertFalse(turn.enqueue_processing())
+        self.assertEqual(turn.status, TurnStatus.PROCESSED)
+        self.apply_async.assert_not_called()
+
 
 class TestLinkedTurns(TestCase):
 
@@ -0,0 +1,152 @@
+import json
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from core import models
+from core.models.base import OrderType, PieceType, TerritoryType
+from core.serializers import TurnSerializer
+from core.turn_data import (
+    clear_map_cache, get_turn_data, mark_map_changed,
+)
+
+from core.tests import DiplomacyTestCaseMixin
+
+
+class TestGetTurnData(TestCase, DiplomacyTestCaseMixin):
+
+    def setUp(self):
+        clear_map_cache()
+        self.variant = self.create_test_variant(name='standard')
+        self.user = self.create_test_user()
+        self.game = self.create_test_game(variant=self.variant)
+        self.turn = self.create_test_turn(game=self.game)
+        self.england = self.create_test_nation(
+            variant=self.variant,
+            name='England',
+        )
+        self.france = self.create_test_nation(
+            variant=self.variant,
+            name='France',
+        )
+        for nation in [self.england, self.france]:
+            self.create_test_nation_state(
+                nation=nation,
+                turn=self.turn,
+                user=self.user,
+            )
+
+    def add_pieces(self, num_pieces):
+        """
+        Add `num_pieces` groups of territories to the turn. In each group a
+        fleet on a named coast is supported to move and an army is retreating.
+        """
+        start = self.turn.piecestates.count()
+        for i in range(start, start + num_pieces):
+            sea, spain, gascony = [
+                self.create_test_territory(
+                    variant=self.variant,
+                    name=f'{name} {i}',
+                    type=type,
+                    nationality=self.france,
+                )
+                for name, type in [
+                    ('Sea', TerritoryType.SEA),
+                    ('Spain', TerritoryType.COASTAL),
+                    ('Gascony', TerritoryType.COASTAL),
+                ]
+            ]
+            # Added in reverse order to check that ordering is preserved.
+            gascony.neighbours.add(spain, sea)
+            gascony.shared_coasts.add(spain)
+            north_coast = self.create_test_named_coast(
+                parent=spain,
+                name=f'Spain North Coast {i}',
+                uid=f'spain-north-coast-{i}',
+            )
+            north_coast.neighbours.add(sea, gascony)
+            for territory in [sea, spain, gascony]:
+                self.create_test_territory_state(
+                    turn=self.turn,
+                    territory=territory,
+                    controlled_by=self.france,
+                )
+            fleet = self.create_test_piece(
+                game=self.game,
+                nation=self.england,
+                type=PieceType.FLEET,
+            )
+            self.create_test_piece_state(
+                turn=self.turn,
+                piece=fleet,
+                territory=spain,
+                named_coast=north_coast,
+            )
+            army = self.create_test_piece(game=self.game, nation=self.france)
+            self.create_test_piece_state(
+                turn=self.turn,
+                piece=army,
+                territory=spain,
+                must_retreat=True,
+                attacker_territory=gascony,
+            )
+            self.create_test_order(
+                turn=self.turn,
+                nation=self.england,
+                type=OrderType.MOVE,
+                source=spain,
+                target=sea,
+            )
+            self.create_test_order(
+                turn=self.turn,
+                nation=self.england,
+                type=OrderType.SUPPORT,
+                source=gascony,
+                aux=spain,
+                target=sea,
+            )
+
+    def test_identical_to_turn_serializer(self):
+        self.add_pieces(3)
+        self.assertEqual(
+            json.dumps(get_turn_data(self.turn)),
+            json.dumps(TurnSerializer(self.turn).data),
+        )
+
+    def test_map_changes_clear_cache(self):
+        self.add_pieces(1)
+        get_turn_data(self.turn)
+        self.add_pieces(1)
+        self.assertEqual(
+            json.dumps(get_turn_data(self.turn)),
+            json.dumps(TurnSerializer(self.turn).data),
+        )
+
+    def test_map_changes_in_other_processes_invalidate_cache(self):
+        # Simulate a map change made by another process, which cannot clear
+        # this process's cache, by clearing nothing and changing the map
+        # without sending signals.
+        self.add_pieces(1)
+        get_turn_data(self.turn)
+        models.Territory.objects.filter(variant=self.variant) \
+            .update(supply_center=False)
+        self.assertNotEqual(
+            json.dumps(get_turn_data(self.turn)),
+            json.dumps(TurnSerializer(self.turn).data),
+        )
+        mark_map_changed([self.variant.id])
+        self.assertEqual(
+            json.dumps(get_turn_data(self.turn)),
+            json.dumps(TurnSerializer(self.turn).data),
+        )
+
+    def test_num_queries_does_not_depend_on_num_pieces(self):
+        num_queries = []
+        for num_pieces in [1, 10]:
+            self.add_pieces(num_pieces)
+            get_turn_data(self.turn)
+            with CaptureQueriesContext(connection) as context:
+                get_turn_data(self.turn)
+            num_queries.append(len(context.captured_queries))
+        self.assertEqual(num_queries, [5, 5])
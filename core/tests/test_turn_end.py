@@ -1,11 +1,12 @@
 from unittest.mock import patch
 
+from django.conf import settings
 from django.db import IntegrityError
 from django.test import TestCase
 from django.utils import timezone
 
 from core import factories, models
-from core.tasks import process_turn
+from core.tasks import process_due_turn_ends, process_turn
 from core.tests import DiplomacyTestCaseMixin
 from core.models.base import Phase, Season
 
@@ -45,12 +46,10 @@ class TestTurnEnd(TestCase, DiplomacyTestCaseMixin):
 
         turn_end = models.TurnEnd.objects.new(turn=turn, datetime=datetime)
         self.assertIsInstance(turn_end, models.TurnEnd)
-        self.assertEqual(self.dummy_task_id, turn_end.task_id)
+        self.assertEqual(turn.processing_task_id, turn_end.task_id)
 
-        self.apply_async.assert_called_with(
-            kwargs={'turn_id': turn.id, 'processed_at': datetime},
-            eta=datetime,
-        )
+        # The turn is enqueued by `process_due_turn_ends` instead.
+        self.apply_async.assert_not_called()
         self.assertEqual(turn_end, turn.turn_end)
 
     def test_process_outcome(self):
@@ -83,14 +82,9 @@ class TestTurnEnd(TestCase, DiplomacyTestCaseMixin):
 
         with self.assertRaises(IntegrityError):
             models.TurnEnd.objects.new(turn=turn, datetime=tomorrow)
+        self.assertEqual(1, len(models.TurnEnd.objects.all()))
 
-        # Assert that only one process_turn() task was invoked, not two.
-        self.apply_async.assert_called_once_with(
-            kwargs={'turn_id': turn.id, 'processed_at': datetime},
-            eta=datetime,
-        )
-
-    def test_turn_end_graceful_fail(self):
+    def test_turn_end_fail_recorded(self):
         turn = self.create_turn()
         datetime = timezone.now()
 
@@ -98,5 +92,97 @@ class TestTurnEnd(TestCase, DiplomacyTestCaseMixin):
 
         with patch(process_path) as process:
             process.side_effect = models.Turn.DoesNotExist
-            process_turn(turn_id=turn.id, processed_at=datetime)
-        self.assertEqual(0, len(models.TurnEnd.objects.all()))
+            with self.assertRaises(models.Turn.DoesNotExist):
+                process_turn(turn_id=turn.id, processed_at=datetime)
+        turn.refresh_from_db()
+        self.assertEqual(turn.processing_attempts, 1)
+        # The turn end is kept so that the turn is processed again.
+        self.assertEqual(1, len(models.TurnEnd.objects.all()))
+
+
+class TestProcessDueTurnEnds(TestCase, DiplomacyTestCaseMixin):
+
+    def setUp(self):
+        self.patch_process_turn_apply_async()
+        self.now = timezone.now()
+
+    def create_turn_end(self, datetime):
+        turn = self.create_test_turn(game=self.create_test_game())
+        return models.TurnEnd.objects.new(turn=turn, datetime=datetime)
+
+    def test_enqueues_due_turns(self):
+        due = [
+            self.create_turn_end(self.now - timezone.timedelta(minutes=i))
+            for i in range(3)
+        ]
+        self.create_turn_end(self.now + timezone.timedelta(minutes=1))
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(process_due_turn_ends(batch_size=2), 3)
+        self.assertEqual(
+            sorted(c[1]['task_id'] for c in self.apply_async.call_args_list),
+            sorted(t.turn.processing_task_id for t in due),
+        )
+        for turn_end in due:
+            turn_end.turn.refresh_from_db()
+            self.assertTrue(turn_end.turn.processing)
+
+    def test_does_not_enqueue_turn_twice(self):
+        self.create_turn_end(self.now)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(process_due_turn_ends(), 1)
+            self.assertEqual(process_due_turn_ends(), 0)
+        self.apply_async.assert_called_once()
+
+    def test_skips_processed_turns(self):
+        turn_end = self.create_turn_end(self.now)
+        models.Turn.objects.filter(id=turn_end.turn_id).update(processed=True)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(process_due_turn_ends(), 0)
+        self.apply_async.assert_not_called()
+
+    def test_enqueues_stalled_turns(self):
+        turn_end = self.create_turn_end(self.now)
+        stalled = self.create_turn_end(self.now)
+        claimed_at = self.now - timezone.timedelta(
+            seconds=settings.TURN_PROCESSING_TIMEOUT + 1
+        )
+        models.Turn.objects.filter(id=turn_end.turn_id).update(
+            processing=True,
+            processing_started_at=self.now,
+        )
+        models.Turn.objects.filter(id=stalled.turn_id).update(
+            processing=True,
+            processing_started_at=claimed_at,
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(process_due_turn_ends(), 1)
+        self.assertEqual(
+            self.apply_async.call_args[1]['task_id'],
+            stalled.turn.processing_task_id,
+        )
+
+    def test_skips_turns_which_failed_too_often(self):
+        turn_end = self.create_turn_end(self.now)
+        failing = self.create_turn_end(self.now)
+        claimed_at = self.now - timezone.timedelta(
+            seconds=settings.TURN_PROCESSING_TIMEOUT + 1
+        )
+        models.Turn.objects.filter(id=failing.turn_id).update(
+            processing=True,
+            processing_started_at=claimed_at,
+            processing_attempts=settings.TURN_PROCESSING_MAX_ATTEMPTS,
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(process_due_turn_ends(), 1)
+        self.assertEqual(
+            self.apply_async.call_args[1]['task_id'],
+            turn_end.turn.processing_task_id,
+        )
+
+    def test_claims_oldest_first(self):
+        turn_ends = [
+            self.create_turn_end(self.now - timezone.timedelta(minutes=i))
+            for i in range(3)
+        ]
+        claimed = models.TurnEnd.objects.claim_due(2, self.now)
+        self.assertEqual(claimed, [turn_ends[2], turn_ends[1]])
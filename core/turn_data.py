@@ -0,0 +1,192 @@
+"""
+Builds the data passed to the `adjudicator` for a turn directly from the
+database. The output is identical to `TurnSerializer(turn).data` but is
+fetched with a fixed number of queries regardless of the size of the turn.
+"""
+from django.utils import timezone
+
+from core import models
+
+
+# Static map data for each variant, keyed by variant id. Each entry is a pair
+# of the `Variant.map_updated_at` the data was loaded at and a dict mapping a
+# territory id to its serialized territory fields and the serialized named
+# coasts belonging to the territory. `map_updated_at` is read from the
+# database on every call so a map change made by any process invalidates the
+# cache in every other process. See `mark_map_changed`.
+_map_cache = {}
+
+
+def clear_map_cache():
+    _map_cache.clear()
+
+
+def mark_map_changed(variant_ids):
+    """
+    Invalidate the cached map data of the given variants in every process.
+    Called by `core.signals` whenever a territory or named coast changes. Map
+    data written without sending signals, e.g. with `QuerySet.update` or raw
+    SQL, must call this too.
+
+    Args:
+        * `variant_ids` - iterable of variant ids or a values queryset.
+    """
+    models.Variant.objects.filter(id__in=variant_ids) \
+        .update(map_updated_at=timezone.now())
+
+
+def _group(pairs):
+    grouped = {}
+    for key, value in pairs:
+        grouped.setdefault(key, []).append(value)
+    return grouped
+
+
+def _load_map(variant_id):
+    """
+    Serialize the territories and named coasts of a variant in the format of
+    `TerritorySerializer` and `NamedCoastSerializer`.
+    """
+    territories = models.Territory.objects \
+        .filter(variant_id=variant_id) \
+        .order_by('id') \
+        .values_list('id', 'type', 'name', 'nationality_id', 'supply_center')
+    neighbours = _group(
+        models.Territory.neighbours.through.objects
+        .filter(from_territory__variant_id=variant_id)
+        .order_by('from_territory_id', 'to_territory_id')
+        .values_list('from_territory_id', 'to_territory_id')
+    )
+    shared_coasts = _group(
+        models.Territory.shared_coasts.through.objects
+        .filter(from_territory__variant_id=variant_id)
+        .order_by('from_territory_id', 'to_territory_id')
+        .values_list('from_territory_id', 'to_territory_id')
+    )
+    named_coast_neighbours = _group(
+        models.NamedCoast.neighbours.through.objects
+        .filter(namedcoast__parent__variant_id=variant_id)
+        .order_by('namedcoast_id', 'territory_id')
+        .values_list('namedcoast_id', 'territory_id')
+    )
+    named_coasts = _group(
+        (parent_id, {
+            'name': name,
+            'parent': parent_id,
+            'neighbours': named_coast_neighbours.get(id, []),
+        })
+        for id, name, parent_id in models.NamedCoast.objects
+        .filter(parent__variant_id=variant_id)
+        .order_by('id')
+        .values_list('id', 'name', 'parent_id')
+    )
+    return {
+        id: (
+            {
+                'id': id,
+                'type': type,
+                'name': name,
+                'neighbours': neighbours.get(id, []),
+                'shared_coasts': shared_coasts.get(id, []),
+                'nationality': nationality_id,
+                'supply_center': supply_center,
+            },
+            named_coasts.get(id, []),
+        )
+        for id, type, name, nationality_id, supply_center in territories
+    }
+
+
+def _get_map(variant_id, map_updated_at):
+    cached = _map_cache.get(variant_id)
+    if cached is None or cached[0] != map_updated_at:
+        cached = _map_cache[variant_id] = (
+            map_updated_at,
+            _load_map(variant_id),
+        )
+    return cached[1]
+
+
+def get_turn_data(turn):
+    """
+    Serialize the given turn into the format the `adjudicator` expects.
+
+    Args:
+        * `turn` - `Turn`
+
+    Returns:
+        * `dict` - identical to `TurnSerializer(turn).data`.
+    """
+    variant_id, variant_name, map_updated_at = models.Game.objects \
+        .values_list('variant_id', 'variant__name', 'variant__map_updated_at') \
+        .get(id=turn.game_id)
+    territory_map = _get_map(variant_id, map_updated_at)
+
+    orders = [
+        {
+            'id': o['id'],
+            'type': o['type'],
+            'nation': o['nation_id'],
+            'source': o['source_id'],
+            'target': o['target_id'],
+            'target_coast': o['target_coast_id'],
+            'aux': o['aux_id'],
+            'piece_type': o['piece_type'],
+            'via_convoy': o['via_convoy'],
+        }
+        for o in turn.orders.order_by('id').values(
+            'id', 'type', 'nation_id', 'source_id', 'target_id',
+            'target_coast_id', 'aux_id', 'piece_type', 'via_convoy',
+        )
+    ]
+    pieces = [
+        {
+            'id': p['id'],
+            'retreating': p['must_retreat'],
+            'attacker_territory': p['attacker_territory_id'],
+            'territory': p['territory_id'],
+            'named_coast': p['named_coast_id'],
+            'type': p['piece__type'],
+            'nation': p['piece__nation_id'],
+        }
+        for p in turn.piecestates.order_by('id').values(
+            'id', 'must_retreat', 'attacker_territory_id', 'territory_id',
+            'named_coast_id', 'piece__type', 'piece__nation_id',
+        )
+    ]
+    territories = []
+    named_coasts = []
+    territory_states = turn.territorystates.order_by('id').values_list(
+        'contested', 'controlled_by_id', 'territory_id',
+    )
+    for contested, controlled_by_id, territory_id in territory_states:
+        territory, territory_named_coasts = territory_map[territory_id]
+        # Cached lists are copied so the cache can't be modified by callers.
+        territories.append({
+            'contested': contested,
+            'controlled_by': controlled_by_id,
+            **territory,
+            'neighbours': list(territory['neighbours']),
+            'shared_coasts': list(territory['shared_coasts']),
+        })
+        named_coasts.extend(
+            {**n, 'neighbours': list(n['neighbours'])}
+            for n in territory_named_coasts
+        )
+    nations = [
+        {'id': id, 'name': name}
+        for id, name in turn.nationstates.order_by('id')
+        .values_list('nation_id', 'nation__name')
+    ]
+    return {
+        'id': turn.id,
+        'orders': orders,
+        'phase': turn.phase,
+        'pieces': pieces,
+        'season': turn.season,
+        'territories': territories,
+        'nations': nations,
+        'variant': variant_name,
+        'year': turn.year,
+        'named_coasts': named_coasts,
+    }
@@ -163,3 +163,28 @@ FIXTURE_DIRS = (
 # FIXTURE_DIRS = (
 #     'fixtures',
 # )
+
+# Turns whose deadline has passed are found and enqueued for processing by a
+# periodic task. Requires `celery beat` to be running.
+CELERY_BEAT_SCHEDULE = {
+    'process-due-turn-ends': {
+        'task': 'core.tasks.process_due_turn_ends',
+        'schedule': 60.0,
+    },
+}
+
+# Turns are adjudicated with a `Tracer` when set. The trace of each turn which
+# takes at least this many seconds to adjudicate is saved to `Turn.trace`.
+SLOW_TURN_TRACE_SECONDS = None
+
+# A turn which is still marked as processing this many seconds after it was
+# claimed is assumed to have been lost, e.g. because its task was lost or its
+# worker died, and can be claimed again. Must be longer than a turn takes to
+# process, including the retries of `core.tasks.process_turn`.
+TURN_PROCESSING_TIMEOUT = 60 * 60
+
+# A turn which has failed to process this many times is no longer claimed, so
+# that a turn which always fails does not use up the workers. Each
+# `core.tasks.process_turn` task makes up to 6 attempts. Reset
+# `Turn.processing_attempts` to process the turn again.
+TURN_PROCESSING_MAX_ATTEMPTS = 18
@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class ServiceConfig(AppConfig):
     name = 'service'
+
+    def ready(self):
+        from . import signals  # noqa
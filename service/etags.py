@@ -0,0 +1,111 @@
+"""
+Version markers used to build the ETags of the service views. Each function
+returns cheap aggregates which change whenever the response of the view can
+change, so that an unchanged response can be answered with `304 Not
+Modified` without running the serializers. See `ConditionalGet`.
+"""
+from django.db.models import Count, Max, Q
+
+from core import models
+from core.models.base import DrawStatus
+
+
+def _markers(queryset, **aggregates):
+    return tuple(sorted(queryset.aggregate(**aggregates).items()))
+
+
+def _count_and_last(queryset):
+    return _markers(queryset, count=Count('id'), last=Max('id'))
+
+
+def _draw_markers(draws):
+    return _markers(
+        draws,
+        count=Count('id'),
+        proposed=Count('id', filter=Q(status=DrawStatus.PROPOSED)),
+        last_resolved_at=Max('resolved_at'),
+    )
+
+
+def _surrender_markers(surrenders):
+    return _markers(
+        surrenders,
+        count=Count('id'),
+        last_created_at=Max('created_at'),
+        last_resolved_at=Max('resolved_at'),
+    )
+
+
+def game_state_markers(slug):
+    """
+    Markers for the output of `GameStateSerializer`, or `None` if the game
+    does not exist.
+    """
+    game = models.Game.objects.filter(slug=slug) \
+        .values_list('id', 'name', 'description', 'status') \
+        .first()
+    if game is None:
+        return None
+    game_id = game[0]
+    return (
+        game,
+        _markers(
+            models.Turn.objects.filter(game=game_id),
+            count=Count('id'),
+            last=Max('id'),
+            last_processed_at=Max('processed_at'),
+            processing=Count('id', filter=Q(processing=True)),
+        ),
+        _count_and_last(models.Order.objects.filter(turn__game=game_id)),
+        _markers(
+            models.NationState.objects.filter(turn__game=game_id),
+            finalized=Count('id', filter=Q(orders_finalized=True)),
+        ),
+        _draw_markers(models.Draw.objects.filter(turn__game=game_id)),
+        _markers(
+            models.DrawResponse.objects.filter(draw__turn__game=game_id),
+            count=Count('id'),
+            last_updated_at=Max('updated_at'),
+        ),
+        _surrender_markers(
+            models.Surrender.objects.filter(nation_state__turn__game=game_id)
+        ),
+        _count_and_last(models.Participation.objects.filter(game=game_id)),
+    )
+
+
+def list_games_markers():
+    """
+    Markers for the output of `ListGamesSerializer` for every game.
+    """
+    return (
+        _markers(
+            models.Game.objects.all(),
+            count=Count('id'),
+            last=Max('id'),
+            last_updated_at=Max('updated_at'),
+        ),
+        _count_and_last(models.Participation.objects.all()),
+        _count_and_last(models.Turn.objects.all()),
+        _markers(
+            models.TurnEnd.objects.all(),
+            count=Count('id'),
+            last=Max('id'),
+            last_datetime=Max('datetime'),
+        ),
+        _draw_markers(models.Draw.objects.all()),
+        _surrender_markers(models.Surrender.objects.all()),
+    )
+
+
+def list_variants_markers():
+    """
+    Markers for the output of `ListVariantsSerializer`. Variants are only
+    changed when the map data is loaded so these rarely change.
+    """
+    return (
+        _count_and_last(models.Variant.objects.all()),
+        _count_and_last(models.Territory.objects.all()),
+        _count_and_last(models.NamedCoast.objects.all()),
+        _count_and_last(models.Nation.objects.all()),
+    )
@@ -1,3 +1,8 @@
+import hashlib
+
+from django.utils.cache import get_conditional_response, \
+    patch_cache_control, patch_vary_headers
+from django.utils.http import quote_etag
 from rest_framework import renderers
 
 from .renderers import CamelCaseRenderer
@@ -14,3 +19,54 @@ class FromCamelCase:
 
 class CamelCase(FromCamelCase, ToCamelCase):
     pass
+
+
+class ConditionalGet:
+    """
+    Answer `GET` requests with `304 Not Modified` when the `If-None-Match`
+    header matches the current ETag, without running the serializers.
+
+    The ETag is derived from the version markers returned by
+    `get_etag_markers`, the path and query string of the request and the
+    accepted renderer. Responses must be revalidated unless
+    `cache_max_age` is set.
+    """
+    cache_max_age = None
+
+    def get_etag_markers(self):
+        """
+        Return markers which change whenever the response can change, or
+        `None` if the response should not have an ETag.
+        """
+        raise NotImplementedError
+
+    def get_etag(self):
+        markers = self.get_etag_markers()
+        if markers is None:
+            return None
+        key = repr((
+            self.request.get_full_path(),
+            self.request.accepted_renderer.format,
+            markers,
+        ))
+        return quote_etag(hashlib.sha1(key.encode()).hexdigest())
+
+    def get(self, request, *args, **kwargs):
+        etag = self.get_etag()
+        response = None
+        if etag:
+            response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = super().get(request, *args, **kwargs)
+        if etag and response.status_code in (200, 304):
+            response['ETag'] = etag
+            if self.cache_max_age is None:
+                patch_cache_control(response, private=True, no_cache=True)
+            else:
+                patch_cache_control(
+                    response,
+                    private=True,
+                    max_age=self.cache_max_age,
+                )
+            patch_vary_headers(response, ['Accept', 'Authorization'])
+        return response
@@ -1,9 +1,52 @@
+import re
+from functools import partial
+
 from rest_framework import renderers
+from rest_framework.utils import encoders
 
 from service.utils.cases import deep_camel_case_transform
 
 
+RAW_JSON_PLACEHOLDER = '\x00raw-json:'
+raw_json_placeholder_pattern = re.compile(rb'"\\u0000raw-json:(\d+)"')
+
+
+class RawJSON:
+    """
+    Content which has already been rendered by `CamelCaseRenderer`. It is
+    inserted into the rendered output without being serialized again.
+    """
+
+    def __init__(self, content):
+        self.content = bytes(content)
+
+
+class RawJSONEncoder(encoders.JSONEncoder):
+    """
+    Encodes each `RawJSON` object as a placeholder and collects its content
+    into `raw` so that the placeholders can be replaced after encoding.
+    """
+
+    def __init__(self, *args, raw, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.raw = raw
+
+    def default(self, obj):
+        if isinstance(obj, RawJSON):
+            self.raw.append(obj.content)
+            return RAW_JSON_PLACEHOLDER + str(len(self.raw) - 1)
+        return super().default(obj)
+
+
 class CamelCaseRenderer(renderers.JSONRenderer):
     def render(self, data, *args, **kwargs):
         camelized_data = deep_camel_case_transform(data)
-        return super().render(camelized_data, *args, **kwargs)
+        raw = []
+        self.encoder_class = partial(RawJSONEncoder, raw=raw)
+        content = super().render(camelized_data, *args, **kwargs)
+        if not raw:
+            return content
+        return raw_json_placeholder_pattern.sub(
+            lambda match: raw[int(match.group(1))],
+            content,
+        )
@@ -1,13 +1,23 @@
+import json
+from bisect import bisect_left
+
 from django.contrib.auth.models import User
 from django.utils import timezone
 from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
 from rest_framework.validators import UniqueTogetherValidator
 
 from core import models
-from core.game import process_turn
 from core.models.base import DrawStatus, OrderType, Phase, SurrenderStatus
 
 from . import validators as custom_validators
+from .renderers import CamelCaseRenderer, RawJSON
+from .utils.cases import deep_camel_case_transform
+
+
+# Version of the rendered turns stored as `TurnSnapshot` instances. Bump the
+# version whenever the output of `TurnSerializer` changes.
+TURN_SNAPSHOT_VERSION = 3
 
 
 def get_nation_state_from_draw(data):
@@ -206,6 +216,9 @@ class NationSerializer(serializers.ModelSerializer):
 
 class PublicNationStateSerializer(serializers.ModelSerializer):
 
+    # Fields which are only shown to the user controlling the nation.
+    private_fields = ('orders_finalized', 'num_orders_remaining')
+
     orders_finalized = serializers.SerializerMethodField()
     num_orders_remaining = serializers.SerializerMethodField()
     num_supply_centers = serializers.SerializerMethodField()
@@ -230,22 +243,23 @@ class PublicNationStateSerializer(serializers.ModelSerializer):
         )
 
     def get_num_supply_centers(self, nation_state):
-        return nation_state.supply_centers.count()
+        return nation_state.num_supply_centers
 
-    def get_orders_finalized(self, nation_state):
+    def can_view_private_fields(self, nation_state):
+        """
+        Private fields are only shown to the user controlling the nation.
+        """
         request = self.context.get('request')
-        if request:
-            user = request.user
-            if user.id == nation_state.user.id:
-                return nation_state.orders_finalized
+        return bool(request) and request.user.id == nation_state.user_id
+
+    def get_orders_finalized(self, nation_state):
+        if self.can_view_private_fields(nation_state):
+            return nation_state.orders_finalized
         return None
 
     def get_num_orders_remaining(self, nation_state):
-        request = self.context.get('request')
-        if request:
-            user = request.user
-            if user.id == nation_state.user.id:
-                return nation_state.num_orders_remaining
+        if self.can_view_private_fields(nation_state):
+            return nation_state.num_orders_remaining
         return None
 
     def update(self, instance, validated_data):
@@ -261,14 +275,25 @@ class PublicNationStateSerializer(serializers.ModelSerializer):
 
 class ToggleFinalizeOrdersSerializer(PublicNationStateSerializer):
 
+    turn_status = serializers.CharField(source='turn.status', read_only=True)
+
+    class Meta(PublicNationStateSerializer.Meta):
+        fields = (*PublicNationStateSerializer.Meta.fields, 'turn_status')
+
     def update(self, instance, validated_data):
         """
-        Set nation's `orders_finalized` field. Process game if turn is ready.
+        Set nation's `orders_finalized` field. Enqueue the turn to be processed
+        if the turn is ready.
         """
+        turn = instance.turn
+        if turn.processing and not turn.processing_stalled:
+            raise serializers.ValidationError(
+                'Turn is already being processed.'
+            )
         instance.orders_finalized = not(instance.orders_finalized)
         instance.save()
         if instance.turn.ready_to_process:
-            process_turn(instance.turn)
+            instance.turn.enqueue_processing()
         return instance
 
 
@@ -434,7 +459,7 @@ class TurnSerializer(serializers.ModelSerializer):
 
     territory_states = TerritoryStateSerializer(many=True, source='territorystates')
     piece_states = PieceStateSerializer(many=True, source='piecestates')
-    nation_states = PublicNationStateSerializer(many=True, source='nationstates')
+    nation_states = serializers.SerializerMethodField()
     orders = serializers.SerializerMethodField()
     phase = serializers.CharField(source='get_phase_display')
     next_turn = serializers.SerializerMethodField()
@@ -448,6 +473,7 @@ class TurnSerializer(serializers.ModelSerializer):
             'next_turn',
             'previous_turn',
             'current_turn',
+            'status',
             'year',
             'season',
             'phase',
@@ -459,13 +485,29 @@ class TurnSerializer(serializers.ModelSerializer):
         )
 
     def get_next_turn(self, obj):
+        turn_ids = self.context.get('turn_ids')
+        if turn_ids is not None:
+            index = bisect_left(turn_ids, obj.id) + 1
+            return turn_ids[index] if index < len(turn_ids) else None
         turn = models.Turn.get_next(obj)
         return getattr(turn, 'id', None)
 
     def get_previous_turn(self, obj):
+        turn_ids = self.context.get('turn_ids')
+        if turn_ids is not None:
+            index = bisect_left(turn_ids, obj.id)
+            return turn_ids[index - 1] if index > 0 else None
         turn = models.Turn.get_previous(obj)
         return getattr(turn, 'id', None)
 
+    def get_nation_states(self, obj):
+        serializer = PublicNationStateSerializer(
+            instance=obj.nationstates.with_metrics(),
+            many=True,
+            context=self.context,
+        )
+        return serializer.data
+
     def get_orders(self, obj):
         # Only get orders for previous turns
         qs = models.Order.objects.filter(
@@ -570,6 +612,12 @@ class ListGamesSerializer(serializers.ModelSerializer):
         )
 
     def get_current_turn(self, game):
+        # Use the current turn prefetched by `ListGames` when available.
+        current_turns = getattr(game, 'current_turns', None)
+        if current_turns is not None:
+            if not current_turns:
+                return None
+            return ListTurnSerializer(current_turns[0]).data
         try:
             current_turn = game.get_current_turn()
             return ListTurnSerializer(current_turn).data
@@ -643,7 +691,7 @@ class GameStateSerializer(serializers.ModelSerializer):
 
     participants = UserSerializer(many=True, read_only=True)
     pieces = PieceSerializer(many=True)
-    turns = TurnSerializer(many=True)
+    turns = serializers.SerializerMethodField()
 
     class Meta:
         model = models.Game
@@ -658,3 +706,96 @@ class GameStateSerializer(serializers.ModelSerializer):
             'status',
             'participants',
         )
+
+    def get_turns(self, game):
+        """
+        Serialize the turns of the game. If `since_turn` is in the context
+        only the turns after that turn are serialized.
+
+        Processed turns are sent as the `RawJSON` content of their
+        `TurnSnapshot`. A snapshot is created for any processed turn which
+        does not yet have one once the next turn has been created. Snapshots
+        are shared by every user so the private fields of the nation states
+        are left out of them and the requesting user's own private fields are
+        added back in.
+        """
+        turn_ids = list(
+            game.turns.order_by('id').values_list('id', flat=True)
+        )
+        turns = game.turns.order_by('id')
+        since_turn = self.context.get('since_turn')
+        if since_turn is not None:
+            turns = turns.filter(id__gt=since_turn)
+        rows = list(turns.values_list('id', 'processed'))
+        context = {**self.context, 'turn_ids': turn_ids}
+
+        snapshot_ids = {
+            id for id, processed in rows
+            if processed and id != turn_ids[-1]
+        }
+        snapshots = models.TurnSnapshot.objects \
+            .filter(turn__in=snapshot_ids, version=TURN_SNAPSHOT_VERSION) \
+            .values_list('turn_id', 'content')
+        data = {id: RawJSON(content) for id, content in snapshots}
+        for turn in turns.exclude(id__in=list(data)):
+            if turn.id in snapshot_ids:
+                data[turn.id] = RawJSON(save_turn_snapshot(turn, context))
+            else:
+                data[turn.id] = TurnSerializer(turn, context=context).data
+        request = self.context.get('request')
+        if snapshot_ids and request and request.user.is_authenticated:
+            nation_states = models.NationState.objects \
+                .filter(turn__in=snapshot_ids, user=request.user) \
+                .select_related('turn') \
+                .with_metrics()
+            for nation_state in nation_states:
+                data[nation_state.turn_id] = add_private_fields(
+                    data[nation_state.turn_id],
+                    nation_state,
+                )
+        return [data[id] for id, _ in rows]
+
+
+def add_private_fields(snapshot, nation_state):
+    """
+    Add the private fields of a nation state to the snapshot of its turn.
+
+    Args:
+        * `snapshot` - `RawJSON` - the snapshot of the nation state's turn.
+        * `nation_state` - `NationState`
+
+    Returns:
+        * `RawJSON`
+    """
+    data = json.loads(snapshot.content)
+    private = deep_camel_case_transform({
+        field: getattr(nation_state, field)
+        for field in PublicNationStateSerializer.private_fields
+    })
+    for item in data['nationStates']:
+        if item['id'] == nation_state.id:
+            item.update(private)
+    return RawJSON(JSONRenderer().render(data))
+
+
+def save_turn_snapshot(turn, context=None):
+    """
+    Render a processed turn and store the content as the turn's
+    `TurnSnapshot`, replacing any existing snapshot. The turn is rendered
+    without the request so that no user's private fields are stored.
+
+    Args:
+        * `turn` - `Turn`
+        * `context` - `dict` - serializer context.
+
+    Returns:
+        * `bytes` - the rendered turn.
+    """
+    context = {k: v for k, v in (context or {}).items() if k != 'request'}
+    data = TurnSerializer(turn, context=context).data
+    content = CamelCaseRenderer().render(data)
+    models.TurnSnapshot.objects.update_or_create(
+        turn=turn,
+        defaults={'version': TURN_SNAPSHOT_VERSION, 'content': content},
+    )
+    return content
@@ -0,0 +1,32 @@
+import logging
+
+from django.db import transaction
+from django.dispatch import receiver
+
+from core import models
+from core.signals import turn_processed
+from service.serializers import save_turn_snapshot
+
+
+logger = logging.getLogger(__name__)
+
+
+@receiver(turn_processed)
+def create_turn_snapshot(sender, turn, **kwargs):
+    """
+    Store the rendered turn once the transaction which processed it has
+    been committed, so that a failure to render the turn does not undo the
+    processing. A turn without a snapshot is rendered and stored when it is
+    next requested instead, see `GameStateSerializer.get_turns`.
+    """
+    turn_id = turn.id
+
+    def save():
+        try:
+            # The turn is fetched again because the in-memory instance is
+            # not updated when the next turn is created.
+            save_turn_snapshot(models.Turn.objects.get(id=turn_id))
+        except Exception:
+            logger.exception('Failed to store snapshot of turn %s.', turn_id)
+
+    transaction.on_commit(save)
@@ -0,0 +1,46 @@
+from django.test import TestCase
+
+from service.utils.cases import KEY_CACHE_SIZE, deep_camel_case_transform, \
+    deep_snake_case_transform, to_camel_case, to_snake_case
+
+
+class TestCaseTransform(TestCase):
+
+    def test_nested_data(self):
+        data = {
+            'piece_states': [{'must_retreat': True}, 1, None],
+            'nation_state': {'supply_delta': [[{'num_builds': 1}], [2]]},
+            'no_value': None,
+        }
+        camel_case_data = {
+            'pieceStates': [{'mustRetreat': True}, 1, None],
+            'nationState': {'supplyDelta': [[{'numBuilds': 1}], [2]]},
+            'noValue': None,
+        }
+        self.assertEqual(deep_camel_case_transform(data), camel_case_data)
+        self.assertEqual(deep_snake_case_transform(camel_case_data), data)
+
+    def test_top_level_values(self):
+        self.assertIsNone(deep_camel_case_transform(None))
+        self.assertEqual(
+            deep_camel_case_transform([[{'a_b': 1}]]),
+            [[{'aB': 1}]],
+        )
+
+    def test_data_is_not_modified(self):
+        data = {'piece_states': [{'must_retreat': True}]}
+        deep_camel_case_transform(data)
+        self.assertEqual(data, {'piece_states': [{'must_retreat': True}]})
+
+    def test_deeply_nested_data(self):
+        data = {}
+        for _ in range(5000):
+            data = {'next_turn': data}
+        transformed_data = deep_camel_case_transform(data)
+        for _ in range(5000):
+            transformed_data = transformed_data['nextTurn']
+        self.assertEqual(transformed_data, {})
+
+    def test_key_cache_is_bounded(self):
+        self.assertEqual(to_camel_case.cache_info().maxsize, KEY_CACHE_SIZE)
+        self.assertEqual(to_snake_case.cache_info().maxsize, KEY_CACHE_SIZE)
@@ -1,21 +1,24 @@
+import json
+from datetime import timedelta
 from unittest import mock
 from unittest.mock import patch
 
+from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APITestCase
 
 from core import factories, models
-from core.tests import DiplomacyTestCaseMixin
+from core.tests import DiplomacyTestCaseMixin, apply_async_path
 from core.models.base import (
     DrawStatus, DrawResponse, GameStatus, OrderType, Phase, PieceType, Season,
-    SurrenderStatus
+    SurrenderStatus, TurnStatus
 )
 from service import validators
-
-
-serializer_process_turn_path = 'service.serializers.process_turn'
+from service.serializers import TURN_SNAPSHOT_VERSION
 
 
 def set_processed(self, processed_at=None):
@@ -41,6 +44,125 @@ class TestGetGames(APITestCase):
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
+    def create_game(self, variant, nations):
+        game = models.Game.objects.create(
+            variant=variant,
+            name='Test game',
+            status=GameStatus.ACTIVE,
+            num_players=len(nations),
+            created_by=factories.UserFactory(),
+        )
+        turn = models.Turn.objects.create(
+            game=game,
+            year=1901,
+            phase=Phase.ORDER,
+            season=Season.SPRING,
+        )
+        models.TurnEnd.objects.create(turn=turn, datetime=timezone.now())
+        for nation in nations:
+            user = factories.UserFactory()
+            game.participants.add(user)
+            nation_state = models.NationState.objects.create(
+                nation=nation,
+                turn=turn,
+                user=user,
+            )
+            models.Surrender.objects.create(
+                user=user,
+                nation_state=nation_state,
+            )
+        return game
+
+    def test_get_games_num_queries_does_not_depend_on_page_size(self):
+        variant = models.Variant.objects.create(name='test')
+        nations = [
+            models.Nation.objects.create(variant=variant, name=name)
+            for name in ['England', 'France']
+        ]
+        for _ in range(5):
+            self.create_game(variant, nations)
+        url = reverse('list-games')
+
+        num_queries = []
+        for page_size in [1, 5]:
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get(url, {'page_size': page_size})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(len(response.data['results']), page_size)
+            num_queries.append(len(context.captured_queries))
+        self.assertEqual(num_queries[0], num_queries[1])
+
+        game = response.data['results'][0]
+        self.assertEqual(len(game['participants']), 2)
+        self.assertEqual(len(game['current_turn']['nation_states']), 2)
+        self.assertIsNotNone(game['current_turn']['turn_end'])
+
+    def test_get_games_cursor_pagination(self):
+        variant = models.Variant.objects.create(name='test')
+        games = [self.create_game(variant, []) for _ in range(3)]
+        for i, game in enumerate(games):
+            models.Game.objects.filter(id=game.id).update(
+                created_at=timezone.now() + timedelta(minutes=i)
+            )
+        url = reverse('list-games')
+        response = self.client.get(url, {'page_size': 2})
+        self.assertEqual(
+            [g['id'] for g in response.data['results']],
+            [games[2].id, games[1].id],
+        )
+        response = self.client.get(response.data['next'])
+        self.assertEqual(
+            [g['id'] for g in response.data['results']],
+            [games[0].id],
+        )
+        self.assertIsNone(response.data['next'])
+
+    def test_get_games_not_modified(self):
+        variant = models.Variant.objects.create(name='test')
+        self.create_game(variant, [])
+        url = reverse('list-games')
+        response = self.client.get(url)
+        etag = response['ETag']
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.create_game(variant, [])
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 2)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_get_games_modified_when_game_edited(self):
+        variant = models.Variant.objects.create(name='test')
+        game = self.create_game(variant, [])
+        url = reverse('list-games')
+        etag = self.client.get(url)['ETag']
+        game.description = 'Edited'
+        game.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'][0]['description'], 'Edited')
+        self.assertNotEqual(response['ETag'], etag)
+
+
+class TestListVariants(APITestCase):
+
+    def setUp(self):
+        self.client.force_authenticate(user=factories.UserFactory())
+        self.variant = models.Variant.objects.create(name='test')
+        self.url = reverse('list-variants')
+
+    def test_list_variants_cacheable(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('max-age=3600', response['Cache-Control'])
+        etag = response['ETag']
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+        models.Nation.objects.create(variant=self.variant, name='France')
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
 
 class TestGetCreateGame(APITestCase):
 
@@ -264,6 +386,147 @@ class TestGetGameState(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertFalse(response.data['turns'][0]['orders'])
 
+    def create_next_turn(self):
+        set_processed(self.turn)
+        new_turn = models.Turn.objects.create(
+            game=self.game,
+            year=1901,
+            phase=Phase.ORDER,
+            season=Season.FALL,
+        )
+        self.nation_state.pk = None
+        self.nation_state.turn = new_turn
+        self.nation_state.save()
+        return new_turn
+
+    def test_get_game_state_since_turn(self):
+        new_turn = self.create_next_turn()
+        response = self.client.get(
+            self.url, {'since_turn': self.turn.id}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [t['id'] for t in response.data['turns']],
+            [new_turn.id],
+        )
+        self.assertEqual(response.data['turns'][0]['previous_turn'], self.turn.id)
+
+    def test_get_game_state_not_modified(self):
+        response = self.client.get(self.url, format='json')
+        etag = response['ETag']
+        self.assertIn('no-cache', response['Cache-Control'])
+        with patch(
+            'service.serializers.GameStateSerializer.to_representation'
+        ) as to_representation:
+            response = self.client.get(
+                self.url, format='json', HTTP_IF_NONE_MATCH=etag,
+            )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertFalse(response.content)
+        to_representation.assert_not_called()
+
+    def test_get_game_state_modified(self):
+        etags = set()
+        response = self.client.get(self.url, format='json')
+        etags.add(response['ETag'])
+        models.Order.objects.create(
+            turn=self.turn,
+            source=self.territory,
+            nation=self.nation,
+        )
+        etags.add(self.client.get(self.url, format='json')['ETag'])
+        self.nation_state.orders_finalized = True
+        self.nation_state.save()
+        etags.add(self.client.get(self.url, format='json')['ETag'])
+        models.Surrender.objects.create(
+            user=self.user,
+            nation_state=self.nation_state,
+        )
+        etags.add(self.client.get(self.url, format='json')['ETag'])
+        self.create_next_turn()
+        response = self.client.get(
+            self.url, format='json', HTTP_IF_NONE_MATCH=response['ETag'],
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etags.add(response['ETag'])
+        self.assertEqual(len(etags), 5)
+
+    def test_get_game_state_etag_depends_on_user_and_query(self):
+        response = self.client.get(self.url, format='json')
+        since_turn_response = self.client.get(
+            self.url, {'since_turn': self.turn.id}, format='json'
+        )
+        self.client.force_authenticate(user=factories.UserFactory())
+        other_user_response = self.client.get(self.url, format='json')
+        self.assertEqual(
+            len({
+                response['ETag'],
+                since_turn_response['ETag'],
+                other_user_response['ETag'],
+            }),
+            3,
+        )
+
+    def test_get_game_state_since_turn_invalid(self):
+        response = self.client.get(
+            self.url, {'since_turn': 'first'}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_get_game_state_processed_turn_snapshot(self):
+        self.create_next_turn()
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url, format='json')
+        self.assertTrue(
+            models.TurnSnapshot.objects.filter(turn=self.turn).exists()
+        )
+        with CaptureQueriesContext(connection) as snapshot_context:
+            snapshot_response = self.client.get(self.url, format='json')
+        self.assertEqual(snapshot_response.content, response.content)
+        self.assertLess(
+            len(snapshot_context.captured_queries),
+            len(context.captured_queries),
+        )
+        turn = json.loads(snapshot_response.content)['turns'][0]
+        self.assertEqual(turn['id'], self.turn.id)
+        self.assertFalse(turn['currentTurn'])
+        # Private fields are left out of the snapshot, which every user
+        # shares.
+        snapshot = models.TurnSnapshot.objects.get(turn=self.turn)
+        nation_state = json.loads(snapshot.content)['nationStates'][0]
+        self.assertIsNone(nation_state['ordersFinalized'])
+        self.assertIsNone(nation_state['numOrdersRemaining'])
+
+    def test_get_game_state_processed_turn_snapshot_private_fields(self):
+        models.NationState.objects.filter(id=self.nation_state.id) \
+            .update(orders_finalized=True)
+        self.create_next_turn()
+        for _ in range(2):
+            # Once to create the snapshot and once to read it.
+            response = self.client.get(self.url, format='json')
+            turn = json.loads(response.content)['turns'][0]
+            self.assertEqual(turn['id'], self.turn.id)
+            self.assertTrue(turn['nationStates'][0]['ordersFinalized'])
+            self.assertEqual(turn['nationStates'][0]['numOrdersRemaining'], 1)
+        self.client.force_authenticate(user=factories.UserFactory())
+        response = self.client.get(self.url, format='json')
+        turn = json.loads(response.content)['turns'][0]
+        self.assertIsNone(turn['nationStates'][0]['ordersFinalized'])
+        self.assertIsNone(turn['nationStates'][0]['numOrdersRemaining'])
+
+    def test_get_game_state_ignores_old_snapshot_version(self):
+        self.create_next_turn()
+        models.TurnSnapshot.objects.create(
+            turn=self.turn,
+            version=0,
+            content=b'{}',
+        )
+        response = self.client.get(self.url, format='json')
+        turn = json.loads(response.content)['turns'][0]
+        self.assertEqual(turn['id'], self.turn.id)
+        snapshot = models.TurnSnapshot.objects.get(turn=self.turn)
+        self.assertEqual(snapshot.version, TURN_SNAPSHOT_VERSION)
+
 
 class TestListOrders(APITestCase):
     def setUp(self):
@@ -828,7 +1091,7 @@ class TestFinalizeOrders(APITestCase):
 
     def test_can_finalize_orders_with_no_orders(self):
         self.client.force_authenticate(user=self.user)
-        with mock.patch(serializer_process_turn_path, set_processed):
+        with mock.patch(apply_async_path):
             response = self.client.put(self.url, self.data, format='json')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.nation_state.refresh_from_db()
@@ -841,7 +1104,7 @@ class TestFinalizeOrders(APITestCase):
             nation=self.nation_state.nation,
             source=self.territory
         )
-        with mock.patch(serializer_process_turn_path, set_processed):
+        with mock.patch(apply_async_path):
             response = self.client.put(self.url, self.data, format='json')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.nation_state.refresh_from_db()
@@ -851,7 +1114,38 @@ class TestFinalizeOrders(APITestCase):
         self.client.force_authenticate(user=self.user)
         turn = self.game.get_current_turn()
         turn.nationstates.set([self.nation_state])
-        with mock.patch(serializer_process_turn_path, set_processed):
+        with mock.patch(apply_async_path) as apply_async, \
+                self.captureOnCommitCallbacks(execute=True):
+            response = self.client.put(self.url, self.data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['turn_status'], TurnStatus.PROCESSING)
+        self.nation_state.refresh_from_db()
+        self.assertTrue(self.nation_state.orders_finalized)
+        turn.refresh_from_db()
+        self.assertTrue(turn.processing)
+        apply_async.assert_called_once()
+        self.assertEqual(
+            apply_async.call_args[1]['task_id'],
+            turn.processing_task_id,
+        )
+
+    def test_cannot_toggle_finalize_while_processing(self):
+        self.client.force_authenticate(user=self.user)
+        models.Turn.objects.filter(id=self.nation_state.turn_id) \
+            .update(processing=True)
+        response = self.client.put(self.url, self.data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.nation_state.refresh_from_db()
+        self.assertFalse(self.nation_state.orders_finalized)
+
+    def test_can_toggle_finalize_when_processing_stalled(self):
+        self.client.force_authenticate(user=self.user)
+        claimed_at = timezone.now() - timezone.timedelta(
+            seconds=settings.TURN_PROCESSING_TIMEOUT + 1
+        )
+        models.Turn.objects.filter(id=self.nation_state.turn_id) \
+            .update(processing=True, processing_started_at=claimed_at)
+        with mock.patch(apply_async_path):
             response = self.client.put(self.url, self.data, format='json')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.nation_state.refresh_from_db()
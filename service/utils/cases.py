@@ -1,6 +1,15 @@
 import re
+from functools import lru_cache
 
 
+# The number of translated keys remembered by each case function. Payloads
+# repeat a small set of field names many times, so a small cache is enough.
+KEY_CACHE_SIZE = 1024
+
+snake_case_pattern = re.compile('([A-Z])([a-z0-9]+)')
+
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
 def to_camel_case(snake_case_str):
     """
     Transforms snake_case to camelCase
@@ -11,47 +20,46 @@ def to_camel_case(snake_case_str):
     return f'{components[0]}{titled_components}'
 
 
+@lru_cache(maxsize=KEY_CACHE_SIZE)
 def to_snake_case(camel_case_str: str) -> str:
     """
     Transforms camelCase to snake_case
     """
-    return re.sub('([A-Z])([a-z0-9]+)', r'_\1\2', camel_case_str).lower()
+    return snake_case_pattern.sub(r'_\1\2', camel_case_str).lower()
 
 
 def deep_case_transform(data, to_case_func):
-    transformed_data = {}
-
-    if data is None:
-        return
-
-    if isinstance(data, list):
-        new_data = []
-        for obj in data:
-            if isinstance(obj, dict):
-                new_data.append(deep_case_transform(obj, to_case_func))
-            else:
-                new_data.append(obj)
-
-        return new_data
+    """
+    Copy nested dicts and lists, transforming every dict key with
+    `to_case_func`. Lists of lists are transformed too. Other values are
+    left as they are.
 
-    for key, value in data.items():
-        transformed_key = to_case_func(key)
-        if not isinstance(value, dict) and not isinstance(value, list):
-            transformed_data[transformed_key] = value
+    The data is walked with a stack rather than recursively so that deeply
+    nested data can't exceed the recursion limit.
+    """
+    if not isinstance(data, (dict, list)):
+        return data
 
-        if isinstance(value, list):
+    def copy(value):
+        # Empty containers are filled when they are popped off the stack.
+        if isinstance(value, dict):
+            new_value = {}
+        elif isinstance(value, list):
             new_value = []
-            for obj in value:
-                if isinstance(obj, dict):
-                    new_value.append(deep_case_transform(obj, to_case_func))
-                else:
-                    new_value.append(obj)
-
-            transformed_data[transformed_key] = new_value
-
+        else:
+            return value
+        stack.append((value, new_value))
+        return new_value
+
+    stack = []
+    transformed_data = copy(data)
+    while stack:
+        value, new_value = stack.pop()
         if isinstance(value, dict):
-            transformed_data[transformed_key] = deep_case_transform(value, to_case_func)
-
+            for key, item in value.items():
+                new_value[to_case_func(key)] = copy(item)
+        else:
+            new_value.extend([copy(item) for item in value])
     return transformed_data
 
 
@@ -1,13 +1,15 @@
+from django.db.models import Prefetch
 from django.shortcuts import get_object_or_404
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework import exceptions, filters, generics, status, views
+from rest_framework import exceptions, filters, generics, pagination, \
+    status, views
 from rest_framework.response import Response
 
 from core import models
 from core.models.base import DrawStatus, GameStatus, SurrenderStatus
-from service import serializers
+from service import etags, serializers
 from service.permissions import IsAuthenticated
-from service.mixins import CamelCase
+from service.mixins import CamelCase, ConditionalGet
 
 
 # NOTE this could possibly be replaced by using options
@@ -45,15 +47,43 @@ class BaseMixin:
         )
 
 
-class ListGames(CamelCase, generics.ListAPIView):
+class ListGamesPagination(pagination.CursorPagination):
+    ordering = '-created_at'
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+
+class ListGames(CamelCase, ConditionalGet, generics.ListAPIView):
 
     permission_classes = [IsAuthenticated]
+    # Everything `ListGamesSerializer` needs is fetched up front so that the
+    # number of queries does not depend on the number of games.
     queryset = (
         models.Game.objects.all()
         .select_related('variant')
+        .prefetch_related(
+            'participants',
+            Prefetch(
+                'turns',
+                queryset=models.Turn.objects
+                .filter(current_turn=True)
+                .select_related('turnend')
+                .prefetch_related(
+                    Prefetch(
+                        'nationstates',
+                        queryset=models.NationState.objects
+                        .select_related('user')
+                        .prefetch_related('surrenders'),
+                    ),
+                ),
+                to_attr='current_turns',
+            ),
+        )
         .order_by('-created_at')
     )
     serializer_class = serializers.ListGamesSerializer
+    pagination_class = ListGamesPagination
     filter_backends = [
         DjangoFilterBackend,
         filters.SearchFilter,
@@ -77,11 +107,19 @@ class ListGames(CamelCase, generics.ListAPIView):
         'initialized_at'
     ]
 
+    def get_etag_markers(self):
+        return etags.list_games_markers()
+
 
-class ListVariants(CamelCase, generics.ListAPIView):
+class ListVariants(CamelCase, ConditionalGet, generics.ListAPIView):
     permission_classes = [IsAuthenticated]
     queryset = models.Variant.objects.all()
     serializer_class = serializers.ListVariantsSerializer
+    # Variants only change when the map data is loaded.
+    cache_max_age = 60 * 60
+
+    def get_etag_markers(self):
+        return etags.list_variants_markers()
 
 
 class CreateGameView(CamelCase, generics.CreateAPIView):
@@ -95,13 +133,48 @@ class CreateGameView(CamelCase, generics.CreateAPIView):
         return super().create(request, *args, **kwargs)
 
 
-class GameStateView(CamelCase, BaseMixin, generics.RetrieveAPIView):
+class GameStateView(
+        CamelCase, ConditionalGet, BaseMixin, generics.RetrieveAPIView
+):
+    """
+    Get the state of a game. If the `since_turn` query parameter is given only
+    the turns after that turn are included. Turns which have not been
+    processed can still change, so clients should pass the id of the latest
+    processed turn that they have.
+
+    Clients polling the game should send the ETag of the last response in
+    the `If-None-Match` header. `304 Not Modified` is returned while the game
+    is unchanged.
+    """
 
     permission_classes = [IsAuthenticated]
     serializer_class = serializers.GameStateSerializer
     queryset = models.Game.objects.all()
     lookup_field = 'slug'
 
+    def get_etag_markers(self):
+        markers = etags.game_state_markers(self.kwargs['slug'])
+        if markers is None:
+            return None
+        # Private fields depend on the user.
+        return (
+            self.request.user.id,
+            serializers.TURN_SNAPSHOT_VERSION,
+            markers,
+        )
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        since_turn = self.request.query_params.get('since_turn')
+        if since_turn is not None:
+            try:
+                context['since_turn'] = int(since_turn)
+            except ValueError:
+                raise exceptions.ValidationError(
+                    {'since_turn': 'A valid integer is required.'}
+                )
+        return context
+
 
 class ToggleJoinGame(generics.UpdateAPIView):
     permission_classes = [IsAuthenticated]